@@ -8,3 +8,6 @@ class BooksConfig(AppConfig):
     def ready(self):
         import books.signals.book_cover
         import books.signals.book_image
+        import books.signals.book_rating
+        import books.signals.book_search
+        import books.signals.cache_invalidation
@@ -1,8 +1,16 @@
 from books.models import Book
-from django.db.models import Q
+from books.utils.search import is_search_vector_supported, search_books
+from django.db.models import Exists, OuterRef, Q
 from django_filters.rest_framework import CharFilter, FilterSet
 
 
+# @ Semi-join on an M2M through table: one row per book, so no fan-out and no DISTINCT
+def related_name_exists(relation, value):
+    through = Book._meta.get_field(relation).remote_field.through
+    target = Book._meta.get_field(relation).m2m_reverse_field_name()
+    return Exists(through.objects.filter(book_id=OuterRef("pk"), **{f"{target}__name__icontains": value}))
+
+
 class BookFilter(FilterSet):
     # @ ------------ search (free text) ------------
     search = CharFilter(method="global_search")
@@ -23,24 +31,29 @@ class BookFilter(FilterSet):
 
     # @ -------- search implementation --------
     def global_search(self, queryset, name, value):
+        # @ Ranked full-text search on PostgreSQL, icontains fallback elsewhere (e.g. SQLite)
+        if is_search_vector_supported(queryset.db):
+            return search_books(queryset, value)
+
         return queryset.filter(
             Q(name__icontains=value)
-            | Q(authors__name__icontains=value)
-            | Q(translators__name__icontains=value)
+            | related_name_exists("authors", value)
+            | related_name_exists("translators", value)
             | Q(publisher__name__icontains=value)
         )
 
     def filter_search(self, queryset, name, value):
+        # @ publisher is a foreign key, so joining it cannot multiply rows
         filters_map = {
-            "author": Q(authors__name__icontains=value),
-            "translator": Q(translators__name__icontains=value),
+            "author": related_name_exists("authors", value),
+            "translator": related_name_exists("translators", value),
             "publisher": Q(publisher__name__icontains=value),
-            "language": Q(languages__name__icontains=value),
-            "formats": Q(content_formats__name__icontains=value),
+            "language": related_name_exists("languages", value),
+            "formats": related_name_exists("content_formats", value),
         }
 
-        q_object = filters_map.get(name)
-        if not q_object:
+        condition = filters_map.get(name)
+        if condition is None:
             return queryset
 
-        return queryset.filter(q_object)
+        return queryset.filter(condition)
@@ -0,0 +1,120 @@
+import json
+import platform
+from datetime import datetime, timezone
+
+import django
+from books.models import Book, Comment, Favorite, Rating
+from books.utils.benchmarks import EndpointBenchmark, build_scenarios, scaled_sizes
+from books.utils.seeding import ScaleDataGenerator, flush_seeded_data
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure p50/p95 latency, query count, rows read (PostgreSQL only) and peak allocated memory for the "
+        "book endpoints, optionally reseeding the catalog at several sizes to get scaling curves."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            default="",
+            help="Comma-separated book counts (e.g. 1000,100000,1000000) to seed and benchmark in turn; "
+            "without it the current database is benchmarked as-is.",
+        )
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--warmup", type=int, default=2)
+        parser.add_argument(
+            "--warm-cache",
+            action="store_true",
+            help="Keep the response/count caches between requests instead of clearing them before each one.",
+        )
+        parser.add_argument("--only", default="", help="Only run scenarios whose name contains this text.")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--zipf-exponent", type=float, default=1.1)
+        parser.add_argument("--batch-size", type=int, default=10_000)
+        parser.add_argument(
+            "--flush",
+            action="store_true",
+            help="Allow --sizes to delete the existing catalog (and previously seeded users).",
+        )
+        parser.add_argument("--output", help="Write the results as JSON to this file.")
+
+    def handle(self, *args, **options):
+        try:
+            sizes = [int(size) for size in options["sizes"].split(",") if size.strip()]
+        except ValueError:
+            raise CommandError("--sizes must be a comma-separated list of book counts.")
+        if any(size < 1 for size in sizes) or options["iterations"] < 1 or options["warmup"] < 0:
+            raise CommandError("Sizes and --iterations must be positive, --warmup non-negative.")
+        if sizes and not options["flush"] and Book.objects.exists():
+            raise CommandError("The catalog is not empty; pass --flush to let --sizes replace it with seeded data.")
+
+        benchmark = EndpointBenchmark(
+            iterations=options["iterations"], warmup=options["warmup"], warm_cache=options["warm_cache"]
+        )
+        runs = []
+        for size in sizes or [None]:
+            if size is not None:
+                self.stdout.write(f"\nSeeding {size} books")
+                flush_seeded_data()
+                ScaleDataGenerator(
+                    scaled_sizes(size),
+                    seed=options["seed"],
+                    exponent=options["zipf_exponent"],
+                    batch_size=options["batch_size"],
+                    log=lambda line: self.stdout.write(f"  {line}"),
+                ).run()
+            runs.append(self.run_scenarios(benchmark, options["only"]))
+
+        report = {
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "environment": {
+                "database": connection.vendor,
+                "python": platform.python_version(),
+                "django": django.get_version(),
+            },
+            "options": {
+                "iterations": options["iterations"],
+                "warmup": options["warmup"],
+                "warm_cache": options["warm_cache"],
+                "seed": options["seed"],
+                "zipf_exponent": options["zipf_exponent"],
+            },
+            "runs": runs,
+        }
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as output:
+                json.dump(report, output, indent=2)
+            self.stdout.write(f"\nWrote {options['output']}")
+
+    def run_scenarios(self, benchmark, only):
+        counts = {
+            "books": Book.objects.count(),
+            "users": get_user_model().objects.count(),
+            "ratings": Rating.objects.count(),
+            "favorites": Favorite.objects.count(),
+            "comments": Comment.objects.count(),
+        }
+        scenarios = [scenario for scenario in build_scenarios(log=self.stderr.write) if only in scenario.name]
+        if not scenarios:
+            raise CommandError("Nothing to benchmark; seed some books first (or pass --sizes).")
+
+        self.stdout.write(
+            f"\n{counts['books']} books, {benchmark.iterations} requests per scenario ({connection.vendor})"
+        )
+        self.stdout.write(
+            f"  {'scenario':<44}{'status':>7}{'p50 ms':>10}{'p95 ms':>10}{'queries':>9}{'rows':>10}{'KiB':>9}"
+        )
+        results = []
+        for scenario in scenarios:
+            result = benchmark.measure(scenario)
+            results.append(result)
+            rows = "-" if result["rows_read"] is None else result["rows_read"]
+            self.stdout.write(
+                f"  {result['name']:<44}{result['status']:>7}{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}"
+                f"{result['queries']:>9}{rows:>10}{result['peak_memory_kib']:>9.0f}"
+            )
+        return {"counts": counts, "results": results}
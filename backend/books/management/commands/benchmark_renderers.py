@@ -0,0 +1,59 @@
+import time
+
+from books.serializers.book_serializers import BookSerializer
+from books.utils.benchmarks import get_benchmark_host
+from books.views import BookViewSet
+from core.renderers import MessagePackRenderer, ORJSONRenderer, msgpack
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+
+class Command(BaseCommand):
+    help = "Time the JSON / MessagePack renderers on real book list pages from the current database."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--page-size", type=int, default=50)
+        parser.add_argument("--iterations", type=int, default=200)
+
+    def handle(self, *args, **options):
+        page_size = options["page_size"]
+        iterations = options["iterations"]
+        if page_size < 1 or iterations < 1:
+            raise CommandError("--page-size and --iterations must be positive integers.")
+
+        renderers = [("DRF JSONRenderer", JSONRenderer()), ("ORJSONRenderer", ORJSONRenderer())]
+        if msgpack is not None:
+            renderers.append(("MessagePackRenderer", MessagePackRenderer()))
+        else:
+            self.stdout.write("msgpack is not installed; skipping MessagePackRenderer.")
+
+        pages = [
+            ("compact list", {"page_size": page_size}),
+            ("full list", {"page_size": page_size, "fields": ",".join(BookSerializer.Meta.fields)}),
+        ]
+        for label, params in pages:
+            data = self.get_page_data(params)
+            if not data["results"]:
+                raise CommandError("No books in the database; seed some first.")
+            self.stdout.write(f"\n{label}: {len(data['results'])} books, {iterations} renders each")
+            self.benchmark(data, renderers, iterations)
+
+    def get_page_data(self, params):
+        request = APIRequestFactory().get("/api/books/", params, HTTP_HOST=get_benchmark_host())
+        response = BookViewSet.as_view({"get": "list"})(request)
+        if response.status_code != 200:
+            raise CommandError(f"Book list returned {response.status_code}: {response.data}")
+        return response.data
+
+    def benchmark(self, data, renderers, iterations):
+        baseline = None
+        self.stdout.write(f"  {'renderer':<22}{'bytes':>10}{'ms/render':>12}{'speedup':>10}")
+        for name, renderer in renderers:
+            size = len(renderer.render(data, renderer.media_type, {}))
+            started = time.perf_counter()
+            for _ in range(iterations):
+                renderer.render(data, renderer.media_type, {})
+            per_render = (time.perf_counter() - started) * 1000 / iterations
+            baseline = baseline or per_render
+            self.stdout.write(f"  {name:<22}{size:>10}{per_render:>12.3f}{baseline / per_render:>9.1f}x")
@@ -0,0 +1,50 @@
+import time
+
+from books.utils.export import iter_catalog_ndjson, parse_since
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = "Export the book catalog as newline-delimited JSON (one book per line)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--since",
+            help=(
+                "Only books whose own row was saved at or after this ISO 8601 date/datetime (datetime_modified). "
+                "Rating aggregate updates, image uploads, author/translator/language/format changes and renamed "
+                "authors, translators, publishers or categories do not touch it, so those books are not included; "
+                "run a full export to pick such changes up."
+            ),
+        )
+        parser.add_argument("--chunk-size", type=int, default=None)
+        parser.add_argument("--output", default="-", help="File to write to (default: stdout).")
+
+    def handle(self, *args, **options):
+        since = options["since"]
+        if since is not None:
+            since = parse_since(since)
+            if since is None:
+                raise CommandError("--since must be an ISO 8601 date or datetime.")
+        chunk_size = options["chunk_size"]
+        if chunk_size is not None and chunk_size < 1:
+            raise CommandError("--chunk-size must be a positive integer.")
+
+        exported = 0
+        started = time.perf_counter()
+        chunks = iter_catalog_ndjson(since=since, chunk_size=chunk_size)
+
+        if options["output"] == "-":
+            for chunk in chunks:
+                self.stdout.write(chunk.decode(), ending="")
+                exported += chunk.count(b"\n")
+        else:
+            with open(options["output"], "wb") as output:
+                for chunk in chunks:
+                    output.write(chunk)
+                    exported += chunk.count(b"\n")
+
+        elapsed = time.perf_counter() - started
+        self.stderr.write(
+            f"Exported {exported} books in {elapsed:.2f}s ({exported / max(elapsed, 1e-9):.0f} rows/sec)."
+        )
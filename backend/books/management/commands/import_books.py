@@ -0,0 +1,76 @@
+import time
+from pathlib import Path
+
+from books.models import Book
+from books.utils.imports import import_book_batch, parse_book_row, read_import_rows
+from books.utils.search import refresh_search_vectors
+from core.cache.versions import bump_version
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+INPUT_FORMATS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+
+class Command(BaseCommand):
+    help = "Bulk import (upsert by name) books from a CSV or NDJSON file."
+    max_reported_errors = 20
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--format", choices=sorted(set(INPUT_FORMATS.values())), help="Default: from extension.")
+        parser.add_argument("--batch-size", type=int, default=1000, help="Rows per transaction.")
+        parser.add_argument("--dry-run", action="store_true", help="Run every batch, then roll it back.")
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        input_format = options["format"] or INPUT_FORMATS.get(path.suffix.lower())
+        batch_size = options["batch_size"]
+        if input_format is None:
+            raise CommandError("Cannot tell the input format from the file name; pass --format.")
+        if not path.is_file():
+            raise CommandError(f"{path} does not exist.")
+        if batch_size < 1:
+            raise CommandError("--batch-size must be a positive integer.")
+
+        self.dry_run = options["dry_run"]
+        self.invalid = 0
+        imported = 0
+        batch = []
+        started = time.perf_counter()
+
+        for row_number, raw in enumerate(read_import_rows(path, input_format), start=1):
+            try:
+                batch.append(parse_book_row(raw))
+            except ValueError as exc:
+                self.report_invalid(row_number, exc)
+            if len(batch) >= batch_size:
+                imported += self.import_batch(batch, batch_size)
+                batch = []
+        if batch:
+            imported += self.import_batch(batch, batch_size)
+
+        # @ bulk_create skipped the signals that invalidate cached catalog responses
+        if imported and not self.dry_run:
+            bump_version("books")
+
+        elapsed = time.perf_counter() - started
+        rate = imported / max(elapsed, 1e-9)
+        prefix = "Dry run: would have imported" if self.dry_run else "Imported"
+        self.stdout.write(
+            f"{prefix} {imported} books ({self.invalid} invalid rows skipped) in {elapsed:.2f}s ({rate:.0f} rows/sec)."
+        )
+
+    def import_batch(self, batch, batch_size):
+        with transaction.atomic():
+            book_ids = import_book_batch(batch, batch_size)
+            refresh_search_vectors(Book.objects.filter(pk__in=book_ids))
+            if self.dry_run:
+                transaction.set_rollback(True)
+        return len(book_ids)
+
+    def report_invalid(self, row_number, exc):
+        self.invalid += 1
+        if self.invalid <= self.max_reported_errors:
+            self.stderr.write(f"Row {row_number}: {exc}")
+        elif self.invalid == self.max_reported_errors + 1:
+            self.stderr.write("Further invalid rows are not reported individually.")
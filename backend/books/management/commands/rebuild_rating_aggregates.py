@@ -0,0 +1,55 @@
+from books.models import Book
+from books.utils.ratings import find_stale_rating_aggregates
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+
+class Command(BaseCommand):
+    help = "Rebuild (or check) the denormalized rating aggregates stored on Book."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report books whose aggregates are stale; exit with an error if any are found.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        check_only = options["check"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be a positive integer.")
+
+        scanned = 0
+        stale_total = 0
+        last_pk = 0
+
+        while True:
+            book_ids = list(
+                Book.objects.filter(pk__gt=last_pk).order_by("pk").values_list("pk", flat=True)[:batch_size]
+            )
+            if not book_ids:
+                break
+            last_pk = book_ids[-1]
+            scanned += len(book_ids)
+
+            with transaction.atomic():
+                books = Book.objects.filter(pk__in=book_ids).only("id", "rating_sum", "rating_count", "avg_rating")
+                # @ Lock the batch so concurrent rating writes can't interleave with the rebuild
+                if not check_only:
+                    books = books.select_for_update()
+                stale = find_stale_rating_aggregates(list(books))
+                stale_total += len(stale)
+
+                if check_only:
+                    for book in stale:
+                        self.stdout.write(f"Stale aggregates for book {book.pk}")
+                elif stale:
+                    Book.objects.bulk_update(stale, ["rating_sum", "rating_count", "avg_rating"])
+
+        verb = "Found" if check_only else "Rebuilt"
+        self.stdout.write(f"Scanned {scanned} books. {verb} {stale_total} stale aggregate(s).")
+
+        if check_only and stale_total:
+            raise CommandError(f"{stale_total} book(s) have stale rating aggregates.")
@@ -0,0 +1,46 @@
+from books.models import Book
+from books.utils.seeding import DEFAULT_SCALE_SIZES, ScaleDataGenerator, flush_seeded_data
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a deterministic synthetic catalog (users, books, relations, ratings, favorites, comments) "
+        "with Zipf-like popularity for load and scale testing."
+    )
+
+    def add_arguments(self, parser):
+        for name, default in DEFAULT_SCALE_SIZES.items():
+            parser.add_argument(f"--{name.replace('_', '-')}", type=int, default=default, dest=name)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--zipf-exponent", type=float, default=1.1, help="Popularity skew; 0 is uniform, higher is more skewed."
+        )
+        parser.add_argument("--batch-size", type=int, default=10_000)
+        parser.add_argument(
+            "--flush",
+            action="store_true",
+            help="Delete the existing catalog (and previously seeded users) first.",
+        )
+
+    def handle(self, *args, **options):
+        sizes = {name: options[name] for name in DEFAULT_SCALE_SIZES}
+        if any(size < 0 for size in sizes.values()) or options["batch_size"] < 1:
+            raise CommandError("Sizes must be non-negative and --batch-size positive.")
+        for required in ("books", "users", "categories", "publishers"):
+            if sizes[required] < 1:
+                raise CommandError(f"--{required} must be at least 1.")
+
+        if options["flush"]:
+            flush_seeded_data()
+        elif Book.objects.exists():
+            raise CommandError("The catalog is not empty; pass --flush to replace it with seeded data.")
+
+        generator = ScaleDataGenerator(
+            sizes,
+            seed=options["seed"],
+            exponent=options["zipf_exponent"],
+            batch_size=options["batch_size"],
+            log=self.stdout.write,
+        )
+        generator.run()
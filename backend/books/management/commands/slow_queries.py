@@ -0,0 +1,51 @@
+import json
+from datetime import datetime, timezone
+
+from core.queries.slow import clear_slow_queries, get_slow_queries, summarize_slow_queries
+from core.queries.views import SLOW_QUERY_SORT_FIELDS
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        "Report the sampled slow-query log aggregated by SQL fingerprint. Reads the ring buffer from the "
+        "configured cache, so it only sees other processes' records with a shared cache backend."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=20)
+        parser.add_argument("--sort", choices=SLOW_QUERY_SORT_FIELDS, default="total_ms")
+        parser.add_argument("--plans", action="store_true", help="Print the captured EXPLAIN plan of each fingerprint.")
+        parser.add_argument("--json", action="store_true", help="Print the aggregated report as JSON.")
+        parser.add_argument("--clear", action="store_true", help="Empty the buffer after reporting.")
+
+    def handle(self, *args, **options):
+        records = get_slow_queries()
+        summary = summarize_slow_queries(records, options["sort"])[: options["limit"]]
+
+        if options["json"]:
+            self.stdout.write(json.dumps({"count": len(records), "fingerprints": summary}, indent=2))
+        elif not records:
+            self.stdout.write(f"No statements over {settings.SLOW_QUERY_MS} ms have been recorded.")
+        else:
+            self.write_table(records, summary, options["plans"])
+
+        if options["clear"]:
+            clear_slow_queries()
+            self.stderr.write(f"Cleared {len(records)} records.")
+
+    def write_table(self, records, summary, plans):
+        self.stdout.write(f"{len(records)} slow statements, {len(summary)} fingerprints shown\n")
+        self.stdout.write(f"{'fingerprint':<18}{'count':>7}{'total ms':>11}{'mean ms':>10}{'max ms':>10}  last seen")
+        for group in summary:
+            last_seen = datetime.fromtimestamp(group["last_seen"], timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+            self.stdout.write(
+                f"{group['fingerprint']:<18}{group['count']:>7}{group['total_ms']:>11.1f}"
+                f"{group['mean_ms']:>10.1f}{group['max_ms']:>10.1f}  {last_seen}"
+            )
+            self.stdout.write(f"  {group['sql']}")
+            if group["views"]:
+                self.stdout.write(f"  views: {', '.join(group['views'])}")
+            if plans and group["plan"] is not None:
+                self.stdout.write("  plan: " + json.dumps(group["plan"], indent=2).replace("\n", "\n  "))
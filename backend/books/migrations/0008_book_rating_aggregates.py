@@ -0,0 +1,43 @@
+# Generated by Django 5.2.9 on 2026-10-18 17:20
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_rating_aggregates(apps, schema_editor):
+    Book = apps.get_model('books', 'Book')
+    Rating = apps.get_model('books', 'Rating')
+
+    rows = Rating.objects.values('book_id').annotate(total=Sum('score'), count=Count('id')).order_by()
+    for row in rows.iterator(chunk_size=1000):
+        Book.objects.filter(pk=row['book_id']).update(
+            rating_sum=row['total'],
+            rating_count=row['count'],
+            avg_rating=row['total'] / row['count'],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0007_rating'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='book',
+            name='avg_rating',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='book',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='book',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_rating_aggregates, migrations.RunPython.noop),
+    ]
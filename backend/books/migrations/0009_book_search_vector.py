@@ -0,0 +1,71 @@
+# Generated by Django 5.2.9 on 2026-10-18 17:30
+
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import OuterRef, Subquery, TextField
+
+
+# @ The search document as of this migration, built from the historical models (kept out of books.utils on purpose)
+def build_search_document(apps):
+    Author = apps.get_model('books', 'Author')
+    Translator = apps.get_model('books', 'Translator')
+    Publisher = apps.get_model('books', 'Publisher')
+    Category = apps.get_model('books', 'Category')
+    config = getattr(settings, 'BOOK_SEARCH_CONFIG', 'simple')
+
+    def related_names(model):
+        return Subquery(
+            model.objects.filter(books=OuterRef('pk'))
+            .values('books')
+            .annotate(names=StringAgg('name', delimiter=' '))
+            .values('names')[:1],
+            output_field=TextField(),
+        )
+
+    def foreign_name(model, relation, column):
+        return Subquery(model.objects.filter(pk=OuterRef(f'{relation}_id')).values(column)[:1])
+
+    return (
+        SearchVector('name', weight='A', config=config)
+        + SearchVector(related_names(Author), weight='A', config=config)
+        + SearchVector(related_names(Translator), weight='B', config=config)
+        + SearchVector(foreign_name(Publisher, 'publisher', 'name'), weight='B', config=config)
+        + SearchVector(foreign_name(Category, 'category', 'title'), weight='B', config=config)
+        + SearchVector('description', weight='C', config=config)
+    )
+
+
+# @ GIN index and backfill only exist on PostgreSQL; other backends keep the icontains search
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS books_book_search_vector_gin ON books_book USING gin (search_vector)'
+    )
+    Book = apps.get_model('books', 'Book')
+    Book.objects.update(search_vector=build_search_document(apps))
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS books_book_search_vector_gin')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0008_book_rating_aggregates'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='book',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.9 on 2026-10-18 17:40
+
+from django.db import migrations
+
+TRIGRAM_INDEXES = [
+    ('books_book_name_trgm', 'books_book', 'name'),
+    ('books_author_name_trgm', 'books_author', 'name'),
+    ('books_translator_name_trgm', 'books_translator', 'name'),
+    ('books_publisher_name_trgm', 'books_publisher', 'name'),
+]
+
+
+# @ pg_trgm only exists on PostgreSQL; other backends fall back to plain LIKE scans
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for index_name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {index_name} ON {table} USING gin (UPPER({column}::text) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index_name, _, _ in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {index_name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0009_book_search_vector'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
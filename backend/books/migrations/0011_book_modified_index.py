@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-18 17:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0010_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['datetime_modified', 'id'], name='books_book_modified_idx'),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 
@@ -56,6 +57,9 @@ class ContentFormat(models.Model):
 
 
 class Book(models.Model):
+    # @ Only ever written through QuerySet.update (books.utils.ratings), never by a full save of a loaded instance
+    RATING_AGGREGATE_FIELDS = {"rating_sum", "rating_count", "avg_rating"}
+
     name = models.CharField(max_length=255, unique=True)
     description = models.TextField()
     cover_image = models.ImageField(upload_to=book_cover_upload_path, null=True, blank=True)
@@ -74,9 +78,34 @@ class Book(models.Model):
     datetime_created = models.DateTimeField(auto_now_add=True)
     datetime_modified = models.DateTimeField(auto_now=True)
 
+    # @ Denormalized rating aggregates (maintained by books.signals.book_rating)
+    rating_sum = models.PositiveIntegerField(default=0, editable=False)
+    rating_count = models.PositiveIntegerField(default=0, editable=False)
+    avg_rating = models.FloatField(null=True, blank=True, editable=False)
+
+    # @ Full-text search document (PostgreSQL only, maintained by books.signals.book_search)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        # @ Incremental catalog exports walk books by modification time
+        indexes = [models.Index(fields=["datetime_modified", "id"], name="books_book_modified_idx")]
+
     def __str__(self):
         return self.name
 
+    # @ A full save would write back the aggregates loaded with the instance and drop ratings made since
+    def save(self, *args, **kwargs):
+        if not self._state.adding and not kwargs.get("force_insert") and kwargs.get("update_fields") is None:
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in self.RATING_AGGREGATE_FIELDS
+                and field.attname not in deferred
+            ]
+        super().save(*args, **kwargs)
+
 
 class BookImage(models.Model):
     book = models.ForeignKey(Book, on_delete=models.CASCADE, related_name="images")
@@ -84,7 +113,7 @@ class BookImage(models.Model):
     description = models.TextField(blank=True)
 
     def __str__(self):
-        return f"Image for {self.book.name}"
+        return f"Image {self.pk} for book {self.book_id}"
 
 
 class Comment(models.Model):
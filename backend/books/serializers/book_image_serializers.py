@@ -1,8 +1,9 @@
 from books.models import BookImage
+from core.instrumentation.metrics import TimedRepresentationMixin
 from rest_framework import serializers
 
 
-class BookImageSerializer(serializers.ModelSerializer):
+class BookImageSerializer(TimedRepresentationMixin, serializers.ModelSerializer):
     class Meta:
         model = BookImage
         fields = ["id", "image", "description"]
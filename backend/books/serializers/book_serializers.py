@@ -8,6 +8,7 @@ from books.models import (
     Translator,
 )
 from books.serializers.book_image_serializers import BookImageSerializer
+from core.instrumentation.metrics import TimedRepresentationMixin
 from rest_framework import serializers
 
 
@@ -47,7 +48,7 @@ class ContentFormatSerializer(serializers.ModelSerializer):
         fields = ["id", "name"]
 
 
-class BookSerializer(serializers.ModelSerializer):
+class BookSerializer(TimedRepresentationMixin, serializers.ModelSerializer):
 
     images = BookImageSerializer(many=True, read_only=True)
     authors = AuthorSerializer(many=True, read_only=True)
@@ -59,6 +60,7 @@ class BookSerializer(serializers.ModelSerializer):
 
     # @ Custom Method Field
     is_favorited = serializers.SerializerMethodField()
+    my_rating = serializers.SerializerMethodField()
     avg_rating = serializers.FloatField(read_only=True)
     rating_count = serializers.IntegerField(read_only=True)
 
@@ -86,9 +88,20 @@ class BookSerializer(serializers.ModelSerializer):
             "datetime_modified",
             "avg_rating",
             "rating_count",
+            "my_rating",
             "is_favorited",
         ]
 
+    # @ context["selected_fields"] (see books.utils.fieldsets) prunes the output to a sparse fieldset
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        selected_fields = self.context.get("selected_fields")
+        if selected_fields is not None:
+            for name in set(self.fields) - set(selected_fields):
+                self.fields.pop(name)
+
+    # @ BookViewSet payloads are shared between users and leave this False; the per-user overlay
+    # @ (books.utils.user_overlay) fills it from the cached membership
     def get_is_favorited(self, book: Book):
         request = self.context.get("request")
         if not request or not request.user.is_authenticated:
@@ -96,3 +109,39 @@ class BookSerializer(serializers.ModelSerializer):
 
         favorite_book_ids = self.context.get("favorite_book_ids", set())
         return book.id in favorite_book_ids
+
+    def get_my_rating(self, book: Book):
+        return getattr(book, "my_rating", None)
+
+
+# @ Compact representation for list pages; the detail endpoint keeps BookSerializer
+class BookListSerializer(TimedRepresentationMixin, serializers.ModelSerializer):
+    authors = serializers.SlugRelatedField(many=True, read_only=True, slug_field="name")
+    category = serializers.CharField(source="category.title", read_only=True)
+    avg_rating = serializers.FloatField(read_only=True)
+    rating_count = serializers.IntegerField(read_only=True)
+
+    # @ Filled by the per-user overlay (books.utils.user_overlay)
+    my_rating = serializers.SerializerMethodField()
+    is_favorited = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Book
+        fields = [
+            "id",
+            "name",
+            "cover_image",
+            "price",
+            "authors",
+            "category",
+            "avg_rating",
+            "rating_count",
+            "my_rating",
+            "is_favorited",
+        ]
+
+    def get_my_rating(self, book: Book):
+        return getattr(book, "my_rating", None)
+
+    def get_is_favorited(self, book: Book):
+        return False
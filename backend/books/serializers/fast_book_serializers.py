@@ -0,0 +1,133 @@
+from collections import defaultdict
+from types import SimpleNamespace
+
+from books.models import Book
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.fields.files import FieldFile
+from rest_framework import serializers
+from rest_framework.relations import ManyRelatedField, SlugRelatedField
+
+
+class UnsupportedRepresentation(Exception):
+    pass
+
+
+# @ Replays a serializer's field layout over values() rows, reusing the DRF fields' to_representation
+# @ so the output matches the serializer exactly without a serializer instance per row.
+class ValuesRepresentation:
+    def __init__(self, serializer, model):
+        self.model = model
+        self.columns = ["id"]
+        self.entries = []
+        self.relations = {}
+
+        for name, field in serializer.fields.items():
+            if isinstance(field, serializers.ListSerializer):
+                self._add_many(name, field.source, ValuesRepresentation(field.child, self._related_model(field.source)))
+            elif isinstance(field, ManyRelatedField):
+                if not isinstance(field.child_relation, SlugRelatedField):
+                    raise UnsupportedRepresentation(name)
+                self._add_many(name, field.source, field.child_relation.slug_field)
+            elif isinstance(field, serializers.BaseSerializer):
+                # @ Foreign keys are joined into the book row itself, like select_related
+                nested = ValuesRepresentation(field, self._related_model(field.source))
+                if nested.relations:
+                    raise UnsupportedRepresentation(name)
+                for column in nested.columns:
+                    self._add_column(f"{field.source}__{column}")
+                self.entries.append((name, "one", (field.source, nested)))
+            elif isinstance(field, serializers.SerializerMethodField):
+                self.entries.append((name, "method", field))
+            elif isinstance(field, serializers.FileField):
+                self._add_column(field.source)
+                self.entries.append((name, "file", (field, model._meta.get_field(field.source))))
+            else:
+                column = "__".join(field.source_attrs)
+                self._add_column(column)
+                self.entries.append((name, "value", (field, column)))
+
+    def _related_model(self, relation):
+        try:
+            return self.model._meta.get_field(relation).related_model
+        except FieldDoesNotExist:
+            raise UnsupportedRepresentation(relation)
+
+    def _add_column(self, column):
+        if column not in self.columns:
+            self.columns.append(column)
+
+    def _add_many(self, name, relation, nested):
+        if isinstance(nested, ValuesRepresentation) and nested.relations:
+            raise UnsupportedRepresentation(name)
+        self.relations[relation] = nested
+        self.entries.append((name, "many", relation))
+
+    # @ One query per to-many relation for the whole page, keyed by book id
+    def load_relations(self, rows):
+        loaded = {}
+        book_ids = [row["id"] for row in rows]
+        for relation, nested in self.relations.items():
+            loaded[relation] = self._load_many(relation, nested, book_ids)
+        return loaded
+
+    def _load_many(self, relation, nested, book_ids):
+        model_field = self.model._meta.get_field(relation)
+        columns = [nested] if isinstance(nested, str) else nested.columns
+
+        if model_field.many_to_many:
+            through = model_field.remote_field.through
+            source, target = model_field.m2m_field_name(), model_field.m2m_reverse_field_name()
+            related_rows = (
+                through.objects.filter(**{f"{source}_id__in": book_ids})
+                .order_by(f"{source}_id", f"{target}_id")
+                .values(f"{source}_id", *[f"{target}__{column}" for column in columns])
+            )
+            owner, prefix = f"{source}_id", f"{target}__"
+        else:
+            fk_name = model_field.field.name
+            related_rows = (
+                model_field.related_model.objects.filter(**{f"{fk_name}_id__in": book_ids})
+                .order_by("pk")
+                .values(f"{fk_name}_id", *columns)
+            )
+            owner, prefix = f"{fk_name}_id", ""
+
+        grouped = defaultdict(list)
+        for related in related_rows:
+            values = {column: related[prefix + column] for column in columns}
+            grouped[related[owner]].append(values[nested] if isinstance(nested, str) else values)
+        return grouped
+
+    def represent(self, rows, loaded=None):
+        if loaded is None:
+            loaded = self.load_relations(rows)
+        return [self.represent_row(row, loaded) for row in rows]
+
+    def represent_row(self, row, loaded):
+        data = {}
+        for name, kind, spec in self.entries:
+            if kind == "value":
+                field, column = spec
+                value = row[column]
+                data[name] = None if value is None else field.to_representation(value)
+            elif kind == "file":
+                field, model_field = spec
+                data[name] = field.to_representation(FieldFile(None, model_field, row[model_field.name]))
+            elif kind == "method":
+                data[name] = spec.to_representation(SimpleNamespace(**row))
+            elif kind == "one":
+                relation, nested = spec
+                related = {column: row[f"{relation}__{column}"] for column in nested.columns}
+                data[name] = None if related["id"] is None else nested.represent_row(related, {})
+            else:
+                nested = self.relations[spec]
+                items = loaded[spec].get(row["id"], [])
+                data[name] = items if isinstance(nested, str) else [nested.represent_row(item, {}) for item in items]
+        return data
+
+
+def build_book_representation(serializer):
+    try:
+        return ValuesRepresentation(serializer, Book)
+    except UnsupportedRepresentation:
+        return None
@@ -1,8 +1,9 @@
 from books.models import Favorite
+from core.instrumentation.metrics import TimedRepresentationMixin
 from rest_framework import serializers
 
 
-class FavoriteSerializer(serializers.ModelSerializer):
+class FavoriteSerializer(TimedRepresentationMixin, serializers.ModelSerializer):
     class Meta:
         model = Favorite
         fields = ["id", "book", "datetime_created"]
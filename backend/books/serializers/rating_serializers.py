@@ -1,4 +1,5 @@
 from books.models import Rating
+from core.instrumentation.metrics import TimedRepresentationMixin
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
@@ -11,7 +12,7 @@ class UserSerializer(serializers.ModelSerializer):
         fields = ["id", "username"]
 
 
-class RatingSerializer(serializers.ModelSerializer):
+class RatingSerializer(TimedRepresentationMixin, serializers.ModelSerializer):
     user = UserSerializer(read_only=True)
 
     class Meta:
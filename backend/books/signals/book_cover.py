@@ -1,11 +1,13 @@
 import os
 
 from books.models import Book
+from core.instrumentation.prometheus import timed_signal_handler
 from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
 
 @receiver(pre_save, sender=Book)
+@timed_signal_handler
 def delete_old_cover(sender, instance, **kwargs):
     if not instance.pk:
         return
@@ -27,6 +29,7 @@ def delete_old_cover(sender, instance, **kwargs):
 
 
 @receiver(post_save, sender=Book)
+@timed_signal_handler
 def rename_cover_image(sender, instance, created, **kwargs):
     if not instance.cover_image:
         return
@@ -41,6 +44,7 @@ def rename_cover_image(sender, instance, created, **kwargs):
 
 
 @receiver(post_delete, sender=Book)
+@timed_signal_handler
 def delete_book_cover_after_book_delete(sender, instance, **kwargs):
     if instance.cover_image:
         try:
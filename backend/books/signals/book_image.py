@@ -1,11 +1,13 @@
 import os
 
 from books.models import BookImage
+from core.instrumentation.prometheus import timed_signal_handler
 from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
 
 @receiver(pre_save, sender=BookImage)
+@timed_signal_handler
 def delete_old_book_image(sender, instance, **kwargs):
     if not instance.pk:
         return
@@ -20,11 +22,12 @@ def delete_old_book_image(sender, instance, **kwargs):
 
 
 @receiver(post_save, sender=BookImage)
+@timed_signal_handler
 def rename_book_image(sender, instance, created, **kwargs):
     if not instance.image:
         return
     ext = instance.image.name.split(".")[-1]
-    new_name = f"books/images/{instance.book.id}_{instance.id}.{ext}"
+    new_name = f"books/images/{instance.book_id}_{instance.id}.{ext}"
     if instance.image.name != new_name:
         instance.image.storage.save(new_name, instance.image.file)
         instance.image.name = new_name
@@ -32,6 +35,7 @@ def rename_book_image(sender, instance, created, **kwargs):
 
 
 @receiver(post_delete, sender=BookImage)
+@timed_signal_handler
 def delete_image_file_after_image_object_delete(sender, instance, **kwargs):
     if instance.image:
         if instance.image.path and os.path.exists(instance.image.path):
@@ -0,0 +1,39 @@
+from books.models import Rating
+from books.utils.ratings import apply_rating_delta
+from core.instrumentation.prometheus import timed_signal_handler
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+
+@receiver(pre_save, sender=Rating)
+@timed_signal_handler
+def remember_previous_rating(sender, instance, raw=False, **kwargs):
+    instance._previous_rating = None
+    if raw or not instance.pk:
+        return
+    instance._previous_rating = Rating.objects.filter(pk=instance.pk).values_list("book_id", "score").first()
+
+
+@receiver(post_save, sender=Rating)
+@timed_signal_handler
+def update_book_rating_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+
+    previous = getattr(instance, "_previous_rating", None)
+    if created or previous is None:
+        apply_rating_delta(instance.book_id, instance.score, 1)
+        return
+
+    previous_book_id, previous_score = previous
+    if previous_book_id != instance.book_id:
+        apply_rating_delta(previous_book_id, -previous_score, -1)
+        apply_rating_delta(instance.book_id, instance.score, 1)
+    elif previous_score != instance.score:
+        apply_rating_delta(instance.book_id, instance.score - previous_score, 0)
+
+
+@receiver(post_delete, sender=Rating)
+@timed_signal_handler
+def update_book_rating_on_delete(sender, instance, **kwargs):
+    apply_rating_delta(instance.book_id, -instance.score, -1)
@@ -0,0 +1,74 @@
+from books.models import Author, Book, Category, Publisher, Translator
+from books.utils.search import SEARCH_DOCUMENT_FIELDS, is_search_vector_supported, refresh_search_vectors
+from core.instrumentation.prometheus import timed_signal_handler
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+BOOK_RELATION_BY_MODEL = {
+    Author: "authors",
+    Translator: "translators",
+    Publisher: "publisher",
+    Category: "category",
+}
+
+
+@receiver(post_save, sender=Book)
+@timed_signal_handler
+def refresh_book_search_vector(sender, instance, update_fields=None, raw=False, **kwargs):
+    if raw or not is_search_vector_supported():
+        return
+    if update_fields and not SEARCH_DOCUMENT_FIELDS.intersection(update_fields):
+        return
+    refresh_search_vectors(Book.objects.filter(pk=instance.pk))
+
+
+@receiver(m2m_changed, sender=Book.authors.through)
+@receiver(m2m_changed, sender=Book.translators.through)
+@timed_signal_handler
+def refresh_search_vector_on_m2m_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if not is_search_vector_supported():
+        return
+
+    if not reverse:
+        if action.startswith("post_"):
+            refresh_search_vectors(Book.objects.filter(pk=instance.pk))
+        return
+
+    # @ Reverse side (author.books / translator.books): clear() does not provide pk_set
+    if action == "pre_clear":
+        instance._search_cleared_book_ids = list(instance.books.values_list("pk", flat=True))
+    elif action == "post_clear":
+        refresh_search_vectors(Book.objects.filter(pk__in=getattr(instance, "_search_cleared_book_ids", [])))
+    elif action.startswith("post_"):
+        refresh_search_vectors(Book.objects.filter(pk__in=pk_set))
+
+
+@receiver(post_save, sender=Author)
+@receiver(post_save, sender=Translator)
+@receiver(post_save, sender=Publisher)
+@receiver(post_save, sender=Category)
+@timed_signal_handler
+def refresh_related_book_search_vectors(sender, instance, created, raw=False, **kwargs):
+    if created or raw or not is_search_vector_supported():
+        return
+    refresh_search_vectors(Book.objects.filter(**{BOOK_RELATION_BY_MODEL[sender]: instance}))
+
+
+# @ Deleting an author / translator drops its through rows without m2m_changed, so the affected books are
+# @ collected first. Publisher and category are PROTECTed and cannot be deleted while books use them.
+@receiver(pre_delete, sender=Author)
+@receiver(pre_delete, sender=Translator)
+@timed_signal_handler
+def remember_books_of_deleted_contributor(sender, instance, **kwargs):
+    instance._search_book_ids = []
+    if is_search_vector_supported():
+        instance._search_book_ids = list(instance.books.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Author)
+@receiver(post_delete, sender=Translator)
+@timed_signal_handler
+def refresh_search_vectors_after_contributor_delete(sender, instance, **kwargs):
+    book_ids = getattr(instance, "_search_book_ids", [])
+    if book_ids:
+        refresh_search_vectors(Book.objects.filter(pk__in=book_ids))
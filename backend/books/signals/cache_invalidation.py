@@ -0,0 +1,60 @@
+from books.models import (
+    Author,
+    Book,
+    BookImage,
+    Category,
+    Comment,
+    ContentFormat,
+    Favorite,
+    Language,
+    Publisher,
+    Rating,
+    Translator,
+)
+from books.utils.favorites import apply_favorite_change
+from core.cache.versions import bump_version
+from core.instrumentation.prometheus import timed_signal_handler
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+# @ Everything rendered by (or filterable in) the book list shares the "books" version
+CATALOG_MODELS = [Book, Author, Translator, Publisher, Category, Language, ContentFormat, BookImage, Rating]
+CATALOG_M2M_THROUGH_MODELS = [
+    Book.authors.through,
+    Book.translators.through,
+    Book.content_formats.through,
+    Book.languages.through,
+]
+
+
+@timed_signal_handler
+def bump_catalog_version(sender, **kwargs):
+    if kwargs.get("action", "").startswith("pre_"):
+        return
+    bump_version("books")
+
+
+for model in CATALOG_MODELS:
+    post_save.connect(bump_catalog_version, sender=model, dispatch_uid=f"bump_catalog_version_save_{model.__name__}")
+    post_delete.connect(
+        bump_catalog_version, sender=model, dispatch_uid=f"bump_catalog_version_delete_{model.__name__}"
+    )
+
+for through in CATALOG_M2M_THROUGH_MODELS:
+    m2m_changed.connect(bump_catalog_version, sender=through, dispatch_uid=f"bump_catalog_version_{through.__name__}")
+
+
+@receiver(post_save, sender=Favorite)
+@receiver(post_delete, sender=Favorite)
+@timed_signal_handler
+def bump_favorites_version(sender, instance, signal, **kwargs):
+    version = bump_version("favorites", instance.user_id)
+    apply_favorite_change(instance.user_id, instance.book_id, favorited=signal is post_save, version=version)
+
+
+# @ Comments are versioned per book; moderation changes the visible list too
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+@timed_signal_handler
+def bump_comments_version(sender, instance, **kwargs):
+    bump_version("comments", instance.book_id)
@@ -0,0 +1,79 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from books.filters.book_filters import BookFilter
+from books.models import Book
+from books.utils.benchmarks import percentile, rows_read_in_plan, scaled_sizes
+from books.utils.seeding import DEFAULT_SCALE_SIZES
+from books.views import BookViewSet
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+
+class TestBenchmarkEndpointsCommand(TestCase):
+
+    def run_command(self, *args):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.json")
+            call_command("benchmark_endpoints", *args, f"--output={path}", stdout=StringIO(), stderr=StringIO())
+            with open(path, encoding="utf-8") as output:
+                return json.load(output)
+
+    def test_seeds_each_size_and_reports_every_scenario(self):
+        report = self.run_command("--sizes=20,40", "--iterations=2", "--warmup=0")
+
+        self.assertEqual(report["environment"]["database"], "sqlite")
+        self.assertEqual([run["counts"]["books"] for run in report["runs"]], [20, 40])
+
+        results = report["runs"][-1]["results"]
+        names = {result["name"] for result in results}
+        for name in BookFilter.base_filters:
+            self.assertIn(f"books list ?{name}=", names)
+        for field in BookViewSet.ordering_fields:
+            self.assertIn(f"books list ?ordering=-{field}", names)
+        self.assertTrue({"book detail", "comments", "images", "favorites", "ratings"} <= names)
+
+        for result in results:
+            self.assertEqual(result["status"], 200, result["name"])
+            self.assertGreater(result["queries"], 0, result["name"])
+            self.assertLessEqual(result["p50_ms"], result["p95_ms"])
+            self.assertIsNone(result["rows_read"])
+            self.assertGreater(result["peak_memory_kib"], 0)
+
+    def test_only_filters_scenarios_on_the_current_data(self):
+        sizes = [f"--{name.replace('_', '-')}={count}" for name, count in scaled_sizes(20).items()]
+        call_command("seed_scale_data", *sizes, stdout=StringIO())
+
+        report = self.run_command("--iterations=1", "--only=ordering")
+
+        self.assertEqual(len(report["runs"]), 1)
+        self.assertEqual(len(report["runs"][0]["results"]), 2 * len(BookViewSet.ordering_fields))
+
+    def test_refuses_to_replace_a_catalog_without_flush(self):
+        call_command("seed_scale_data", "--books=5", "--users=5", stdout=StringIO())
+
+        with self.assertRaises(CommandError):
+            call_command("benchmark_endpoints", "--sizes=10", stdout=StringIO())
+        self.assertEqual(Book.objects.count(), 5)
+
+    def test_scaled_sizes_keep_the_default_proportions(self):
+        self.assertEqual(scaled_sizes(DEFAULT_SCALE_SIZES["books"]), DEFAULT_SCALE_SIZES)
+        sizes = scaled_sizes(100_000)
+        self.assertEqual(sizes["ratings"], 1_000_000)
+        self.assertEqual(sizes["languages"], DEFAULT_SCALE_SIZES["languages"])
+
+    def test_percentile_and_plan_rows(self):
+        self.assertEqual(percentile([5, 1, 4, 2, 3], 0.5), 3)
+        self.assertEqual(percentile(list(range(1, 21)), 0.95), 19)
+
+        plan = {
+            "Node Type": "Nested Loop",
+            "Plans": [
+                {"Node Type": "Seq Scan", "Relation Name": "a", "Actual Rows": 10, "Rows Removed by Filter": 90},
+                {"Node Type": "Index Scan", "Relation Name": "b", "Actual Rows": 2, "Actual Loops": 10},
+            ],
+        }
+        self.assertEqual(rows_read_in_plan(plan), 120)
@@ -0,0 +1,49 @@
+import json
+import tempfile
+from datetime import date, timedelta
+from io import StringIO
+from pathlib import Path
+
+from books.models import Book, Category, Publisher
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+
+class TestExportCatalogCommand(TestCase):
+
+    def setUp(self):
+        publisher = Publisher.objects.create(name="Publisher A")
+        category = Category.objects.create(title="Category A")
+        self.books = [
+            Book.objects.create(
+                name=f"Book {i}",
+                description="Desc",
+                publisher=publisher,
+                category=category,
+                volume=10,
+                number_of_pages=100,
+                approximate_study_time=timedelta(hours=5),
+                publication_date=date(2024, 1, 1),
+            )
+            for i in range(3)
+        ]
+
+    def test_exports_ndjson_to_stdout(self):
+        stdout, stderr = StringIO(), StringIO()
+        call_command("export_catalog", "--chunk-size=2", stdout=stdout, stderr=stderr)
+
+        books = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual([book["name"] for book in books], ["Book 0", "Book 1", "Book 2"])
+        self.assertIn("Exported 3 books", stderr.getvalue())
+
+    def test_exports_to_file_since_a_date(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = Path(directory) / "catalog.ndjson"
+            call_command("export_catalog", "--since=2999-01-01", f"--output={output}", stderr=StringIO())
+
+            self.assertEqual(output.read_bytes(), b"")
+
+    def test_invalid_since_raises(self):
+        with self.assertRaises(CommandError):
+            call_command("export_catalog", "--since=soon", stderr=StringIO())
@@ -0,0 +1,174 @@
+import json
+import tempfile
+from datetime import date, timedelta
+from io import StringIO
+from pathlib import Path
+
+from books.models import Author, Book, Category, Language, Publisher
+from core.cache.versions import get_version
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase
+
+CSV_HEADER = "name,description,publisher,category,price,active,volume,number_of_pages,approximate_study_time,"
+CSV_HEADER += "publication_date,authors,languages\n"
+
+
+class TestImportBooksCommand(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        Author.objects.create(name="Hafez")
+
+    def write(self, name, content):
+        path = Path(self.directory.name) / name
+        path.write_text(content, encoding="utf-8")
+        return str(path)
+
+    def import_books(self, *args):
+        stdout, stderr = StringIO(), StringIO()
+        call_command("import_books", *args, stdout=stdout, stderr=stderr)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def csv_rows(self, count, start=0):
+        return "".join(
+            f"Book {i},Desc {i},Penguin,Poetry,{1000 + i},true,10,100,1 02:00:00,2024-01-01,Hafez|Saadi,Persian\n"
+            for i in range(start, start + count)
+        )
+
+    def test_csv_import_creates_books_and_relations(self):
+        path = self.write("feed.csv", CSV_HEADER + self.csv_rows(3))
+        version = get_version("books")
+
+        stdout, _ = self.import_books(path)
+
+        self.assertIn("Imported 3 books", stdout)
+        self.assertIn("rows/sec", stdout)
+        book = Book.objects.get(name="Book 1")
+        self.assertEqual(book.publisher.name, "Penguin")
+        self.assertEqual(book.category.title, "Poetry")
+        self.assertEqual(book.approximate_study_time, timedelta(days=1, hours=2))
+        self.assertTrue(book.active)
+        self.assertEqual(sorted(book.authors.values_list("name", flat=True)), ["Hafez", "Saadi"])
+        self.assertEqual(list(book.languages.values_list("name", flat=True)), ["Persian"])
+        self.assertEqual(Author.objects.count(), 2)
+        self.assertNotEqual(get_version("books"), version)
+
+    def test_query_count_does_not_grow_with_rows(self):
+        small = self.write("small.csv", CSV_HEADER + self.csv_rows(2))
+        large = self.write("large.csv", CSV_HEADER + self.csv_rows(40, start=100))
+
+        with self.assertNumQueries(16) as small_queries:
+            self.import_books(small)
+        with self.assertNumQueries(len(small_queries.captured_queries)):
+            self.import_books(large)
+
+    def test_reimport_updates_books_and_replaces_relations(self):
+        self.import_books(self.write("feed.csv", CSV_HEADER + self.csv_rows(1)))
+        updated = CSV_HEADER + "Book 0,New desc,Vintage,Poetry,5,false,1,1,3600,2020-05-05,Rumi,\n"
+
+        self.import_books(self.write("update.csv", updated))
+
+        book = Book.objects.get(name="Book 0")
+        self.assertEqual(Book.objects.count(), 1)
+        self.assertEqual(book.description, "New desc")
+        self.assertEqual(book.publisher.name, "Vintage")
+        self.assertEqual(book.approximate_study_time, timedelta(hours=1))
+        self.assertEqual(list(book.authors.values_list("name", flat=True)), ["Rumi"])
+        self.assertFalse(book.languages.exists())
+
+    def test_ndjson_round_trips_export_catalog_output(self):
+        publisher = Publisher.objects.create(name="Penguin")
+        category = Category.objects.create(title="Poetry")
+        book = Book.objects.create(
+            name="Divan",
+            description="Desc",
+            publisher=publisher,
+            category=category,
+            price=1200,
+            volume=10,
+            number_of_pages=100,
+            approximate_study_time=timedelta(days=2, minutes=5),
+            publication_date=date(2024, 1, 1),
+        )
+        book.authors.add(Author.objects.get(name="Hafez"))
+        book.languages.add(Language.objects.create(name="Persian"))
+        exported = self.write("catalog.ndjson", "")
+        call_command("export_catalog", f"--output={exported}", stderr=StringIO())
+        Book.objects.all().delete()
+
+        stdout, stderr = self.import_books(exported)
+
+        imported = Book.objects.get(name="Divan")
+        self.assertIn("Imported 1 books", stdout)
+        self.assertEqual(stderr, "")
+        self.assertEqual(imported.approximate_study_time, timedelta(days=2, minutes=5))
+        self.assertEqual(list(imported.authors.values_list("name", flat=True)), ["Hafez"])
+        self.assertEqual(list(imported.languages.values_list("name", flat=True)), ["Persian"])
+
+    def test_dry_run_rolls_back(self):
+        stdout, _ = self.import_books(self.write("feed.csv", CSV_HEADER + self.csv_rows(2)), "--dry-run")
+
+        self.assertIn("Dry run: would have imported 2 books", stdout)
+        self.assertFalse(Book.objects.exists())
+        self.assertFalse(Publisher.objects.exists())
+
+    def test_invalid_rows_are_reported_and_skipped(self):
+        rows = self.csv_rows(1) + "Broken,Desc,Penguin,Poetry,1,true,ten,100,1:00:00,2024-01-01,Hafez,\n"
+        rows += ",No name,Penguin,Poetry,1,true,1,1,1:00:00,2024-01-01,,\n"
+        path = self.write("feed.csv", CSV_HEADER + rows)
+
+        stdout, stderr = self.import_books(path, "--batch-size=1")
+
+        self.assertIn("Imported 1 books (2 invalid rows skipped)", stdout)
+        self.assertIn("Row 2:", stderr)
+        self.assertIn("Row 3: name is required", stderr)
+
+    def test_out_of_range_prices_and_non_string_names_are_skipped(self):
+        row = {
+            "description": "Desc",
+            "publisher": "Penguin",
+            "category": "Poetry",
+            "volume": 1,
+            "number_of_pages": 1,
+            "approximate_study_time": "1:00:00",
+            "publication_date": "2024-01-01",
+        }
+        rows = [
+            {**row, "name": "Valid", "price": "1200"},
+            {**row, "name": "Overflow", "price": "1e12"},
+            {**row, "name": "Not a number", "price": "NaN"},
+            {**row, "name": "Negative", "price": -5},
+            {**row, "name": {"en": "Object"}, "price": 1},
+            {**row, "name": 1984, "price": 1},
+        ]
+        path = self.write("feed.ndjson", "".join(json.dumps(item) + "\n" for item in rows))
+
+        stdout, stderr = self.import_books(path, "--batch-size=1")
+
+        self.assertIn("Imported 2 books (4 invalid rows skipped)", stdout)
+        self.assertIn("Row 2: invalid price: '1e12'", stderr)
+        self.assertIn("Row 5: invalid name", stderr)
+        self.assertEqual(set(Book.objects.values_list("name", flat=True)), {"Valid", "1984"})
+
+    def test_values_beyond_column_limits_are_skipped(self):
+        too_many_pages = connection.ops.integer_field_range("PositiveIntegerField")[1] + 1
+        rows = self.csv_rows(1)
+        rows += f"Long category,Desc,Penguin,{'x' * 51},1,true,1,1,1:00:00,2024-01-01,Hafez,\n"
+        rows += f"Huge,Desc,Penguin,Poetry,1,true,1,{too_many_pages},1:00:00,2024-01-01,Hafez,\n"
+        rows += f"Long author,Desc,Penguin,Poetry,1,true,1,1,1:00:00,2024-01-01,{'y' * 256},\n"
+        path = self.write("feed.csv", CSV_HEADER + rows)
+
+        stdout, stderr = self.import_books(path, "--batch-size=1")
+
+        self.assertIn("Imported 1 books (3 invalid rows skipped)", stdout)
+        self.assertIn("Row 2: invalid category: 'xxx", stderr)
+        self.assertIn(f"Row 3: invalid number_of_pages: {too_many_pages}", stderr)
+        self.assertIn("Row 4: invalid authors", stderr)
+        self.assertEqual(list(Category.objects.values_list("title", flat=True)), ["Poetry"])
+
+    def test_unknown_format_raises(self):
+        with self.assertRaises(CommandError):
+            self.import_books(self.write("feed.txt", ""))
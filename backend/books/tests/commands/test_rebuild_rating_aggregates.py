@@ -0,0 +1,68 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from books.models import Book, Category, Publisher, Rating
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+User = get_user_model()
+
+
+class TestRebuildRatingAggregatesCommand(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="jack", email="jack@test.com", password="123456", phone_number="0452384156"
+        )
+        publisher = Publisher.objects.create(name="Publisher A")
+        category = Category.objects.create(title="Category A")
+
+        self.books = [
+            Book.objects.create(
+                name=f"Book {i}",
+                description="Desc",
+                publisher=publisher,
+                category=category,
+                volume=10,
+                number_of_pages=100,
+                approximate_study_time=timedelta(hours=5),
+                publication_date=date(2024, 1, 1),
+            )
+            for i in range(3)
+        ]
+        for book in self.books:
+            Rating.objects.create(user=self.user, book=book, score=4)
+
+    def corrupt(self):
+        # @ QuerySet.update() bypasses the rating signals
+        Rating.objects.filter(book=self.books[1]).update(score=2)
+        Book.objects.filter(pk=self.books[2].pk).update(rating_sum=0, rating_count=0, avg_rating=None)
+
+    def test_check_passes_when_aggregates_are_consistent(self):
+        out = StringIO()
+        call_command("rebuild_rating_aggregates", "--check", stdout=out)
+
+        self.assertIn("Found 0 stale", out.getvalue())
+
+    def test_check_reports_stale_aggregates(self):
+        self.corrupt()
+
+        with self.assertRaises(CommandError):
+            call_command("rebuild_rating_aggregates", "--check", stdout=StringIO())
+
+    def test_rebuild_fixes_stale_aggregates_in_batches(self):
+        self.corrupt()
+        out = StringIO()
+
+        call_command("rebuild_rating_aggregates", "--batch-size", "2", stdout=out)
+
+        self.assertIn("Rebuilt 2 stale", out.getvalue())
+        for book in self.books:
+            book.refresh_from_db()
+        self.assertEqual(
+            [(book.rating_sum, book.rating_count, book.avg_rating) for book in self.books],
+            [(4, 1, 4.0), (2, 1, 2.0), (4, 1, 4.0)],
+        )
+        call_command("rebuild_rating_aggregates", "--check", stdout=StringIO())
@@ -0,0 +1,74 @@
+from io import StringIO
+
+from books.models import Author, Book, Comment, Favorite, Rating
+from books.utils.ratings import find_stale_rating_aggregates
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import Count
+from django.test import TestCase
+
+User = get_user_model()
+
+SIZES = [
+    "--books=60",
+    "--users=60",
+    "--authors=12",
+    "--translators=4",
+    "--publishers=5",
+    "--categories=3",
+    "--languages=3",
+    "--content-formats=2",
+    "--ratings=300",
+    "--favorites=120",
+    "--comments=50",
+    "--batch-size=40",
+]
+
+
+class TestSeedScaleDataCommand(TestCase):
+
+    def seed(self, *args):
+        call_command("seed_scale_data", *SIZES, *args, stdout=StringIO())
+
+    def snapshot(self):
+        return (
+            list(Book.objects.order_by("pk").values_list("name", "publisher__name", "price", "datetime_created")),
+            list(Book.authors.through.objects.order_by("pk").values_list("book__name", "author__name")),
+            list(Rating.objects.order_by("pk").values_list("user__username", "book__name", "score")),
+            list(Comment.objects.order_by("pk").values_list("book__name", "body", "status")),
+        )
+
+    def test_generates_the_requested_graph(self):
+        self.seed()
+
+        self.assertEqual(Book.objects.count(), 60)
+        self.assertEqual(User.objects.count(), 60)
+        self.assertEqual(Author.objects.count(), 12)
+        self.assertEqual(Rating.objects.count(), 300)
+        self.assertEqual(Favorite.objects.count(), 120)
+        self.assertEqual(Comment.objects.count(), 50)
+        self.assertFalse(Book.objects.filter(authors=None).exists())
+        self.assertEqual(find_stale_rating_aggregates(list(Book.objects.all())), [])
+
+    def test_popularity_is_skewed(self):
+        self.seed("--zipf-exponent=1.2")
+
+        counts = list(Rating.objects.values("book").annotate(n=Count("id")).order_by("-n").values_list("n", flat=True))
+        self.assertGreater(counts[0], 4 * counts[len(counts) // 2])
+
+    def test_same_seed_gives_the_same_data(self):
+        self.seed("--seed=7")
+        first = self.snapshot()
+
+        self.seed("--seed=7", "--flush")
+        self.assertEqual(self.snapshot(), first)
+
+        self.seed("--seed=8", "--flush")
+        self.assertNotEqual(self.snapshot(), first)
+
+    def test_refuses_to_seed_over_an_existing_catalog(self):
+        self.seed()
+
+        with self.assertRaises(CommandError):
+            self.seed()
@@ -0,0 +1,61 @@
+import json
+from io import StringIO
+
+from core.queries.slow import get_slow_queries, push_slow_query
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+
+
+class TestSlowQueriesCommand(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def push(self, fingerprint, duration_ms, at, view="GET book-list"):
+        push_slow_query(
+            {
+                "fingerprint": fingerprint,
+                "sql": f'SELECT * FROM "books_book" WHERE "name" LIKE ? -- {fingerprint}',
+                "duration_ms": duration_ms,
+                "view": view,
+                "call_site": "books/views.py:80 in render_list",
+                "database": "default",
+                "at": at,
+                "plan": [{"Plan": {"Node Type": "Seq Scan"}}],
+            }
+        )
+
+    def run_command(self, *args):
+        stdout = StringIO()
+        call_command("slow_queries", *args, stdout=stdout, stderr=StringIO())
+        return stdout.getvalue()
+
+    def test_reports_nothing_on_an_empty_buffer(self):
+        self.assertIn("No statements over", self.run_command())
+
+    def test_aggregates_by_fingerprint(self):
+        self.push("search", 300, 1)
+        self.push("search", 500, 2, view="GET book-facets")
+        self.push("detail", 250, 3)
+
+        output = self.run_command("--plans")
+
+        lines = output.splitlines()
+        self.assertIn("3 slow statements, 2 fingerprints shown", lines[0])
+        search = next(line for line in lines if line.startswith("search"))
+        self.assertEqual(search.split()[:5], ["search", "2", "800.0", "400.0", "500.0"])
+        self.assertLess(output.index("search"), output.index("detail"))
+        self.assertIn("views: GET book-facets, GET book-list", output)
+        self.assertIn('"Node Type": "Seq Scan"', output)
+
+    def test_json_sort_limit_and_clear(self):
+        self.push("search", 300, 1)
+        self.push("search", 300, 2)
+        self.push("detail", 450, 3)
+
+        report = json.loads(self.run_command("--json", "--sort=max_ms", "--limit=1", "--clear"))
+
+        self.assertEqual(report["count"], 3)
+        self.assertEqual([group["fingerprint"] for group in report["fingerprints"]], ["detail"])
+        self.assertEqual(get_slow_queries(), [])
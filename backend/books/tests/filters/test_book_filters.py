@@ -0,0 +1,81 @@
+from datetime import date, timedelta
+
+from books.filters.book_filters import BookFilter
+from books.models import Author, Book, Category, ContentFormat, Language, Publisher, Translator
+from django.test import TestCase
+
+
+class TestBookFilter(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tolstoy = Author.objects.create(name="Leo Tolstoy")
+        cls.austen = Author.objects.create(name="Jane Austen")
+        cls.translator = Translator.objects.create(name="Constance Garnett")
+        cls.penguin = Publisher.objects.create(name="Penguin Classics")
+        cls.vintage = Publisher.objects.create(name="Vintage")
+        cls.novel = Category.objects.create(title="Novel")
+        cls.english = Language.objects.create(name="English")
+        cls.persian = Language.objects.create(name="Persian")
+        cls.pdf = ContentFormat.objects.create(name="PDF")
+        cls.epub = ContentFormat.objects.create(name="EPUB")
+
+        cls.war_and_peace = cls.create_book("War and Peace", cls.penguin)
+        cls.war_and_peace.authors.add(cls.tolstoy)
+        cls.war_and_peace.translators.add(cls.translator)
+        cls.war_and_peace.languages.add(cls.english, cls.persian)
+        cls.war_and_peace.content_formats.add(cls.pdf, cls.epub)
+
+        cls.emma = cls.create_book("Emma", cls.vintage)
+        cls.emma.authors.add(cls.austen, cls.tolstoy)
+        cls.emma.languages.add(cls.english)
+        cls.emma.content_formats.add(cls.epub)
+
+    @classmethod
+    def create_book(cls, name, publisher):
+        return Book.objects.create(
+            name=name,
+            description="Desc",
+            publisher=publisher,
+            category=cls.novel,
+            volume=10,
+            number_of_pages=100,
+            approximate_study_time=timedelta(days=1),
+            publication_date=date(2024, 1, 1),
+        )
+
+    def filter_ids(self, **params):
+        queryset = BookFilter(data=params, queryset=Book.objects.order_by("name")).qs
+        return list(queryset.values_list("id", flat=True))
+
+    def test_search_matches_book_author_translator_and_publisher_names(self):
+        self.assertEqual(self.filter_ids(search="peace"), [self.war_and_peace.id])
+        self.assertEqual(self.filter_ids(search="austen"), [self.emma.id])
+        self.assertEqual(self.filter_ids(search="garnett"), [self.war_and_peace.id])
+        self.assertEqual(self.filter_ids(search="vintage"), [self.emma.id])
+
+    def test_relational_filters(self):
+        self.assertEqual(self.filter_ids(author="tolstoy"), [self.emma.id, self.war_and_peace.id])
+        self.assertEqual(self.filter_ids(translator="garnett"), [self.war_and_peace.id])
+        self.assertEqual(self.filter_ids(publisher="penguin"), [self.war_and_peace.id])
+        self.assertEqual(self.filter_ids(language="persian"), [self.war_and_peace.id])
+        self.assertEqual(self.filter_ids(formats="pdf"), [self.war_and_peace.id])
+
+    def test_combined_filters(self):
+        self.assertEqual(
+            self.filter_ids(author="tolstoy", formats="epub", language="english"),
+            [self.emma.id, self.war_and_peace.id],
+        )
+        self.assertEqual(self.filter_ids(author="austen", publisher="penguin"), [])
+
+    def test_category_filter(self):
+        self.assertEqual(self.filter_ids(category="nov"), [self.emma.id, self.war_and_peace.id])
+
+    def test_relational_filters_do_not_join_m2m_tables(self):
+        params = {"author": "tolstoy", "search": "a", "formats": "pub"}
+        queryset = BookFilter(data=params, queryset=Book.objects.all()).qs
+        sql = str(queryset.query)
+
+        self.assertIn("EXISTS", sql)
+        self.assertNotIn("DISTINCT", sql)
+        self.assertNotIn('JOIN "books_book_authors"', sql)
@@ -1,4 +1,7 @@
-from books.models import Author
+from datetime import date, timedelta
+from unittest import mock
+
+from books.models import Author, Book, Category, Publisher
 from django.core.exceptions import ValidationError
 from django.db.utils import IntegrityError
 from django.test import TestCase
@@ -33,3 +36,27 @@ class TestAuthorModel(TestCase):
     def test_str_method_returns_name(self):
         author = Author.objects.create(name="Str Test")
         self.assertEqual(str(author), "Str Test")
+
+    # @ Search vectors are PostgreSQL-only, so the refresh itself is stubbed and only its target is checked
+    def test_deleting_author_refreshes_search_vectors_of_their_books(self):
+        author = Author.objects.create(name="Deleted Author")
+        book = Book.objects.create(
+            name="Orphaned Book",
+            description="Desc",
+            publisher=Publisher.objects.create(name="Publisher"),
+            category=Category.objects.create(title="Category"),
+            volume=1,
+            number_of_pages=10,
+            approximate_study_time=timedelta(days=1),
+            publication_date=date(2024, 1, 1),
+        )
+        book.authors.add(author)
+
+        with (
+            mock.patch("books.signals.book_search.is_search_vector_supported", return_value=True),
+            mock.patch("books.signals.book_search.refresh_search_vectors") as refresh,
+        ):
+            author.delete()
+
+        refresh.assert_called_once()
+        self.assertEqual(list(refresh.call_args.args[0]), [book])
@@ -80,3 +80,99 @@ class RatingModelTest(TestCase):
 
         expected_str = f"{self.user} rated {self.book} -> {rating.score}"
         self.assertEqual(str(rating), expected_str)
+
+
+class RatingAggregateTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="jack", email="jack@test.com", password="123456", phone_number="0452384156"
+        )
+        self.other_user = User.objects.create_user(
+            username="sarah", email="sarah@test.com", password="123456", phone_number="0452484156"
+        )
+
+        publisher = Publisher.objects.create(name="Test Publisher")
+        category = Category.objects.create(title="Test Category")
+        book_data = {
+            "description": "Test Description",
+            "publisher": publisher,
+            "category": category,
+            "volume": 10,
+            "number_of_pages": 100,
+            "approximate_study_time": timedelta(hours=5),
+            "publication_date": date.today(),
+        }
+        self.book = Book.objects.create(name="Book A", **book_data)
+        self.other_book = Book.objects.create(name="Book B", **book_data)
+
+    def assertAggregates(self, book, rating_sum, rating_count, avg_rating):
+        book.refresh_from_db()
+        self.assertEqual(book.rating_sum, rating_sum)
+        self.assertEqual(book.rating_count, rating_count)
+        if avg_rating is None:
+            self.assertIsNone(book.avg_rating)
+        else:
+            self.assertAlmostEqual(book.avg_rating, avg_rating)
+
+    # @ New book starts without any rating
+    def test_new_book_has_empty_aggregates(self):
+        self.assertAggregates(self.book, 0, 0, None)
+
+    # @ Creating ratings increments the aggregates
+    def test_create_rating_updates_aggregates(self):
+        Rating.objects.create(user=self.user, book=self.book, score=4)
+        Rating.objects.create(user=self.other_user, book=self.book, score=5)
+
+        self.assertAggregates(self.book, 9, 2, 4.5)
+
+    # @ Changing a score applies only the difference
+    def test_update_rating_score_updates_aggregates(self):
+        rating = Rating.objects.create(user=self.user, book=self.book, score=2)
+        Rating.objects.create(user=self.other_user, book=self.book, score=4)
+
+        rating.score = 5
+        rating.save()
+
+        self.assertAggregates(self.book, 9, 2, 4.5)
+
+    # @ Moving a rating to another book updates both books
+    def test_move_rating_to_other_book_updates_both_books(self):
+        rating = Rating.objects.create(user=self.user, book=self.book, score=3)
+
+        rating.book = self.other_book
+        rating.save()
+
+        self.assertAggregates(self.book, 0, 0, None)
+        self.assertAggregates(self.other_book, 3, 1, 3.0)
+
+    # @ Deleting ratings decrements the aggregates back to empty
+    def test_delete_rating_updates_aggregates(self):
+        rating = Rating.objects.create(user=self.user, book=self.book, score=3)
+        Rating.objects.create(user=self.other_user, book=self.book, score=5)
+
+        rating.delete()
+        self.assertAggregates(self.book, 5, 1, 5.0)
+
+        Rating.objects.filter(user=self.other_user).first().delete()
+        self.assertAggregates(self.book, 0, 0, None)
+
+    # @ Deleting a user cascades to their ratings
+    def test_deleting_user_updates_aggregates(self):
+        Rating.objects.create(user=self.user, book=self.book, score=1)
+        Rating.objects.create(user=self.other_user, book=self.book, score=5)
+
+        self.user.delete()
+
+        self.assertAggregates(self.book, 5, 1, 5.0)
+
+    # @ Saving a copy loaded before the rating must not write its old aggregates back
+    def test_saving_stale_book_keeps_aggregates(self):
+        stale = Book.objects.get(pk=self.book.pk)
+        Rating.objects.create(user=self.user, book=self.book, score=4)
+
+        stale.name = "Book A, revised"
+        stale.save()
+
+        self.assertAggregates(self.book, 4, 1, 4.0)
+        self.assertEqual(self.book.name, "Book A, revised")
@@ -0,0 +1,218 @@
+from datetime import date, timedelta
+from unittest import skipUnless
+
+from books.models import Author, Book, Category, Publisher
+from books.utils.search import search_books
+from core.pagination.books import BookPagination
+from core.pagination.counts import StrategyPaginator
+from core.pagination.cursor import decode_cursor, encode_cursor, get_keyset_ordering, get_position, seek_filter
+from django.core.cache import cache
+from django.core.paginator import EmptyPage
+from django.db import connection
+from django.db.models import ExpressionWrapper, F, FloatField
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+
+class TestBookCursorPagination(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.publisher = Publisher.objects.create(name="Test Publisher")
+        self.category = Category.objects.create(title="Test Category")
+        self.author = Author.objects.create(name="Jane Austen")
+
+        self.books = []
+        for i in range(12):
+            book = Book.objects.create(
+                name=f"Book {i+1}",
+                description="Desc",
+                # @ duplicated prices exercise the id tie-breaker
+                price=100 * (i // 3),
+                publisher=self.publisher,
+                category=self.category,
+                volume=10,
+                number_of_pages=100,
+                approximate_study_time=timedelta(days=5),
+                publication_date=date(2025, 1, 1),
+            )
+            if i % 2 == 0:
+                book.authors.add(self.author)
+            self.books.append(book)
+
+        self.url = "/api/books/"
+
+    def walk(self, url):
+        ids = []
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            data = response.json()
+            pages.append(data)
+            ids.extend(book["id"] for book in data["results"])
+            url = data["next"]
+        return ids, pages
+
+    def test_cursor_mode_walks_all_books_in_default_order(self):
+        ids, pages = self.walk(self.url + "?cursor=&page_size=5")
+
+        expected = [book.id for book in sorted(self.books, key=lambda b: (b.datetime_created, b.id), reverse=True)]
+        self.assertEqual(ids, expected)
+        self.assertEqual([len(page["results"]) for page in pages], [5, 5, 2])
+        self.assertIsNone(pages[0]["previous"])
+        self.assertIsNone(pages[0]["count"])
+        self.assertEqual(pages[0]["page_size"], 5)
+
+    def test_cursor_mode_respects_ordering_with_ties(self):
+        ids, _ = self.walk(self.url + "?cursor=&page_size=4&ordering=-price")
+
+        expected = [book.id for book in sorted(self.books, key=lambda b: (b.price, b.id), reverse=True)]
+        self.assertEqual(ids, expected)
+
+    def test_cursor_mode_previous_link_returns_previous_page(self):
+        first = self.client.get(self.url + "?cursor=&page_size=5&ordering=price").json()
+        second = self.client.get(first["next"]).json()
+        back = self.client.get(second["previous"]).json()
+
+        self.assertEqual(back["results"], first["results"])
+        self.assertIsNone(back["previous"])
+        self.assertEqual(back["next"], first["next"])
+
+    def test_cursor_mode_works_with_filters(self):
+        ids, _ = self.walk(self.url + "?cursor=&page_size=2&author=austen&ordering=datetime_modified")
+
+        expected = [book.id for book in self.books[::2]]
+        self.assertEqual(ids, expected)
+
+    # @ Same shape as search_books' "-search_rank" ordering, which is an annotation rather than a field
+    def test_cursor_mode_keysets_on_annotations(self):
+        queryset = Book.objects.annotate(
+            search_rank=ExpressionWrapper(F("price") / 3.0, output_field=FloatField())
+        ).order_by("-search_rank", "-datetime_created")
+
+        ids, token = [], ""
+        while token is not None:
+            pagination = BookPagination()
+            request = Request(APIRequestFactory().get(self.url, {"cursor": token, "page_size": 5}))
+            ids.extend(book.id for book in pagination.paginate_queryset(queryset, request))
+            token = pagination.next_cursor
+
+        expected = [
+            book.id for book in sorted(self.books, key=lambda b: (b.price, b.datetime_created, b.id), reverse=True)
+        ]
+        self.assertEqual(ids, expected)
+
+    # @ Every book has the same description, so all of them tie on a real ts_rank value
+    @skipUnless(connection.vendor == "postgresql", "ts_rank needs PostgreSQL")
+    def test_cursor_seeks_past_a_real_search_rank(self):
+        queryset = search_books(Book.objects.all(), "desc")
+        ordering = get_keyset_ordering(queryset)
+        rows = list(queryset)
+
+        token = encode_cursor(get_position(rows[4], ordering))
+        position, reverse = decode_cursor(token, queryset, ordering)
+        following = queryset.filter(seek_filter(ordering, position, reverse=reverse))
+
+        self.assertEqual(len(rows), 12)
+        self.assertGreater(rows[4].search_rank, 0)
+        self.assertEqual([book.id for book in following], [book.id for book in rows[5:]])
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get(self.url + "?cursor=not-a-cursor")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_page_number_mode_is_unchanged_without_cursor(self):
+        data = self.client.get(self.url + "?page=2").json()
+
+        self.assertEqual(data["count"], 12)
+        self.assertEqual(data["pages"], 2)
+        self.assertEqual(data["page"], 2)
+
+
+class TestBookPaginationCount(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.publisher = Publisher.objects.create(name="Test Publisher")
+        self.category = Category.objects.create(title="Test Category")
+        for i in range(12):
+            self.create_book(f"Book {i+1}")
+
+        self.url = "/api/books/"
+
+    def create_book(self, name):
+        return Book.objects.create(
+            name=name,
+            description="Desc",
+            publisher=self.publisher,
+            category=self.category,
+            volume=10,
+            number_of_pages=100,
+            approximate_study_time=timedelta(days=5),
+            publication_date=date(2025, 1, 1),
+        )
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            data = self.client.get(url).json()
+        count_queries = [q for q in context.captured_queries if "COUNT(" in q["sql"]]
+        return data, len(count_queries)
+
+    def test_count_is_cached_across_pages_of_same_filter_set(self):
+        first, first_counts = self.count_queries(self.url + "?page=1&category=test")
+        second, second_counts = self.count_queries(self.url + "?category=test&page=2&ordering=price")
+
+        self.assertEqual(first_counts, 1)
+        self.assertEqual(second_counts, 0)
+        self.assertEqual(second["count"], 12)
+        self.assertFalse(second["count_is_approximate"])
+
+    def test_count_cache_is_separate_per_filter_set(self):
+        self.count_queries(self.url + "?category=test")
+        data, counts = self.count_queries(self.url + "?category=nothing")
+
+        self.assertEqual(counts, 1)
+        self.assertEqual(data["count"], 0)
+
+    def test_book_write_invalidates_cached_count(self):
+        self.count_queries(self.url)
+        self.create_book("Book 13")
+
+        data, counts = self.count_queries(self.url)
+
+        self.assertEqual(counts, 1)
+        self.assertEqual(data["count"], 13)
+
+
+class ApproximateCountStrategy:
+    is_approximate = True
+
+    def __init__(self, estimate):
+        self.estimate = estimate
+
+    def count(self, queryset):
+        return self.estimate
+
+
+class TestStrategyPaginator(TestCase):
+    def test_approximate_undercount_still_serves_every_page(self):
+        paginator = StrategyPaginator(list(range(25)), 10, count_strategy=ApproximateCountStrategy(5))
+
+        self.assertEqual(paginator.num_pages, 1)
+        self.assertTrue(paginator.page(1).has_next())
+        self.assertEqual(list(paginator.page(3)), [20, 21, 22, 23, 24])
+        self.assertFalse(paginator.page(3).has_next())
+        with self.assertRaises(EmptyPage):
+            paginator.page(4)
+
+    def test_exact_count_keeps_default_paginator_behaviour(self):
+        paginator = StrategyPaginator(list(range(25)), 10)
+
+        self.assertEqual(paginator.count, 25)
+        self.assertFalse(paginator.is_approximate)
+        with self.assertRaises(EmptyPage):
+            paginator.page(4)
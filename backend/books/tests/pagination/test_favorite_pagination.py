@@ -74,3 +74,20 @@ class TestFavoritePagination(TestCase):
         self.assertEqual(data["page"], 3)
         self.assertEqual(data["next"], None)
         self.assertEqual(data["previous"], f"http://testserver/api/favorites/?page=2")
+
+    def test_favorite_cursor_pagination_walks_all_favorites(self):
+        url = self.url + "?cursor="
+        book_ids = []
+        while url:
+            data = self.client.get(url).json()
+            book_ids.extend(favorite["book"] for favorite in data["results"])
+            url = data["next"]
+
+        self.assertEqual(book_ids, [book.id for book in reversed(self.books)])
+
+    def test_favorite_count_reflects_toggle(self):
+        self.assertEqual(self.client.get(self.url).json()["count"], 12)
+
+        self.client.post(self.url, {"book": self.books[0].id})
+
+        self.assertEqual(self.client.get(self.url).json()["count"], 11)
@@ -0,0 +1,108 @@
+from datetime import date, timedelta
+
+from books.models import (
+    Author,
+    Book,
+    BookImage,
+    Category,
+    ContentFormat,
+    Language,
+    Publisher,
+    Rating,
+    Translator,
+)
+from books.serializers.book_serializers import BookListSerializer, BookSerializer
+from books.serializers.fast_book_serializers import build_book_representation
+from books.utils.fieldsets import prune_book_queryset
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+User = get_user_model()
+
+
+class TestFastBookSerializerParity(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(username="jack", email="jack@test.com", password="123456", phone_number="1")
+        publishers = [Publisher.objects.create(name=f"Publisher {i}", about="About") for i in range(2)]
+        categories = [Category.objects.create(title=f"Category {i}", description="Desc") for i in range(2)]
+        authors = [Author.objects.create(name=f"Author {i}", biography="Bio") for i in range(3)]
+        translator = Translator.objects.create(name="Translator", about="About")
+        language = Language.objects.create(name="English")
+        content_format = ContentFormat.objects.create(name="EPUB")
+
+        for i in range(6):
+            book = Book.objects.create(
+                name=f"Book {i}",
+                description=f"Description {i}",
+                publisher=publishers[i % 2],
+                category=categories[i % 2],
+                price=1000 * i,
+                active=i % 2 == 0,
+                volume=i + 1,
+                number_of_pages=100 + i,
+                approximate_study_time=timedelta(days=i, hours=3, minutes=15, seconds=7),
+                publication_date=date(2020, 1, i + 1),
+            )
+            book.authors.add(*authors[: i % 3 + 1])
+            if i % 2:
+                book.translators.add(translator)
+            book.languages.add(language)
+            book.content_formats.add(content_format)
+            if i % 3 == 0:
+                Rating.objects.create(user=user, book=book, score=i % 5 + 1)
+            if i % 2 == 0:
+                image = BookImage.objects.create(book=book, description="Cover back")
+                BookImage.objects.filter(pk=image.pk).update(image=f"books/images/{book.id}_{image.id}.jpg")
+                Book.objects.filter(pk=book.pk).update(cover_image=f"books/covers/{book.id}.jpg")
+
+    def setUp(self):
+        cache.clear()
+        self.request = APIRequestFactory().get("/api/books/")
+        self.request.user = AnonymousUser()
+
+    def render(self, data):
+        return JSONRenderer().render(data)
+
+    def assertParity(self, serializer_class, selected_fields=None):
+        context = {"request": self.request, "selected_fields": selected_fields}
+        queryset = prune_book_queryset(Book.objects.order_by("id"), selected_fields)
+        expected = serializer_class(queryset, many=True, context=context).data
+
+        representation = build_book_representation(serializer_class(context=context))
+        rows = list(Book.objects.order_by("id").values(*representation.columns))
+
+        self.assertEqual(self.render(representation.represent(rows)), self.render(expected))
+
+    def test_full_representation_is_byte_identical(self):
+        self.assertParity(BookSerializer)
+
+    def test_sparse_representation_is_byte_identical(self):
+        self.assertParity(BookSerializer, ["id", "name", "images", "publisher", "approximate_study_time", "my_rating"])
+
+    def test_list_representation_is_byte_identical(self):
+        self.assertParity(BookListSerializer)
+
+    def test_list_endpoint_output_matches_serializer_path(self):
+        urls = [
+            "/api/books/",
+            "/api/books/?page=2&page_size=4&ordering=price",
+            "/api/books/?include=images,authors,translators,publisher,category,languages,content_formats",
+            "/api/books/?fields=name,cover_image,avg_rating&author=author 2",
+            "/api/books/?cursor=&page_size=4&ordering=-datetime_modified",
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                fast = self.client.get(url)
+                cache.clear()
+                with override_settings(BOOK_LIST_FAST_PATH=False):
+                    slow = self.client.get(url)
+                cache.clear()
+
+                self.assertEqual(fast.status_code, 200)
+                self.assertEqual(fast.content, slow.content)
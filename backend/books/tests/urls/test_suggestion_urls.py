@@ -0,0 +1,12 @@
+from books.views import SuggestionView
+from django.test import SimpleTestCase
+from django.urls import resolve, reverse
+
+
+class TestSuggestionUrls(SimpleTestCase):
+    def test_suggest_url_resolves(self):
+        url = reverse("suggest")
+        self.assertEqual(url, "/api/suggest/")
+        self.assertEqual(
+            resolve(url).func.view_class, SuggestionView, "The 'suggest' URL should resolve to SuggestionView"
+        )
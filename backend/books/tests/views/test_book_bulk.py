@@ -0,0 +1,84 @@
+from datetime import date, timedelta
+
+from books.models import Author, Book, Category, Favorite, Publisher, Rating
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+User = get_user_model()
+
+
+class TestBookBulkLookup(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="bulk", email="bulk@test.com", password="password123", phone_number="0452384158"
+        )
+        self.publisher = Publisher.objects.create(name="Penguin")
+        self.category = Category.objects.create(title="Novel")
+        self.author = Author.objects.create(name="Hafez")
+        self.books = [self.create_book(f"Book {i}") for i in range(5)]
+        for book in self.books:
+            book.authors.add(self.author)
+        self.url = reverse("book-bulk")
+
+    def create_book(self, name):
+        return Book.objects.create(
+            name=name,
+            description="Desc",
+            publisher=self.publisher,
+            category=self.category,
+            price=100,
+            volume=10,
+            number_of_pages=100,
+            approximate_study_time=timedelta(days=1),
+            publication_date=date(2024, 1, 1),
+        )
+
+    def get_bulk(self, ids, **params):
+        return self.client.get(self.url, {"ids": ",".join(str(pk) for pk in ids), **params})
+
+    def test_returns_books_in_request_order(self):
+        ids = [self.books[3].pk, self.books[0].pk, self.books[4].pk]
+        response = self.get_bulk(ids)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()["results"]
+        self.assertEqual([book["id"] for book in results], ids)
+        self.assertEqual(results[0]["authors"][0]["name"], "Hafez")
+
+    def test_unknown_and_duplicate_ids_are_skipped(self):
+        ids = [self.books[1].pk, 999_999, self.books[1].pk, self.books[2].pk]
+        results = self.get_bulk(ids).json()["results"]
+
+        self.assertEqual([book["id"] for book in results], [self.books[1].pk, self.books[2].pk])
+
+    def test_query_count_does_not_grow_with_ids(self):
+        with self.assertNumQueries(6):  # @ books + one prefetch per to-many relation
+            self.get_bulk([book.pk for book in self.books[:2]])
+        cache.clear()
+        with self.assertNumQueries(6):
+            self.get_bulk([book.pk for book in self.books])
+
+    def test_fieldsets_are_supported(self):
+        results = self.get_bulk([self.books[0].pk], fields="id,name").json()["results"]
+
+        self.assertEqual(results, [{"id": self.books[0].pk, "name": "Book 0"}])
+
+    def test_user_overlay_is_applied(self):
+        Favorite.objects.create(user=self.user, book=self.books[0])
+        Rating.objects.create(user=self.user, book=self.books[1], score=3)
+        self.client.force_authenticate(user=self.user)
+
+        results = self.get_bulk([self.books[0].pk, self.books[1].pk]).json()["results"]
+
+        self.assertEqual([book["is_favorited"] for book in results], [True, False])
+        self.assertEqual([book["my_rating"] for book in results], [None, 3])
+
+    def test_invalid_ids_are_rejected(self):
+        self.assertEqual(self.client.get(self.url, {"ids": "1,abc"}).status_code, status.HTTP_400_BAD_REQUEST)
+
+        too_many = self.get_bulk(range(1, 202))
+        self.assertEqual(too_many.status_code, status.HTTP_400_BAD_REQUEST)
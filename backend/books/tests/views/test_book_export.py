@@ -0,0 +1,64 @@
+import json
+from datetime import date, datetime, timedelta, timezone
+
+from books.models import Author, Book, Category, Publisher
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+
+class TestBookExport(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.publisher = Publisher.objects.create(name="Publisher A")
+        self.category = Category.objects.create(title="Category A")
+        self.author = Author.objects.create(name="Author A")
+        self.books = []
+        for i in range(5):
+            book = Book.objects.create(
+                name=f"Book {i}",
+                description="Desc",
+                publisher=self.publisher,
+                category=self.category,
+                price=100 + i,
+                volume=10,
+                number_of_pages=100,
+                approximate_study_time=timedelta(days=1),
+                publication_date=date(2024, 1, 1),
+            )
+            book.authors.add(self.author)
+            self.books.append(book)
+        self.url = reverse("book-export")
+
+    def read_export(self, response):
+        body = b"".join(response.streaming_content)
+        return [json.loads(line) for line in body.splitlines()]
+
+    @override_settings(CATALOG_EXPORT_CHUNK_SIZE=2)
+    def test_streams_every_book_with_detail_fields(self):
+        # @ Per chunk of 2: books are one streaming query, then one query per to-many relation
+        response = self.client.get(self.url)
+        with self.assertNumQueries(1 + 3 * 5):
+            books = self.read_export(response)
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual([book["id"] for book in books], [book.id for book in self.books])
+        detail = self.client.get(reverse("book-detail", args=[self.books[0].pk])).json()
+        self.assertEqual(books[0], {name: value for name, value in detail.items() if name in books[0]})
+        self.assertNotIn("is_favorited", books[0])
+
+    def test_since_limits_to_recently_modified_books(self):
+        cutoff = datetime(2030, 1, 1, tzinfo=timezone.utc)
+        Book.objects.filter(pk__in=[self.books[1].pk, self.books[3].pk]).update(datetime_modified=cutoff)
+
+        books = self.read_export(self.client.get(self.url, {"since": "2030-01-01T00:00:00Z"}))
+
+        self.assertEqual([book["id"] for book in books], [self.books[1].id, self.books[3].id])
+
+    def test_invalid_since_is_rejected(self):
+        response = self.client.get(self.url, {"since": "yesterday"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("since", json.loads(response.content))
@@ -0,0 +1,106 @@
+from datetime import date, timedelta
+
+from books.models import Author, Book, Category, ContentFormat, Language, Publisher
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+
+class TestBookFacets(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.novel = Category.objects.create(title="Novel")
+        self.poetry = Category.objects.create(title="Poetry")
+        self.penguin = Publisher.objects.create(name="Penguin")
+        self.vintage = Publisher.objects.create(name="Vintage")
+        self.english = Language.objects.create(name="English")
+        self.persian = Language.objects.create(name="Persian")
+        self.pdf = ContentFormat.objects.create(name="PDF")
+        self.author = Author.objects.create(name="Hafez")
+
+        self.free_novel = self.create_book("Free Novel", self.novel, self.penguin, 0)
+        self.free_novel.languages.add(self.english, self.persian)
+        self.free_novel.content_formats.add(self.pdf)
+
+        self.cheap_novel = self.create_book("Cheap Novel", self.novel, self.vintage, 20_000)
+        self.cheap_novel.languages.add(self.english)
+
+        self.divan = self.create_book("Divan", self.poetry, self.penguin, 600_000)
+        self.divan.languages.add(self.persian)
+        self.divan.authors.add(self.author)
+
+        self.url = reverse("book-facets")
+
+    def create_book(self, name, category, publisher, price):
+        return Book.objects.create(
+            name=name,
+            description="Desc",
+            publisher=publisher,
+            category=category,
+            price=price,
+            volume=10,
+            number_of_pages=100,
+            approximate_study_time=timedelta(days=1),
+            publication_date=date(2024, 1, 1),
+        )
+
+    def test_facets_for_whole_catalog(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["count"], 3)
+        self.assertEqual(
+            data["categories"],
+            [
+                {"id": self.novel.id, "title": "Novel", "count": 2},
+                {"id": self.poetry.id, "title": "Poetry", "count": 1},
+            ],
+        )
+        self.assertEqual(
+            data["publishers"],
+            [
+                {"id": self.penguin.id, "name": "Penguin", "count": 2},
+                {"id": self.vintage.id, "name": "Vintage", "count": 1},
+            ],
+        )
+        self.assertEqual(
+            data["languages"],
+            [
+                {"id": self.english.id, "name": "English", "count": 2},
+                {"id": self.persian.id, "name": "Persian", "count": 2},
+            ],
+        )
+        self.assertEqual(data["content_formats"], [{"id": self.pdf.id, "name": "PDF", "count": 1}])
+        self.assertEqual(
+            [(bucket["min"], bucket["max"], bucket["count"]) for bucket in data["price"]],
+            [
+                (0, 0, 1),
+                (1, 50_000, 1),
+                (50_000, 100_000, 0),
+                (100_000, 250_000, 0),
+                (250_000, 500_000, 0),
+                (500_000, None, 1),
+            ],
+        )
+
+    def test_facets_apply_book_filters(self):
+        data = self.client.get(self.url, {"language": "persian"}).json()
+
+        self.assertEqual(data["count"], 2)
+        self.assertEqual(data["publishers"], [{"id": self.penguin.id, "name": "Penguin", "count": 2}])
+
+    def test_facets_use_a_fixed_number_of_queries(self):
+        with self.assertNumQueries(5):
+            self.client.get(self.url, {"category": "o"})
+
+    def test_facets_are_cached_per_filter_set_until_catalog_changes(self):
+        self.client.get(self.url, {"category": "novel", "page": 1})
+        with self.assertNumQueries(0):
+            self.client.get(self.url, {"category": "novel", "ordering": "price"})
+
+        self.create_book("Another Novel", self.novel, self.vintage, 70_000)
+        data = self.client.get(self.url, {"category": "novel"}).json()
+
+        self.assertEqual(data["count"], 3)
@@ -0,0 +1,103 @@
+from datetime import date, timedelta
+
+from books.models import Author, Book, BookImage, Category, Favorite, Language, Publisher
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+User = get_user_model()
+
+
+class TestBookSparseFieldsets(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="jack",
+            email="jack@test.com",
+            password="password123",
+            phone_number="0452384156",
+        )
+        self.publisher = Publisher.objects.create(name="Publisher A", about="A long about text")
+        self.category = Category.objects.create(title="Category A")
+        self.author = Author.objects.create(name="Author A", biography="A long biography")
+        self.language = Language.objects.create(name="English")
+        for i in range(3):
+            book = Book.objects.create(
+                name=f"Book {i}",
+                description="A long description",
+                publisher=self.publisher,
+                category=self.category,
+                price=100,
+                volume=10,
+                number_of_pages=100,
+                approximate_study_time=timedelta(days=1),
+                publication_date=date(2024, 1, 1),
+            )
+            book.authors.add(self.author)
+            book.languages.add(self.language)
+            BookImage.objects.create(book=book, description="Front")
+        self.book = book
+        self.url = reverse("book-list")
+
+    def test_default_detail_response_keeps_every_field(self):
+        book = self.client.get(reverse("book-detail", args=[self.book.pk])).json()
+
+        self.assertIn("description", book)
+        self.assertIn("images", book)
+        self.assertEqual(book["publisher"]["about"], "A long about text")
+
+    def test_fields_param_limits_output_and_keeps_id(self):
+        book = self.client.get(self.url, {"fields": "name,price"}).json()["results"][0]
+
+        self.assertEqual(set(book), {"id", "name", "price"})
+
+    def test_card_grid_fieldset_costs_count_plus_one_query(self):
+        with self.assertNumQueries(2):  # @ page count + rows
+            response = self.client.get(self.url, {"fields": "name,cover_image,price,avg_rating"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_include_param_selects_relations(self):
+        with self.assertNumQueries(3):  # @ page count + rows + authors prefetch
+            response = self.client.get(self.url, {"include": "authors,category"})
+
+        book = response.json()["results"][0]
+        self.assertEqual(book["authors"][0]["name"], "Author A")
+        self.assertEqual(book["category"]["title"], "Category A")
+        self.assertIn("description", book)
+        for relation in ["images", "translators", "publisher", "languages", "content_formats"]:
+            self.assertNotIn(relation, book)
+
+    def test_fields_and_include_combine(self):
+        book = self.client.get(self.url, {"fields": "name", "include": "languages"}).json()["results"][0]
+
+        self.assertEqual(set(book), {"id", "name", "languages"})
+
+    def test_unknown_names_are_rejected(self):
+        response = self.client.get(self.url, {"fields": "name,secret", "include": "comments"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("fields", response.json())
+        self.assertIn("include", response.json())
+
+    def test_detail_supports_fields(self):
+        response = self.client.get(reverse("book-detail", args=[self.book.pk]), {"fields": "name"})
+
+        self.assertEqual(response.json(), {"id": self.book.id, "name": self.book.name})
+
+    def test_user_overlay_only_fills_selected_fields(self):
+        Favorite.objects.create(user=self.user, book=self.book)
+        self.client.force_authenticate(user=self.user)
+
+        book = self.client.get(self.url, {"fields": "name,is_favorited"}).json()["results"][0]
+
+        self.assertEqual(set(book), {"id", "name", "is_favorited"})
+        self.assertTrue(book["is_favorited"])
+
+    def test_cursor_mode_works_with_sparse_fieldsets(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"fields": "name", "cursor": "", "page_size": 2})
+
+        self.assertIsNotNone(response.json()["next"])
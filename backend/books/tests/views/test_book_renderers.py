@@ -0,0 +1,84 @@
+import datetime
+import decimal
+from datetime import date, timedelta
+from unittest import skipIf
+
+from books.models import Author, Book, Category, Favorite, Publisher
+from core.renderers import ORJSONRenderer, msgpack
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+User = get_user_model()
+
+
+class TestBookRenderers(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.publisher = Publisher.objects.create(name="Publisher   A")
+        self.category = Category.objects.create(title="Category A")
+        self.author = Author.objects.create(name="حافظ")
+        self.book = Book.objects.create(
+            name="Book A",
+            description="Desc",
+            publisher=self.publisher,
+            category=self.category,
+            price=decimal.Decimal("1250.50"),
+            volume=10,
+            number_of_pages=100,
+            approximate_study_time=timedelta(days=1, hours=2, microseconds=5),
+            publication_date=date(2024, 1, 1),
+        )
+        self.book.authors.add(self.author)
+
+    def test_orjson_output_matches_drf_json_renderer(self):
+        data = self.client.get(reverse("book-detail", args=[self.book.pk])).data
+        extras = {
+            "decimal": decimal.Decimal("1.50"),
+            "duration": timedelta(minutes=3),
+            "utc": datetime.datetime(2024, 1, 1, 12, 30, tzinfo=datetime.timezone.utc),
+            "date": date(2024, 1, 1),
+            "ids": {1},
+            "separator": "line\u2028break",
+        }
+
+        for payload in (data, extras):
+            self.assertEqual(ORJSONRenderer().render(payload), JSONRenderer().render(payload))
+
+    # @ The renderer list is built from the DEBUG env var when settings load, so the expectation follows that list
+    def test_json_is_the_default_and_html_follows_the_configured_renderers(self):
+        browsable = (
+            "rest_framework.renderers.BrowsableAPIRenderer" in settings.REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"]
+        )
+        response = self.client.get(reverse("book-list"))
+        html = self.client.get(reverse("book-list"), HTTP_ACCEPT="text/html")
+
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(html.status_code, status.HTTP_200_OK if browsable else status.HTTP_406_NOT_ACCEPTABLE)
+
+    @skipIf(msgpack is None, "msgpack is not installed")
+    def test_msgpack_is_selected_by_accept(self):
+        url = reverse("book-detail", args=[self.book.pk])
+        json_data = self.client.get(url).json()
+
+        response = self.client.get(url, HTTP_ACCEPT="application/msgpack")
+
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        self.assertEqual(msgpack.unpackb(response.content), json_data)
+
+    def test_json_request_bodies_are_parsed(self):
+        user = User.objects.create_user(
+            username="jack", email="jack@test.com", password="password123", phone_number="0452384159"
+        )
+        self.client.force_authenticate(user=user)
+
+        response = self.client.post(reverse("favorite-list"), {"book": self.book.pk}, format="json")
+        malformed = self.client.post(reverse("favorite-list"), "{", content_type="application/json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(Favorite.objects.filter(user=user, book=self.book).exists())
+        self.assertEqual(malformed.status_code, status.HTTP_400_BAD_REQUEST)
@@ -1,10 +1,20 @@
+import tempfile
 from datetime import date, timedelta
 
-from books.models import Book, Category, Publisher
+from books.models import Author, Book, BookImage, Category, Favorite, Publisher, Rating
+from books.utils.favorites import get_favorite_membership
+from books.utils.fieldsets import BOOK_RELATION_FIELDS
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+User = get_user_model()
+
 
 class TestBookViewSetReadOnly(APITestCase):
     def setUp(self):
@@ -74,3 +84,298 @@ class TestBookViewSetReadOnly(APITestCase):
             {"GET", "HEAD", "OPTIONS"},
             "BookViewSet should only allow safe HTTP methods",
         )
+
+
+class TestBookViewSetResponseCache(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="jack",
+            email="jack@test.com",
+            password="password123",
+            phone_number="0452384156",
+        )
+        self.author = Author.objects.create(name="Author A")
+        self.publisher = Publisher.objects.create(name="Publisher A")
+        self.category = Category.objects.create(title="Category A")
+        self.book = Book.objects.create(
+            name="Book A",
+            description="Desc",
+            publisher=self.publisher,
+            category=self.category,
+            price=100,
+            volume=10,
+            number_of_pages=100,
+            approximate_study_time=timedelta(days=1),
+            publication_date=date(2024, 1, 1),
+        )
+        self.url = reverse("book-list")
+
+    def test_anonymous_list_is_served_from_cache_on_second_request(self):
+        first = self.client.get(self.url + "?page=1&ordering=price")
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url + "?ordering=price&page=1")
+
+        self.assertEqual(first["X-Cache"], "MISS")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(second.json(), first.json())
+
+    def test_anonymous_detail_is_cached(self):
+        url = reverse("book-detail", args=[self.book.pk])
+        self.client.get(url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+
+        self.assertEqual(response.json()["name"], "Book A")
+
+    def test_different_query_params_use_different_entries(self):
+        self.client.get(self.url + "?ordering=price")
+        response = self.client.get(self.url + "?ordering=-price")
+
+        self.assertEqual(response["X-Cache"], "MISS")
+
+    def test_authenticated_requests_share_cache_with_user_overlay(self):
+        Favorite.objects.create(user=self.user, book=self.book)
+        Rating.objects.create(user=self.user, book=self.book, score=4)
+        anonymous = self.client.get(self.url).json()["results"][0]
+
+        self.client.force_authenticate(user=self.user)
+        # @ One lookup for ratings, one for favorites; the shared payload comes from the cache
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+
+        book = response.json()["results"][0]
+        self.assertEqual(response["X-Cache"], "HIT")
+        self.assertIsNone(anonymous["my_rating"])
+        self.assertFalse(anonymous["is_favorited"])
+        self.assertEqual(book["my_rating"], 4)
+        self.assertTrue(book["is_favorited"])
+
+    @override_settings(FAVORITES_MEMBERSHIP_MAX_SIZE=3)
+    def test_favorite_lookup_is_limited_to_the_page(self):
+        others = [
+            Book.objects.create(
+                name=f"Other {i}",
+                description="Desc",
+                publisher=self.publisher,
+                category=self.category,
+                price=100,
+                volume=10,
+                number_of_pages=100,
+                approximate_study_time=timedelta(days=1),
+                publication_date=date(2024, 1, 1),
+            )
+            for i in range(5)
+        ]
+        Favorite.objects.bulk_create([Favorite(user=self.user, book=book) for book in [self.book, *others]])
+        self.client.force_authenticate(user=self.user)
+        get_favorite_membership(self.user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url + "?page_size=2")
+
+        page_ids = [book["id"] for book in response.json()["results"]]
+        favorite_sql = [query["sql"] for query in queries if '"books_favorite"' in query["sql"]]
+        self.assertEqual(len(favorite_sql), 1)
+        self.assertIn(f"IN ({page_ids[0]}, {page_ids[1]})", favorite_sql[0])
+
+    def test_user_overlay_does_not_leak_into_shared_cache(self):
+        Favorite.objects.create(user=self.user, book=self.book)
+        self.client.force_authenticate(user=self.user)
+        self.client.get(reverse("book-detail", args=[self.book.pk]))
+
+        self.client.force_authenticate(user=None)
+        response = self.client.get(reverse("book-detail", args=[self.book.pk]))
+
+        self.assertEqual(response["X-Cache"], "HIT")
+        self.assertFalse(response.json()["is_favorited"])
+
+    def assertWriteInvalidatesList(self, write):
+        self.client.get(self.url)
+        write()
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        return response
+
+    def test_m2m_change_invalidates_cached_list(self):
+        self.assertWriteInvalidatesList(lambda: self.book.authors.add(self.author))
+
+    def test_related_writes_invalidate_cached_list(self):
+        def rename_publisher():
+            self.publisher.name = "Publisher B"
+            self.publisher.save()
+
+        self.assertWriteInvalidatesList(self.author.save)
+        self.assertWriteInvalidatesList(self.category.save)
+        self.assertWriteInvalidatesList(lambda: BookImage.objects.create(book=self.book, description="Back"))
+        self.assertWriteInvalidatesList(lambda: Book.objects.get(pk=self.book.pk).save())
+        self.assertWriteInvalidatesList(rename_publisher)
+        response = self.assertWriteInvalidatesList(
+            lambda: Rating.objects.create(user=self.user, book=self.book, score=5)
+        )
+
+        self.assertEqual(response.json()["results"][0]["rating_count"], 1)
+        detail = self.client.get(reverse("book-detail", args=[self.book.pk])).json()
+        self.assertEqual(detail["publisher"]["name"], "Publisher B")
+
+    def test_file_based_cache_backend_is_supported(self):
+        with tempfile.TemporaryDirectory() as location:
+            caches = {
+                "default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": location}
+            }
+            with override_settings(CACHES=caches):
+                self.client.get(self.url)
+                response = self.client.get(self.url)
+
+        self.assertEqual(response["X-Cache"], "HIT")
+
+
+class TestBookViewSetRepresentations(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.publisher = Publisher.objects.create(name="Publisher A", about="About " * 200)
+        self.category = Category.objects.create(title="Category A")
+        self.author = Author.objects.create(name="Author A", biography="Biography " * 200)
+        for i in range(10):
+            book = Book.objects.create(
+                name=f"Book {i}",
+                description="Description " * 200,
+                publisher=self.publisher,
+                category=self.category,
+                price=100,
+                volume=10,
+                number_of_pages=100,
+                approximate_study_time=timedelta(days=1),
+                publication_date=date(2024, 1, 1),
+            )
+            book.authors.add(self.author)
+            BookImage.objects.create(book=book, description="Image " * 50)
+        self.book = book
+
+    def test_list_uses_compact_representation(self):
+        with self.assertNumQueries(3):  # @ page count + rows + author names
+            response = self.client.get(reverse("book-list"))
+
+        book = response.json()["results"][0]
+        self.assertEqual(
+            set(book),
+            {
+                "id",
+                "name",
+                "cover_image",
+                "price",
+                "authors",
+                "category",
+                "avg_rating",
+                "rating_count",
+                "my_rating",
+                "is_favorited",
+            },
+        )
+        self.assertEqual(book["authors"], ["Author A"])
+        self.assertEqual(book["category"], "Category A")
+
+    def test_list_payload_is_much_smaller_than_full_representation(self):
+        lean = self.client.get(reverse("book-list"))
+        full = self.client.get(reverse("book-list"), {"include": ",".join(BOOK_RELATION_FIELDS)})
+
+        self.assertLess(len(lean.content) * 10, len(full.content))
+
+    def test_detail_keeps_rich_representation(self):
+        book = self.client.get(reverse("book-detail", args=[self.book.pk])).json()
+
+        self.assertIn("description", book)
+        self.assertEqual(book["authors"][0]["name"], "Author A")
+        self.assertEqual(len(book["images"]), 1)
+
+
+# @ The suite runs on LocMemCache, where conditional requests are off by default
+@override_settings(CONDITIONAL_REQUESTS=True)
+class TestBookViewSetConditionalGet(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="jill",
+            email="jill@test.com",
+            password="password123",
+            phone_number="0452384157",
+        )
+        self.publisher = Publisher.objects.create(name="Publisher A")
+        self.category = Category.objects.create(title="Category A")
+        self.book = Book.objects.create(
+            name="Book A",
+            description="Desc",
+            publisher=self.publisher,
+            category=self.category,
+            price=100,
+            volume=10,
+            number_of_pages=100,
+            approximate_study_time=timedelta(days=1),
+            publication_date=date(2024, 1, 1),
+        )
+        self.url = reverse("book-list")
+
+    def test_list_emits_validators(self):
+        response = self.client.get(self.url)
+
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertIn("Last-Modified", response)
+        self.assertIn("Authorization", response["Vary"])
+
+    @override_settings(CONDITIONAL_REQUESTS=False)
+    def test_disabled_conditional_requests_send_no_validators(self):
+        response = self.client.get(self.url)
+        repeated = self.client.get(self.url, HTTP_IF_NONE_MATCH="*")
+
+        self.assertNotIn("ETag", response)
+        self.assertNotIn("Last-Modified", response)
+        self.assertEqual(repeated.status_code, status.HTTP_200_OK)
+
+    def test_matching_etag_returns_304_without_queries(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+    def test_if_modified_since_returns_304(self):
+        last_modified = self.client.get(self.url)["Last-Modified"]
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_etag_differs_per_query_and_detail(self):
+        list_etag = self.client.get(self.url)["ETag"]
+        ordered_etag = self.client.get(self.url + "?ordering=price")["ETag"]
+        detail_etag = self.client.get(reverse("book-detail", args=[self.book.pk]))["ETag"]
+
+        self.assertEqual(len({list_etag, ordered_etag, detail_etag}), 3)
+
+    def test_catalog_write_changes_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        self.category.save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_favorite_changes_only_that_users_etag(self):
+        anonymous_etag = self.client.get(self.url)["ETag"]
+        self.client.force_authenticate(user=self.user)
+        user_etag = self.client.get(self.url)["ETag"]
+
+        Favorite.objects.create(user=self.user, book=self.book)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=user_etag)
+        self.client.force_authenticate(user=None)
+        anonymous = self.client.get(self.url, HTTP_IF_NONE_MATCH=anonymous_etag)
+
+        self.assertNotEqual(anonymous_etag, user_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.json()["results"][0]["is_favorited"])
+        self.assertEqual(anonymous.status_code, status.HTTP_304_NOT_MODIFIED)
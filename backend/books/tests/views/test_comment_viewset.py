@@ -2,7 +2,7 @@ from datetime import date, timedelta
 
 from books.models import Book, Category, Comment, Publisher
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -67,3 +67,20 @@ class TestCommentViewSet(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["body"], approved_comment.body)
+
+    @override_settings(CONDITIONAL_REQUESTS=True)
+    def test_new_comment_changes_etag(self):
+        url = reverse("book-comments-list", kwargs={"book_pk": self.book.pk})
+        etag = self.client.get(url)["ETag"]
+
+        with self.assertNumQueries(0):
+            not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        comment = Comment.objects.create(user=self.user, book=self.book, body="Waiting comment")
+        comment.status = Comment.COMMENT_STATUS_APPROVED
+        comment.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
@@ -1,8 +1,10 @@
 from datetime import date, timedelta
 
 from books.models import Book, Category, Favorite, Publisher
+from books.utils.favorites import get_favorite_membership
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from rest_framework import status
 from rest_framework.test import APIClient
 
@@ -69,3 +71,75 @@ class FavoriteToggleTests(TestCase):
 
         self.assertTrue(Favorite.objects.filter(user=other_user, book=self.book).exists())
         self.assertTrue(Favorite.objects.filter(user=self.user, book=self.book).exists())
+
+
+class FavoriteMembershipCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="jack",
+            email="user@test.com",
+            password="password123",
+            phone_number="+10000000001",
+        )
+        self.publisher = Publisher.objects.create(name="Test Publisher")
+        self.category = Category.objects.create(title="Test Category")
+        self.books = [
+            Book.objects.create(
+                name=f"Book {i}",
+                description="Test description",
+                price=1000,
+                publisher=self.publisher,
+                category=self.category,
+                volume=10,
+                number_of_pages=100,
+                approximate_study_time=timedelta(days=1),
+                publication_date=date(2020, 5, 12),
+            )
+            for i in range(3)
+        ]
+        Favorite.objects.create(user=self.user, book=self.books[0])
+        self.client.force_authenticate(user=self.user)
+
+    def test_membership_is_warmed_once(self):
+        with self.assertNumQueries(1):
+            membership = get_favorite_membership(self.user)
+        with self.assertNumQueries(0):
+            cached = get_favorite_membership(self.user)
+
+        self.assertIn(self.books[0].id, membership)
+        self.assertEqual(cached.filter([book.id for book in self.books]), {self.books[0].id})
+
+    def test_toggle_writes_through_to_the_cached_membership(self):
+        get_favorite_membership(self.user)
+
+        self.client.post("/api/favorites/", {"book": self.books[2].id})
+        with self.assertNumQueries(0):
+            added = get_favorite_membership(self.user).filter([book.id for book in self.books])
+
+        self.client.post("/api/favorites/", {"book": self.books[0].id})
+        with self.assertNumQueries(0):
+            removed = get_favorite_membership(self.user).filter([book.id for book in self.books])
+
+        self.assertEqual(added, {self.books[0].id, self.books[2].id})
+        self.assertEqual(removed, {self.books[2].id})
+
+    def test_book_list_overlay_uses_cached_membership(self):
+        get_favorite_membership(self.user)
+        self.client.get("/api/books/?fields=id,is_favorited")
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/books/?fields=id,is_favorited")
+
+        favorited = {book["id"] for book in response.json()["results"] if book["is_favorited"]}
+        self.assertEqual(favorited, {self.books[0].id})
+
+    @override_settings(FAVORITES_MEMBERSHIP_MAX_SIZE=0)
+    def test_large_favorite_sets_fall_back_to_page_lookups(self):
+        get_favorite_membership(self.user)
+
+        with self.assertNumQueries(1):
+            favorited = get_favorite_membership(self.user).filter([book.id for book in self.books])
+
+        self.assertEqual(favorited, {self.books[0].id})
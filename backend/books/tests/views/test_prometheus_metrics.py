@@ -0,0 +1,167 @@
+import os
+import subprocess
+import sys
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from books.models import Book, Rating
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from prometheus_client import REGISTRY, multiprocess
+from prometheus_client.parser import text_string_to_metric_families
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+User = get_user_model()
+
+# @ Run in a separate interpreter so prometheus_client starts in multiprocess mode, like a gunicorn worker
+WORKER_SCRIPT = """
+import os
+from core.instrumentation.prometheus import REQUESTS_IN_FLIGHT, observe_cache_lookup
+observe_cache_lookup("responses", True)
+REQUESTS_IN_FLIGHT.inc()
+print(os.getpid())
+"""
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def scrape(response):
+    return {
+        (metric.name, tuple(sorted(metric.labels.items()))): metric.value
+        for family in text_string_to_metric_families(response.content.decode())
+        for metric in family.samples
+    }
+
+
+@override_settings(PROMETHEUS_METRICS=True, PROMETHEUS_METRICS_TOKEN="s3cret")
+class TestPrometheusMetrics(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command("seed_scale_data", "--books=12", "--users=4", "--ratings=20", stdout=StringIO())
+        cls.user = User.objects.create_user(
+            username="reader", email="reader@test.com", password="password123", phone_number="+10000000004"
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def get_metrics(self):
+        return self.client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer s3cret")
+
+    def test_requests_are_observed_per_route(self):
+        labels = {"route": "book-list", "method": "GET"}
+        requests = sample("http_requests_total", status="200", **labels)
+        observed = sample("http_request_duration_seconds_count", **labels)
+        queries = sample("http_request_db_queries_sum", route="book-list")
+
+        self.client.get(reverse("book-list"))
+
+        self.assertEqual(sample("http_requests_total", status="200", **labels), requests + 1)
+        self.assertEqual(sample("http_request_duration_seconds_count", **labels), observed + 1)
+        self.assertEqual(sample("http_request_db_queries_sum", route="book-list"), queries + 3)
+        self.assertEqual(sample("http_requests_in_flight"), 0)
+
+    def test_unresolved_paths_share_one_route(self):
+        requests = sample("http_requests_total", route="unmatched", method="GET", status="404")
+
+        self.client.get("/no-such-page/")
+        self.client.get("/another-missing-page/")
+
+        self.assertEqual(sample("http_requests_total", route="unmatched", method="GET", status="404"), requests + 2)
+
+    def test_cache_lookups_and_pagination_counts(self):
+        misses = sample("cache_lookups_total", cache="responses", result="miss")
+        hits = sample("cache_lookups_total", cache="responses", result="hit")
+        exact = sample("pagination_counts_total", namespace="books", strategy="exact")
+        cached = sample("pagination_counts_total", namespace="books", strategy="cached")
+
+        self.client.get(reverse("book-list"))
+        self.client.get(reverse("book-list"))
+        self.client.get(reverse("book-list"), {"page_size": 5})
+
+        self.assertEqual(sample("cache_lookups_total", cache="responses", result="miss"), misses + 2)
+        self.assertEqual(sample("cache_lookups_total", cache="responses", result="hit"), hits + 1)
+        self.assertEqual(sample("pagination_counts_total", namespace="books", strategy="exact"), exact + 1)
+        self.assertEqual(sample("pagination_counts_total", namespace="books", strategy="cached"), cached + 1)
+
+    def test_signal_handlers_are_timed(self):
+        handler = "book_rating.update_book_rating_on_save"
+        observed = sample("signal_handler_duration_seconds_count", handler=handler)
+
+        Rating.objects.create(book=Book.objects.first(), user=self.user, score=4)
+
+        self.assertEqual(sample("signal_handler_duration_seconds_count", handler=handler), observed + 1)
+
+    def test_metrics_endpoint(self):
+        self.client.get(reverse("book-list"))
+        response = self.get_metrics()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        samples = scrape(response)
+        self.assertGreater(
+            samples[("http_requests_total", (("method", "GET"), ("route", "book-list"), ("status", "200")))], 0
+        )
+        self.assertIn(("http_requests_in_flight", ()), samples)
+
+    def test_token_protects_the_endpoint(self):
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, status.HTTP_401_UNAUTHORIZED)
+        response = self.client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer wrong")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(PROMETHEUS_METRICS_TOKEN="", DEBUG=False)
+    def test_refuses_scrapes_without_a_configured_token_outside_debug(self):
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, status.HTTP_403_FORBIDDEN)
+
+    @override_settings(PROMETHEUS_METRICS_TOKEN="", DEBUG=True)
+    def test_debug_serves_without_a_token(self):
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, status.HTTP_200_OK)
+
+    @override_settings(PROMETHEUS_METRICS=False)
+    def test_disabled_metrics(self):
+        requests = sample("http_requests_total", route="book-list", method="GET", status="200")
+
+        self.assertEqual(self.client.get(reverse("book-list")).status_code, status.HTTP_200_OK)
+
+        self.assertEqual(sample("http_requests_total", route="book-list", method="GET", status="200"), requests)
+        self.assertEqual(self.get_metrics().status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_scrape_aggregates_worker_processes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            env = {
+                **os.environ,
+                "PROMETHEUS_MULTIPROC_DIR": directory,
+                "PROMETHEUS_METRICS": "true",
+                "DJANGO_SETTINGS_MODULE": "config.settings",
+            }
+            pids = [
+                int(
+                    subprocess.run(
+                        [sys.executable, "-c", WORKER_SCRIPT],
+                        cwd=settings.BASE_DIR,
+                        env=env,
+                        check=True,
+                        capture_output=True,
+                        text=True,
+                    ).stdout.split()[-1]
+                )
+                for _ in range(3)
+            ]
+            # @ What gunicorn.conf.py's child_exit does when a worker goes away
+            multiprocess.mark_process_dead(pids[0], directory)
+
+            with mock.patch.dict(os.environ, {"PROMETHEUS_MULTIPROC_DIR": directory}):
+                samples = scrape(self.get_metrics())
+
+        # @ Counters keep the dead worker's samples; the in-flight gauge drops them
+        self.assertEqual(samples[("cache_lookups_total", (("cache", "responses"), ("result", "hit")))], 3)
+        self.assertEqual(samples[("http_requests_in_flight", ())], 2)
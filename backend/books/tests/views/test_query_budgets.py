@@ -0,0 +1,176 @@
+import inspect
+import logging
+from io import StringIO
+
+from books import views
+from books.models import Book, BookImage, Comment, Favorite, Rating
+from books.serializers.book_serializers import BookSerializer
+from core.queries.budgets import QueryBudgetExceeded, query_budget
+from core.queries.middleware import QueryInspectionMiddleware
+from core.queries.shapes import normalize_sql
+from core.queries.testing import QueryBudgetTestMixin
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from rest_framework.viewsets import GenericViewSet
+
+User = get_user_model()
+
+
+class TestEndpointQueryBudgets(QueryBudgetTestMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command(
+            "seed_scale_data",
+            "--books=60",
+            "--users=10",
+            "--authors=12",
+            "--translators=6",
+            "--publishers=5",
+            "--categories=4",
+            "--ratings=200",
+            "--favorites=80",
+            "--comments=60",
+            stdout=StringIO(),
+        )
+        cls.book = Book.objects.order_by("-rating_count", "pk").first()
+        cls.reader = User.objects.filter(ratings__book=cls.book).order_by("pk").first()
+        cls.newcomer = User.objects.create_user(
+            username="newcomer", email="newcomer@test.com", password="password123", phone_number="+10000000001"
+        )
+        cls.image = BookImage.objects.create(book=cls.book, description="Back cover")
+        Comment.objects.filter(book=cls.book).update(status=Comment.COMMENT_STATUS_APPROVED)
+
+    def test_every_viewset_declares_budgets(self):
+        for name, view in inspect.getmembers(views, inspect.isclass):
+            if view.__module__ == views.__name__ and (issubclass(view, GenericViewSet) or view is views.SuggestionView):
+                self.assertTrue(getattr(view, "query_budgets", None), f"{name} declares no query budgets")
+
+    def test_book_list(self):
+        url = reverse("book-list")
+        for user in (None, self.reader):
+            self.assertWithinQueryBudget(views.BookViewSet, "list", url, page_sizes=(1, 50), user=user)
+            self.assertWithinQueryBudget(
+                views.BookViewSet,
+                "list",
+                url,
+                params={"fields": ",".join(BookSerializer.Meta.fields), "ordering": "-price"},
+                page_sizes=(1, 50),
+                user=user,
+            )
+            self.assertWithinQueryBudget(views.BookViewSet, "list", url, params={"cursor": ""}, page_sizes=(1, 50))
+
+    def test_book_detail_bulk_and_facets(self):
+        ids = ",".join(str(pk) for pk in Book.objects.values_list("pk", flat=True)[:40])
+        for user in (None, self.reader):
+            self.assertWithinQueryBudget(views.BookViewSet, "retrieve", f"/api/books/{self.book.pk}/", user=user)
+            self.assertWithinQueryBudget(views.BookViewSet, "bulk", "/api/books/bulk/", {"ids": ids}, user=user)
+            self.assertWithinQueryBudget(views.BookViewSet, "facets", "/api/books/facets/", user=user)
+
+    def test_book_images(self):
+        nested = {"book_pk": self.book.pk}
+        self.assertWithinQueryBudget(views.BookImageViewSet, "list", reverse("book-images-list", kwargs=nested))
+        self.assertWithinQueryBudget(
+            views.BookImageViewSet,
+            "retrieve",
+            reverse("book-images-detail", kwargs={**nested, "pk": self.image.pk}),
+        )
+
+    def test_comments(self):
+        url = reverse("book-comments-list", kwargs={"book_pk": self.book.pk})
+        self.assertGreater(self.assertWithinQueryBudget(views.CommentViewSet, "list", url), 0)
+
+        comment = Comment.objects.filter(book=self.book).first()
+        self.assertWithinQueryBudget(views.CommentViewSet, "retrieve", f"{url}{comment.pk}/")
+        self.assertWithinQueryBudget(
+            views.CommentViewSet, "create", url, user=self.reader, method="post", data={"body": "Great read"}
+        )
+
+    def test_favorites(self):
+        url = reverse("favorite-list")
+        self.assertWithinQueryBudget(views.FavoriteViewSet, "list", url, page_sizes=(1, 50), user=self.reader)
+        # @ Toggling on and off are both creates
+        for _ in range(2):
+            self.assertWithinQueryBudget(
+                views.FavoriteViewSet, "create", url, user=self.newcomer, method="post", data={"book": self.book.pk}
+            )
+
+    def test_ratings(self):
+        url = reverse("book-ratings-list", kwargs={"book_pk": self.book.pk})
+        rating = Rating.objects.get(book=self.book, user=self.reader)
+        self.assertWithinQueryBudget(views.RatingViewSet, "list", url, user=self.reader)
+        self.assertWithinQueryBudget(views.RatingViewSet, "retrieve", f"{url}{rating.pk}/", user=self.reader)
+        self.assertWithinQueryBudget(
+            views.RatingViewSet, "create", url, user=self.newcomer, method="post", data={"score": 4}
+        )
+
+    def test_suggestions(self):
+        self.assertWithinQueryBudget(views.SuggestionView, "get", reverse("suggest"), {"q": "book 1"})
+
+    def test_book_image_str_does_not_load_the_book(self):
+        image = BookImage.objects.get(pk=self.image.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(str(image), f"Image {image.pk} for book {self.book.pk}")
+
+
+class TestQueryBudget(TestCase):
+
+    def test_context_manager_counts_and_fails_over_budget(self):
+        with query_budget(1) as counter:
+            list(Book.objects.all())
+        self.assertEqual(len(counter), 1)
+
+        with self.assertRaises(QueryBudgetExceeded) as raised:
+            with query_budget(1, label="two lists"):
+                list(Book.objects.all())
+                list(Book.objects.all())
+        self.assertIn("two lists ran 2 queries, budget is 1", str(raised.exception))
+        self.assertIn("2x SELECT", str(raised.exception))
+
+    def test_decorator_gets_a_fresh_counter_per_call(self):
+        @query_budget(1)
+        def load():
+            return list(Favorite.objects.all())
+
+        load()
+        load()
+
+    def test_same_shape_ignores_parameters_and_in_list_length(self):
+        self.assertEqual(
+            normalize_sql('SELECT "a" FROM "t" WHERE "id" IN (%s, %s, %s) AND "x" = 5'),
+            normalize_sql('SELECT "a" FROM "t" WHERE "id" IN (%s) AND "x" = 12'),
+        )
+        self.assertNotEqual(normalize_sql('SELECT "a" FROM "t"'), normalize_sql('SELECT "b" FROM "t"'))
+
+
+@override_settings(QUERY_INSPECTION=True, QUERY_INSPECTION_REPEAT_THRESHOLD=3)
+class TestQueryInspectionMiddleware(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command("seed_scale_data", "--books=5", "--users=3", "--ratings=5", stdout=StringIO())
+
+    def run_middleware(self, view):
+        middleware = QueryInspectionMiddleware(lambda request: view())
+        return middleware(RequestFactory().get("/api/books/"))
+
+    def test_reports_repeated_query_shapes_with_the_call_site(self):
+        def view():
+            return HttpResponse(", ".join(str(rating.book_id) + rating.book.name for rating in Rating.objects.all()))
+
+        with self.assertLogs("core.queries.middleware", logging.WARNING) as logs:
+            self.run_middleware(view)
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("Possible N+1 on GET /api/books/: 5 queries", logs.output[0])
+        self.assertIn("books/tests/views/test_query_budgets.py", logs.output[0])
+
+    def test_stays_quiet_without_repeats(self):
+        def view():
+            return HttpResponse(", ".join(rating.book.name for rating in Rating.objects.select_related("book")))
+
+        with self.assertNoLogs("core.queries.middleware", logging.WARNING):
+            self.run_middleware(view)
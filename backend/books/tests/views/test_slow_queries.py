@@ -0,0 +1,99 @@
+from io import StringIO
+
+from core.cache.versions import bump_version
+from core.queries.slow import get_slow_queries, push_slow_query, summarize_slow_queries
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+User = get_user_model()
+
+
+def make_record(fingerprint, duration_ms, at, plan=None):
+    return {
+        "fingerprint": fingerprint,
+        "sql": f"SELECT {fingerprint}",
+        "duration_ms": duration_ms,
+        "view": "GET book-list",
+        "call_site": None,
+        "database": "default",
+        "at": at,
+        "plan": plan,
+    }
+
+
+@override_settings(SLOW_QUERY_MS=0, SLOW_QUERY_SAMPLE_RATE=1.0)
+class TestSlowQueryLog(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command("seed_scale_data", "--books=8", "--users=3", "--ratings=10", stdout=StringIO())
+        cls.staff = User.objects.create_user(
+            username="ops", email="ops@test.com", password="password123", phone_number="+10000000002", is_staff=True
+        )
+        cls.user = User.objects.create_user(
+            username="reader", email="reader@test.com", password="password123", phone_number="+10000000003"
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_records_statements_with_their_view(self):
+        self.client.get(reverse("book-list"))
+        records = get_slow_queries()
+
+        self.assertEqual(len(records), 3)
+        self.assertEqual({record["view"] for record in records}, {"GET book-list"})
+        self.assertTrue(all(record["sql"].startswith("SELECT") for record in records))
+        self.assertTrue(all(record["plan"] is None for record in records))  # @ EXPLAIN is PostgreSQL-only
+
+    def test_same_shape_shares_a_fingerprint(self):
+        self.client.get(reverse("book-list"), {"page_size": 5})
+        bump_version("books")
+        self.client.get(reverse("book-list"), {"page_size": 7})
+
+        counts = sorted(group["count"] for group in summarize_slow_queries(get_slow_queries()))
+        self.assertEqual(counts, [2, 2, 2])
+
+    @override_settings(SLOW_QUERY_SAMPLE_RATE=0.0)
+    def test_sampling_can_skip_everything(self):
+        self.client.get(reverse("book-list"))
+
+        self.assertEqual(get_slow_queries(), [])
+
+    @override_settings(SLOW_QUERY_BUFFER_SIZE=3)
+    def test_ring_keeps_only_the_newest_records(self):
+        for at in range(5):
+            push_slow_query(make_record(f"f{at}", 10, at))
+
+        self.assertEqual([record["fingerprint"] for record in get_slow_queries()], ["f4", "f3", "f2"])
+
+    def test_endpoint_is_staff_only(self):
+        url = reverse("slow-queries")
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.client.force_authenticate(self.user)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_endpoint_aggregates_by_fingerprint_and_clears(self):
+        push_slow_query(make_record("a", 10, 1))
+        push_slow_query(make_record("a", 30, 2, plan=[{"Plan": {"Node Type": "Seq Scan"}}]))
+        push_slow_query(make_record("b", 25, 3))
+        self.client.force_authenticate(self.staff)
+
+        response = self.client.get(reverse("slow-queries"), {"sort": "max_ms"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 3)
+        first, second = response.data["fingerprints"]
+        self.assertEqual((first["fingerprint"], first["count"], first["total_ms"], first["max_ms"]), ("a", 2, 40, 30))
+        self.assertEqual(first["plan"], [{"Plan": {"Node Type": "Seq Scan"}}])
+        self.assertEqual(second["fingerprint"], "b")
+        self.assertEqual([record["at"] for record in response.data["recent"]], [3, 2, 1])
+
+        self.assertEqual(self.client.delete(reverse("slow-queries")).status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(get_slow_queries(), [])
@@ -0,0 +1,92 @@
+from datetime import date, timedelta
+from unittest import mock
+
+from books.models import Author, Book, Category, Publisher, Translator
+from books.utils.suggestions import QUERY_CANCELED, get_suggestions
+from django.core.cache import cache
+from django.db import OperationalError
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+
+# @ Stands in for the driver error Django wraps in OperationalError
+class QueryCanceled(Exception):
+    pgcode = QUERY_CANCELED
+
+
+class TestSuggestionView(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.author = Author.objects.create(name="Leo Tolstoy")
+        self.translator = Translator.objects.create(name="Louise Maude")
+        self.publisher = Publisher.objects.create(name="Tolkien Press")
+        category = Category.objects.create(title="Novel")
+        self.book = Book.objects.create(
+            name="A Tolstoy Reader",
+            description="Desc",
+            publisher=self.publisher,
+            category=category,
+            volume=10,
+            number_of_pages=100,
+            approximate_study_time=timedelta(days=1),
+            publication_date=date(2024, 1, 1),
+        )
+        self.url = reverse("suggest")
+
+    def test_returns_typed_suggestions_from_every_source(self):
+        response = self.client.get(self.url, {"q": "tol"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()["results"]
+        self.assertCountEqual(
+            [(item["kind"], item["id"]) for item in results],
+            [("book", self.book.id), ("author", self.author.id), ("publisher", self.publisher.id)],
+        )
+        self.assertEqual(set(results[0]), {"id", "label", "kind"})
+
+    def test_prefix_matches_rank_first(self):
+        results = self.client.get(self.url, {"q": "tol"}).json()["results"]
+
+        self.assertEqual(results[0]["label"], "Tolkien Press")
+
+    def test_limit_is_applied(self):
+        results = self.client.get(self.url, {"q": "tol", "limit": 1}).json()["results"]
+
+        self.assertEqual(len(results), 1)
+
+    def test_short_query_returns_nothing_without_querying(self):
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, {"q": "t"})
+
+        self.assertEqual(response.json()["results"], [])
+
+    def test_popular_prefix_is_cached_until_catalog_changes(self):
+        self.client.get(self.url, {"q": "Tol "})
+        with self.assertNumQueries(0):
+            self.client.get(self.url, {"q": "tol"})
+
+        Author.objects.create(name="Tolkien")
+        results = self.client.get(self.url, {"q": "tol"}).json()["results"]
+
+        self.assertIn("Tolkien", [item["label"] for item in results])
+
+    def test_long_and_non_ascii_queries_are_cacheable(self):
+        query = "толстой " * 100
+
+        self.assertEqual(get_suggestions(query, 5), ([], False))
+        self.assertEqual(get_suggestions(query, 5), ([], False))
+
+    def test_statement_timeout_answers_empty(self):
+        timeout = OperationalError("canceling statement due to statement timeout")
+        timeout.__cause__ = QueryCanceled()
+
+        with mock.patch("books.utils.suggestions._run_with_timeout", side_effect=timeout):
+            response = self.client.get(self.url, {"q": "tol"})
+
+        self.assertEqual(response.json(), {"results": [], "timed_out": True})
+
+    def test_other_database_errors_are_not_reported_as_timeouts(self):
+        with mock.patch("books.utils.suggestions._run_with_timeout", side_effect=OperationalError("server closed")):
+            with self.assertRaises(OperationalError):
+                get_suggestions("tol", 5)
@@ -1,3 +1,4 @@
+from django.urls import path
 from rest_framework_nested import routers
 
 from . import views
@@ -17,5 +18,11 @@ book_router.register("images", views.BookImageViewSet, basename="book-images")
 book_router.register("ratings", views.RatingViewSet, basename="book-ratings")
 
 
+# @ ------------------- Plain Views ↓ -------------------
+view_urlpatterns = [
+    path("suggest/", views.SuggestionView.as_view(), name="suggest"),
+]
+
+
 # @ ------------------- Include Routers To URL ↓ -------------------
-urlpatterns = router.urls + book_router.urls
+urlpatterns = router.urls + book_router.urls + view_urlpatterns
@@ -0,0 +1,217 @@
+import json
+import math
+import time
+import tracemalloc
+from collections import namedtuple
+
+from books.filters.book_filters import BookFilter
+from books.models import Book, Favorite
+from books.serializers.book_serializers import BookSerializer
+from books.utils.seeding import DEFAULT_SCALE_SIZES
+from books.views import BookViewSet
+from core.pagination.books import BookPagination
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import Count
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+Scenario = namedtuple("Scenario", ["name", "path", "params", "user"])
+
+# @ Where each relational BookFilter filter takes its sample value from: (Book relation, column)
+FILTER_VALUE_SOURCES = {
+    "category": ("category", "title"),
+    "author": ("authors", "name"),
+    "translator": ("translators", "name"),
+    "publisher": ("publisher", "name"),
+    "language": ("languages", "name"),
+    "formats": ("content_formats", "name"),
+}
+
+
+# @ Scale every table with the book count, keeping the DEFAULT_SCALE_SIZES proportions (1k books == defaults)
+def scaled_sizes(books):
+    base = DEFAULT_SCALE_SIZES["books"]
+    sizes = {name: max(count * books // base, 1) for name, count in DEFAULT_SCALE_SIZES.items()}
+    # @ Lookup tables stay small; they are bounded by reality, not by the catalog size
+    sizes["categories"] = min(sizes["categories"], 200)
+    sizes["languages"] = DEFAULT_SCALE_SIZES["languages"]
+    sizes["content_formats"] = DEFAULT_SCALE_SIZES["content_formats"]
+    for required in ("users", "categories", "publishers", "authors"):
+        sizes[required] = max(sizes[required], 5)
+    return sizes
+
+
+# @ Any concrete allowed host works; responses contain absolute URLs
+def get_benchmark_host():
+    return next((host for host in settings.ALLOWED_HOSTS if host != "*" and not host.startswith(".")), "localhost")
+
+
+# @ Nearest-rank percentile; exact for the small sample counts a benchmark run takes
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(math.ceil(fraction * len(ordered)) - 1, 0))]
+
+
+def sample_filter_value(book, relation, column):
+    related = getattr(book, relation)
+    if hasattr(related, "all"):
+        value = related.order_by("pk").values_list(column, flat=True).first()
+    else:
+        value = getattr(related, column)
+    if value is None:
+        # @ e.g. the sample book has no translators; any value that some book carries will do
+        model = Book._meta.get_field(relation).related_model
+        value = model.objects.filter(books__isnull=False).order_by("pk").values_list(column, flat=True).first()
+    return value
+
+
+# @ The most rated book and the heaviest users are the hot rows a real workload keeps hitting
+def build_scenarios(log=print):
+    book = Book.objects.order_by("-rating_count", "pk").first()
+    if book is None:
+        return []
+
+    User = get_user_model()
+    heaviest = Favorite.objects.values("user").annotate(n=Count("id")).order_by("-n", "user").values("user")[:1]
+    favorite_user = User.objects.filter(pk__in=heaviest).first()
+    reader = User.objects.filter(ratings__book=book).order_by("pk").first()
+
+    book_list = reverse("book-list")
+    middle_page = max(Book.objects.count() // BookPagination.page_size // 2, 1)
+    scenarios = [
+        Scenario("books list", book_list, {}, None),
+        Scenario("books list (all fields)", book_list, {"fields": ",".join(BookSerializer.Meta.fields)}, None),
+        Scenario("books list (middle page)", book_list, {"page": middle_page}, None),
+        Scenario("books list (cursor)", book_list, {"cursor": ""}, None),
+    ]
+
+    for name in BookFilter.base_filters:
+        if name == "search":
+            value = book.name
+        elif name in FILTER_VALUE_SOURCES:
+            value = sample_filter_value(book, *FILTER_VALUE_SOURCES[name])
+        else:
+            log(f"No sample value for BookFilter filter {name!r}; skipping it.")
+            continue
+        scenarios.append(Scenario(f"books list ?{name}=", book_list, {name: value}, None))
+
+    for field in BookViewSet.ordering_fields:
+        for ordering in (field, f"-{field}"):
+            scenarios.append(Scenario(f"books list ?ordering={ordering}", book_list, {"ordering": ordering}, None))
+
+    nested = {"book_pk": book.pk}
+    scenarios += [
+        Scenario("book detail", reverse("book-detail", kwargs={"pk": book.pk}), {}, None),
+        Scenario("comments", reverse("book-comments-list", kwargs=nested), {}, None),
+        Scenario("images", reverse("book-images-list", kwargs=nested), {}, None),
+    ]
+    # @ Signed-in variants add the per-user overlay (is_favorited, my_rating) on top of the shared payload
+    if reader is not None:
+        scenarios += [
+            Scenario("books list (authenticated)", book_list, {}, reader),
+            Scenario("book detail (authenticated)", reverse("book-detail", kwargs={"pk": book.pk}), {}, reader),
+            Scenario("ratings", reverse("book-ratings-list", kwargs=nested), {}, reader),
+        ]
+    if favorite_user is not None:
+        scenarios.append(Scenario("favorites", reverse("favorite-list"), {}, favorite_user))
+    return scenarios
+
+
+class EndpointBenchmark:
+    # @ Latency is timed without query capture or tracemalloc; those get one separate request each
+    def __init__(self, iterations=20, warmup=2, warm_cache=False, using="default"):
+        self.iterations = iterations
+        self.warmup = warmup
+        self.warm_cache = warm_cache
+        self.connection = connections[using]
+        # @ Separate clients: force_authenticate(None) logs out, which would add session queries
+        self.anonymous_client = APIClient(HTTP_HOST=get_benchmark_host())
+        self.user_client = APIClient(HTTP_HOST=get_benchmark_host())
+
+    # @ Cold by default: every request rebuilds its response, so the numbers track the database
+    def prepare(self, scenario):
+        if not self.warm_cache:
+            cache.clear()
+        if scenario.user is None:
+            return self.anonymous_client
+        self.user_client.force_authenticate(scenario.user)
+        return self.user_client
+
+    def fetch(self, scenario):
+        client = self.prepare(scenario)
+        started = time.perf_counter()
+        response = client.get(scenario.path, scenario.params)
+        return response, (time.perf_counter() - started) * 1000
+
+    def measure(self, scenario):
+        for _ in range(self.warmup):
+            self.fetch(scenario)
+        timings = []
+        for _ in range(self.iterations):
+            response, elapsed = self.fetch(scenario)
+            timings.append(elapsed)
+
+        with CaptureQueriesContext(self.connection) as captured:
+            response, _ = self.fetch(scenario)
+
+        return {
+            "name": scenario.name,
+            "path": scenario.path,
+            "params": {name: str(value) for name, value in scenario.params.items()},
+            "authenticated": scenario.user is not None,
+            "status": response.status_code,
+            "bytes": len(response.content),
+            "iterations": len(timings),
+            "p50_ms": round(percentile(timings, 0.5), 3),
+            "p95_ms": round(percentile(timings, 0.95), 3),
+            "mean_ms": round(sum(timings) / len(timings), 3),
+            "queries": len(captured.captured_queries),
+            "rows_read": self.count_rows_read(captured.captured_queries),
+            "peak_memory_kib": round(self.measure_memory(scenario) / 1024, 1),
+        }
+
+    def measure_memory(self, scenario):
+        client = self.prepare(scenario)
+        already_tracing = tracemalloc.is_tracing()
+        if already_tracing:
+            tracemalloc.reset_peak()
+        else:
+            tracemalloc.start()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            client.get(scenario.path, scenario.params)
+            return tracemalloc.get_traced_memory()[1] - baseline
+        finally:
+            if not already_tracing:
+                tracemalloc.stop()
+
+    # @ Rows the executor actually touched, from EXPLAIN ANALYZE of every captured SELECT (PostgreSQL only;
+    # @ SQLite exposes no per-query row counts, so the figure is None there)
+    def count_rows_read(self, queries):
+        if self.connection.vendor != "postgresql":
+            return None
+        total = 0
+        with self.connection.cursor() as cursor:
+            for query in queries:
+                if not query["sql"].lstrip().upper().startswith("SELECT"):
+                    continue
+                cursor.execute(f"EXPLAIN (ANALYZE, FORMAT JSON) {query['sql']}")
+                plan = cursor.fetchone()[0]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                total += rows_read_in_plan(plan[0]["Plan"])
+        return total
+
+
+def rows_read_in_plan(node):
+    rows = 0
+    if "Relation Name" in node:
+        read = node.get("Actual Rows", 0) + node.get("Rows Removed by Filter", 0)
+        rows += read * node.get("Actual Loops", 1)
+    for child in node.get("Plans", []):
+        rows += rows_read_in_plan(child)
+    return rows
@@ -0,0 +1,49 @@
+from datetime import datetime, time
+from itertools import islice
+
+from books.models import Book
+from books.serializers.book_serializers import BookSerializer
+from books.serializers.fast_book_serializers import build_book_representation
+from books.utils.fieldsets import BOOK_OVERLAY_FIELDS
+from core.renderers import dumps
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+# @ The detail representation minus per-user fields
+EXPORT_FIELDS = [name for name in BookSerializer.Meta.fields if name not in BOOK_OVERLAY_FIELDS]
+
+
+# @ ISO datetime or date (midnight); naive values are in the current time zone. None when invalid.
+def parse_since(value):
+    try:
+        since = parse_datetime(value)
+        if since is None:
+            day = parse_date(value)
+            since = None if day is None else datetime.combine(day, time.min)
+    except ValueError:
+        return None
+    if since is not None and settings.USE_TZ and timezone.is_naive(since):
+        since = timezone.make_aware(since)
+    return since
+
+
+# @ since only sees saves of the book row itself: rating aggregates (.update()), images, many-to-many changes
+# @ and renamed related rows leave datetime_modified alone, so an incremental export misses them until a full one
+def get_export_queryset(since=None):
+    queryset = Book.objects.order_by("datetime_modified", "id")
+    if since is not None:
+        queryset = queryset.filter(datetime_modified__gte=since)
+    return queryset
+
+
+# @ One streaming query for the book rows (server-side cursor on PostgreSQL); relations are loaded
+# @ per chunk, so memory stays bounded by chunk_size however large the catalog is.
+def iter_catalog_ndjson(request=None, since=None, chunk_size=None):
+    chunk_size = chunk_size or settings.CATALOG_EXPORT_CHUNK_SIZE
+    serializer = BookSerializer(context={"request": request, "selected_fields": EXPORT_FIELDS})
+    representation = build_book_representation(serializer)
+
+    rows = get_export_queryset(since).values(*representation.columns).iterator(chunk_size=chunk_size)
+    while chunk := list(islice(rows, chunk_size)):
+        yield b"".join(dumps(book) + b"\n" for book in representation.represent(chunk))
@@ -0,0 +1,78 @@
+from books.models import Book
+from core.cache.keys import NON_FILTER_QUERY_PARAMS, digest, normalize_query_params
+from core.cache.versions import get_version
+from core.instrumentation.metrics import record_cache_lookup
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+# @ Bucket edges for the price facet: [0, 0], [1, 50000), [50000, 100000), ... [500000, ∞)
+PRICE_FACET_EDGES = [0, 50_000, 100_000, 250_000, 500_000]
+
+
+def get_price_buckets():
+    buckets = [(0, 0, Q(price=0))]
+    lower_edges = [1] + PRICE_FACET_EDGES[1:]
+    upper_edges = PRICE_FACET_EDGES[1:] + [None]
+    for lower, upper in zip(lower_edges, upper_edges):
+        condition = Q(price__gte=lower)
+        if upper is not None:
+            condition &= Q(price__lt=upper)
+        buckets.append((lower, upper, condition))
+    return buckets
+
+
+def _foreign_key_facet(book_ids, relation, label):
+    rows = (
+        Book.objects.filter(pk__in=book_ids)
+        .values(f"{relation}_id", f"{relation}__{label}")
+        .annotate(count=Count("id"))
+        .order_by("-count", f"{relation}__{label}")
+    )
+    return [{"id": row[f"{relation}_id"], label: row[f"{relation}__{label}"], "count": row["count"]} for row in rows]
+
+
+def _many_to_many_facet(book_ids, relation):
+    field = Book._meta.get_field(relation)
+    target = field.m2m_reverse_field_name()
+    rows = (
+        field.remote_field.through.objects.filter(book_id__in=book_ids)
+        .values(f"{target}_id", f"{target}__name")
+        .annotate(count=Count("book_id"))
+        .order_by("-count", f"{target}__name")
+    )
+    return [{"id": row[f"{target}_id"], "name": row[f"{target}__name"], "count": row["count"]} for row in rows]
+
+
+# @ Five grouped queries over the filtered id set, regardless of how many facet values exist
+def compute_facets(filtered_queryset):
+    book_ids = filtered_queryset.order_by().values("pk")
+    buckets = get_price_buckets()
+
+    totals = Book.objects.filter(pk__in=book_ids).aggregate(
+        count=Count("id"),
+        **{f"price_{index}": Count("id", filter=condition) for index, (_, _, condition) in enumerate(buckets)},
+    )
+
+    return {
+        "count": totals["count"],
+        "categories": _foreign_key_facet(book_ids, "category", "title"),
+        "publishers": _foreign_key_facet(book_ids, "publisher", "name"),
+        "languages": _many_to_many_facet(book_ids, "languages"),
+        "content_formats": _many_to_many_facet(book_ids, "content_formats"),
+        "price": [
+            {"min": lower, "max": upper, "count": totals[f"price_{index}"]}
+            for index, (lower, upper, _) in enumerate(buckets)
+        ],
+    }
+
+
+def get_facets(request, filtered_queryset):
+    params = normalize_query_params(request.query_params, exclude=NON_FILTER_QUERY_PARAMS)
+    cache_key = f"facets:{get_version('books')}:{digest(params)}"
+    facets = cache.get(cache_key)
+    record_cache_lookup(facets is not None, "facets")
+    if facets is None:
+        facets = compute_facets(filtered_queryset)
+        cache.set(cache_key, facets, settings.FACETS_CACHE_TIMEOUT)
+    return facets
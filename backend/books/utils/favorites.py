@@ -0,0 +1,90 @@
+from array import array
+from bisect import bisect_left
+
+from books.models import Favorite
+from core.cache.versions import get_version
+from core.instrumentation.metrics import record_cache_lookup
+from django.conf import settings
+from django.core.cache import cache
+
+
+# @ Per-user favorite membership: a sorted array of book ids stamped with the ("favorites", user) version.
+# @ Users with more than FAVORITES_MEMBERSHIP_MAX_SIZE favorites are not cached (stored as None) and fall
+# @ back to lookups limited to the requested book ids.
+def get_membership_key(user_id):
+    return f"favorites:membership:{user_id}"
+
+
+def _encode(book_ids):
+    return None if book_ids is None else book_ids.tobytes()
+
+
+def _decode(data):
+    if data is None:
+        return None
+    book_ids = array("q")
+    book_ids.frombytes(data)
+    return book_ids
+
+
+def _set_entry(user_id, version, book_ids):
+    if book_ids is not None and len(book_ids) > settings.FAVORITES_MEMBERSHIP_MAX_SIZE:
+        book_ids = None
+    cache.set(get_membership_key(user_id), (version, _encode(book_ids)), settings.FAVORITES_MEMBERSHIP_CACHE_TIMEOUT)
+
+
+class FavoriteMembership:
+    def __init__(self, user_id, book_ids):
+        self.user_id = user_id
+        self.book_ids = book_ids
+
+    def __contains__(self, book_id):
+        return bool(self.filter([book_id]))
+
+    def filter(self, book_ids):
+        if self.book_ids is None:
+            queryset = Favorite.objects.filter(user_id=self.user_id, book_id__in=book_ids)
+            return set(queryset.values_list("book_id", flat=True))
+        return {book_id for book_id in book_ids if _contains(self.book_ids, book_id)}
+
+
+def _contains(sorted_ids, book_id):
+    index = bisect_left(sorted_ids, book_id)
+    return index < len(sorted_ids) and sorted_ids[index] == book_id
+
+
+def get_favorite_membership(user):
+    # @ Read the version before the rows so a concurrent toggle can only make the entry look stale
+    version = get_version("favorites", user.pk)
+    entry = cache.get(get_membership_key(user.pk))
+    record_cache_lookup(entry is not None and entry[0] == version, "favorites")
+    if entry is not None and entry[0] == version:
+        return FavoriteMembership(user.pk, _decode(entry[1]))
+
+    limit = settings.FAVORITES_MEMBERSHIP_MAX_SIZE
+    rows = Favorite.objects.filter(user_id=user.pk).order_by("book_id").values_list("book_id", flat=True)[: limit + 1]
+    book_ids = array("q", rows)
+    _set_entry(user.pk, version, book_ids)
+    return FavoriteMembership(user.pk, None if len(book_ids) > limit else book_ids)
+
+
+# @ Write-through after a toggle: patch the cached array when it is exactly one version behind,
+# @ otherwise drop it and let the next read warm it again.
+def apply_favorite_change(user_id, book_id, favorited, version):
+    key = get_membership_key(user_id)
+    entry = cache.get(key)
+    if entry is None:
+        return
+    if entry[0] != version - 1:
+        cache.delete(key)
+        return
+
+    book_ids = _decode(entry[1])
+    if book_ids is not None:
+        index = bisect_left(book_ids, book_id)
+        present = index < len(book_ids) and book_ids[index] == book_id
+        if favorited and not present:
+            book_ids.insert(index, book_id)
+        elif not favorited and present:
+            book_ids.pop(index)
+    _set_entry(user_id, version, book_ids)
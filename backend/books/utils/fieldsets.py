@@ -0,0 +1,76 @@
+from books.models import Author, Book
+from django.db.models import Prefetch
+from rest_framework.exceptions import ValidationError
+
+# @ Nested relations of BookSerializer and how the queryset loads them
+BOOK_SELECT_RELATED_FIELDS = ["publisher", "category"]
+BOOK_PREFETCH_RELATED_FIELDS = ["images", "authors", "translators", "content_formats", "languages"]
+BOOK_RELATION_FIELDS = BOOK_SELECT_RELATED_FIELDS + BOOK_PREFETCH_RELATED_FIELDS
+
+# @ Filled by the per-user overlay, never loaded from the books table
+BOOK_OVERLAY_FIELDS = ["my_rating", "is_favorited"]
+
+
+# @ Nested rows come back in primary-key order so every code path emits them identically
+def ordered_prefetch(relation, queryset=None):
+    if queryset is None:
+        queryset = Book._meta.get_field(relation).related_model.objects.all()
+    return Prefetch(relation, queryset=queryset.order_by("pk"))
+
+
+def _parse_names(value):
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+# @ ?fields= picks top-level fields, ?include= picks nested relations; id is always kept
+def get_selected_book_fields(query_params, available_fields):
+    fields_param = query_params.get("fields")
+    include_param = query_params.get("include")
+    if fields_param is None and include_param is None:
+        return None
+
+    fields = _parse_names(fields_param) if fields_param is not None else list(available_fields)
+    errors = {}
+    unknown = [name for name in fields if name not in available_fields]
+    if unknown:
+        errors["fields"] = f"Unknown field(s): {', '.join(unknown)}"
+
+    if include_param is not None:
+        include = _parse_names(include_param)
+        unknown = [name for name in include if name not in BOOK_RELATION_FIELDS]
+        if unknown:
+            errors["include"] = f"Unknown relation(s): {', '.join(unknown)}"
+        fields = [name for name in fields if name not in BOOK_RELATION_FIELDS] + include
+
+    if errors:
+        raise ValidationError(errors)
+
+    return ["id"] + [name for name in available_fields if name in fields and name != "id"]
+
+
+# @ extra_columns stay loaded regardless of the fieldset (e.g. ordering columns read by cursor pagination)
+def prune_book_queryset(queryset, selected_fields, extra_columns=()):
+    if selected_fields is None:
+        return queryset.select_related(*BOOK_SELECT_RELATED_FIELDS).prefetch_related(
+            *[ordered_prefetch(name) for name in BOOK_PREFETCH_RELATED_FIELDS]
+        )
+
+    concrete = {field.name for field in Book._meta.concrete_fields}
+    columns = [name for name in selected_fields if name in concrete] + list(extra_columns)
+    return (
+        queryset.select_related(*[name for name in BOOK_SELECT_RELATED_FIELDS if name in selected_fields])
+        .prefetch_related(*[ordered_prefetch(name) for name in BOOK_PREFETCH_RELATED_FIELDS if name in selected_fields])
+        .only(*columns)
+    )
+
+
+# @ Columns read by BookListSerializer; everything else (description, nested TextFields, images) stays unloaded
+BOOK_LIST_COLUMNS = ["id", "name", "cover_image", "price", "avg_rating", "rating_count", "category__title"]
+
+
+def build_book_list_queryset(queryset, extra_columns=()):
+    return (
+        queryset.select_related("category")
+        .prefetch_related(ordered_prefetch("authors", Author.objects.only("id", "name")))
+        .only(*BOOK_LIST_COLUMNS, *extra_columns)
+    )
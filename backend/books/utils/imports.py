@@ -0,0 +1,200 @@
+import csv
+import json
+from decimal import Decimal, InvalidOperation
+
+from books.models import Author, Book, Category, ContentFormat, Language, Publisher, Translator
+from django.core.exceptions import ValidationError
+from django.utils.dateparse import parse_date, parse_duration
+
+# @ Related rows are matched (and created) by their unique name column
+BOOK_IMPORT_FOREIGN_KEYS = {"publisher": (Publisher, "name"), "category": (Category, "title")}
+BOOK_IMPORT_MANY_TO_MANY = {
+    "authors": (Author, "name"),
+    "translators": (Translator, "name"),
+    "languages": (Language, "name"),
+    "content_formats": (ContentFormat, "name"),
+}
+BOOK_IMPORT_UPDATE_FIELDS = [
+    "description",
+    "publisher",
+    "category",
+    "price",
+    "active",
+    "volume",
+    "number_of_pages",
+    "approximate_study_time",
+    "publication_date",
+    "datetime_modified",
+]
+
+# @ CSV cells hold several names separated by this character
+CSV_LIST_SEPARATOR = "|"
+
+PRICE_FIELD = Book._meta.get_field("price")
+
+
+def read_import_rows(path, input_format):
+    with open(path, newline="", encoding="utf-8") as source:
+        if input_format == "csv":
+            for row in csv.DictReader(source):
+                yield {
+                    name: _split_names(value) if name in BOOK_IMPORT_MANY_TO_MANY else value
+                    for name, value in row.items()
+                }
+        else:
+            for line in source:
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        # @ Reported by parse_book_row like any other invalid row
+                        yield line
+
+
+def _split_names(value):
+    return [name.strip() for name in (value or "").split(CSV_LIST_SEPARATOR) if name.strip()]
+
+
+# @ Held to the column's max_length or integer range for the same reason as prices (see _parse_price): the database
+# @ would otherwise reject the value with a DataError inside bulk_create or upsert_by_name
+def _check_column(model, column, value, label):
+    try:
+        model._meta.get_field(column).run_validators(value)
+    except ValidationError:
+        raise ValueError(f"invalid {label}: {value!r}")
+    return value
+
+
+# @ Accepts plain names or the nested objects emitted by export_catalog
+def _related_name(value, model, column, label):
+    if isinstance(value, dict):
+        value = value.get(column)
+    if value in (None, ""):
+        return None
+    return _check_column(model, column, str(value).strip(), label)
+
+
+def _parse_bool(value):
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("1", "true", "yes", "y")
+
+
+# @ Rounded to the column's scale as the database write would, then held to its max_digits, so a bad price is a
+# @ skipped row instead of an error inside bulk_create after earlier batches have committed
+def _parse_price(value):
+    try:
+        price = Decimal(str(value).strip() if value not in (None, "") else 0)
+        if price.is_finite():
+            price = price.quantize(Decimal(1).scaleb(-PRICE_FIELD.decimal_places))
+    except InvalidOperation:
+        raise ValueError(f"invalid price: {value!r}")
+    if not price.is_finite() or price < 0 or len(price.as_tuple().digits) > PRICE_FIELD.max_digits:
+        raise ValueError(f"invalid price: {value!r}")
+    return price
+
+
+def _parse_value(parser, value, field):
+    parsed = parser(str(value).strip()) if value not in (None, "") else None
+    if parsed is None:
+        raise ValueError(f"invalid {field}: {value!r}")
+    return parsed
+
+
+# @ Returns the model fields plus {"relation": [names]} for the to-many relations present in the row
+def parse_book_row(raw):
+    if not isinstance(raw, dict):
+        raise ValueError("expected a JSON object")
+    name = raw.get("name")
+    if isinstance(name, (dict, list)):
+        raise ValueError(f"invalid name: {name!r}")
+    name = str(name).strip() if name is not None else ""
+    if not name:
+        raise ValueError("name is required")
+    _check_column(Book, "name", name, "name")
+
+    book = {"name": name, "description": raw.get("description") or ""}
+    for field, (model, column) in BOOK_IMPORT_FOREIGN_KEYS.items():
+        book[field] = _related_name(raw.get(field), model, column, field)
+        if book[field] is None:
+            raise ValueError(f"{field} is required")
+
+    book["price"] = _parse_price(raw.get("price"))
+    book["active"] = _parse_bool(raw.get("active", False))
+    for field in ("volume", "number_of_pages"):
+        book[field] = _check_column(Book, field, _parse_value(int, raw.get(field), field), field)
+    book["approximate_study_time"] = _parse_value(parse_duration, raw.get("approximate_study_time"), "duration")
+    book["publication_date"] = _parse_value(parse_date, raw.get("publication_date"), "publication_date")
+
+    relations = {}
+    for relation, (model, column) in BOOK_IMPORT_MANY_TO_MANY.items():
+        if relation in raw:
+            values = raw[relation] if isinstance(raw[relation], list) else _split_names(raw[relation])
+            names = (_related_name(value, model, column, relation) for value in values)
+            relations[relation] = [name for name in names if name]
+    return book, relations
+
+
+# @ INSERT ... ON CONFLICT DO NOTHING for the missing names, then one lookup for every id
+def upsert_by_name(model, column, names, batch_size):
+    names = set(names)
+    if not names:
+        return {}
+    model.objects.bulk_create([model(**{column: name}) for name in names], batch_size=batch_size, ignore_conflicts=True)
+    return dict(model.objects.filter(**{f"{column}__in": names}).values_list(column, "id"))
+
+
+def import_book_batch(parsed_rows, batch_size):
+    # @ A later row for the same book wins, as it would with sequential saves
+    parsed_rows = list({book["name"]: (book, relations) for book, relations in parsed_rows}.values())
+
+    foreign_ids = {
+        field: upsert_by_name(model, column, [book[field] for book, _ in parsed_rows], batch_size)
+        for field, (model, column) in BOOK_IMPORT_FOREIGN_KEYS.items()
+    }
+    related_ids = {
+        relation: upsert_by_name(
+            model, column, [name for _, relations in parsed_rows for name in relations.get(relation, [])], batch_size
+        )
+        for relation, (model, column) in BOOK_IMPORT_MANY_TO_MANY.items()
+    }
+
+    books = []
+    for book, _ in parsed_rows:
+        fields = {**book}
+        for field in BOOK_IMPORT_FOREIGN_KEYS:
+            fields[f"{field}_id"] = foreign_ids[field][fields.pop(field)]
+        books.append(Book(**fields))
+
+    # @ bulk_create skips save() and its signals (cover renaming, search vectors, cache versions);
+    # @ the caller refreshes what those would have maintained once per import
+    Book.objects.bulk_create(
+        books,
+        batch_size=batch_size,
+        update_conflicts=True,
+        unique_fields=["name"],
+        update_fields=BOOK_IMPORT_UPDATE_FIELDS,
+    )
+    book_ids = dict(Book.objects.filter(name__in=[book.name for book in books]).values_list("name", "id"))
+
+    # @ Relations given in the input replace the stored ones; relations left out are untouched
+    for relation in BOOK_IMPORT_MANY_TO_MANY:
+        model_field = Book._meta.get_field(relation)
+        through = model_field.remote_field.through
+        source, target = f"{model_field.m2m_field_name()}_id", f"{model_field.m2m_reverse_field_name()}_id"
+        replaced = {
+            book_ids[book["name"]]: relations[relation] for book, relations in parsed_rows if relation in relations
+        }
+        if not replaced:
+            continue
+        through.objects.filter(**{f"{source}__in": list(replaced)}).delete()
+        through.objects.bulk_create(
+            [
+                through(**{source: book_id, target: related_ids[relation][name]})
+                for book_id, names in replaced.items()
+                for name in dict.fromkeys(names)
+            ],
+            batch_size=batch_size,
+        )
+
+    return list(book_ids.values())
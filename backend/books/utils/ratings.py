@@ -0,0 +1,54 @@
+from django.db.models import Case, Count, F, FloatField, Sum, When
+from django.db.models.functions import Cast
+
+
+def apply_rating_delta(book_id, score_delta, count_delta):
+    # @ Single UPDATE statement; right-hand expressions see the pre-update row
+    from books.models import Book
+
+    new_sum = F("rating_sum") + score_delta
+    new_count = F("rating_count") + count_delta
+
+    return Book.objects.filter(pk=book_id).update(
+        rating_sum=new_sum,
+        rating_count=new_count,
+        avg_rating=Case(
+            When(rating_count__gt=-count_delta, then=Cast(new_sum, FloatField()) / Cast(new_count, FloatField())),
+            default=None,
+            output_field=FloatField(),
+        ),
+    )
+
+
+def compute_rating_aggregates(book_ids):
+    from books.models import Rating
+
+    rows = (
+        Rating.objects.filter(book_id__in=book_ids)
+        .values("book_id")
+        .annotate(total=Sum("score"), count=Count("id"))
+        .order_by()
+    )
+    aggregates = {book_id: (0, 0, None) for book_id in book_ids}
+    for row in rows:
+        aggregates[row["book_id"]] = (row["total"], row["count"], row["total"] / row["count"])
+    return aggregates
+
+
+def find_stale_rating_aggregates(books):
+    aggregates = compute_rating_aggregates([book.pk for book in books])
+    stale = []
+    for book in books:
+        rating_sum, rating_count, avg_rating = aggregates[book.pk]
+        if (book.rating_sum, book.rating_count) != (rating_sum, rating_count) or not _same_avg(
+            book.avg_rating, avg_rating
+        ):
+            book.rating_sum, book.rating_count, book.avg_rating = rating_sum, rating_count, avg_rating
+            stale.append(book)
+    return stale
+
+
+def _same_avg(current, expected):
+    if current is None or expected is None:
+        return current is expected
+    return abs(current - expected) < 1e-9
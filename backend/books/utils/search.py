@@ -0,0 +1,60 @@
+from django.conf import settings
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connections
+from django.db.models import F, FloatField, OuterRef, Subquery, TextField
+from django.db.models.functions import Cast
+
+# @ Book columns that feed the search document; saving only other columns skips the refresh
+SEARCH_DOCUMENT_FIELDS = {"name", "description", "publisher", "category"}
+
+
+def is_search_vector_supported(using="default"):
+    return connections[using].vendor == "postgresql"
+
+
+def _related_names(book_model, relation, column):
+    related_model = book_model._meta.get_field(relation).related_model
+    related_query_name = book_model._meta.get_field(relation).related_query_name()
+    return Subquery(
+        related_model.objects.filter(**{related_query_name: OuterRef("pk")})
+        .values(related_query_name)
+        .annotate(names=StringAgg(column, delimiter=" "))
+        .values("names")[:1],
+        output_field=TextField(),
+    )
+
+
+def _foreign_name(book_model, relation, column):
+    related_model = book_model._meta.get_field(relation).related_model
+    return Subquery(related_model.objects.filter(pk=OuterRef(f"{relation}_id")).values(column)[:1])
+
+
+# @ Migration 0009 backfilled with a frozen copy of this document; changing it needs a new backfill migration
+def build_search_document(book_model):
+    config = settings.BOOK_SEARCH_CONFIG
+    return (
+        SearchVector("name", weight="A", config=config)
+        + SearchVector(_related_names(book_model, "authors", "name"), weight="A", config=config)
+        + SearchVector(_related_names(book_model, "translators", "name"), weight="B", config=config)
+        + SearchVector(_foreign_name(book_model, "publisher", "name"), weight="B", config=config)
+        + SearchVector(_foreign_name(book_model, "category", "title"), weight="B", config=config)
+        + SearchVector("description", weight="C", config=config)
+    )
+
+
+def refresh_search_vectors(queryset):
+    if not is_search_vector_supported(queryset.db):
+        return 0
+    return queryset.update(search_vector=build_search_document(queryset.model))
+
+
+def search_books(queryset, value):
+    query = SearchQuery(value, config=settings.BOOK_SEARCH_CONFIG, search_type="websearch")
+    # @ ts_rank returns real, but a cursor sends the rank back as double precision, which never equals the real it
+    # @ was read from; casting here keeps the cursor's "search_rank = x" matching ties
+    return (
+        queryset.filter(search_vector=query)
+        .annotate(search_rank=Cast(SearchRank(F("search_vector"), query), FloatField()))
+        .order_by("-search_rank", "-datetime_created")
+    )
@@ -0,0 +1,387 @@
+import heapq
+import io
+import random
+import time
+from bisect import bisect
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from itertools import accumulate, islice
+
+from books.models import (
+    Author,
+    Book,
+    BookImage,
+    Category,
+    Comment,
+    ContentFormat,
+    Favorite,
+    Language,
+    Publisher,
+    Rating,
+    Translator,
+)
+from books.utils.search import refresh_search_vectors
+from core.cache.versions import bump_version
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.color import no_style
+from django.db import connections, transaction
+from django.db.models import Count, F, FloatField, OuterRef, Subquery, Sum
+from django.db.models.functions import Cast, Coalesce
+
+SEED_USERNAME_PREFIX = "seed_user_"
+SEED_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+SEED_WORDS = (
+    "book story author reader chapter page novel poem history classic translation edition library "
+    "quiet bright long short brilliant slow moving honest careful strange familiar"
+).split()
+
+SEED_BOOK_RELATIONS = ["authors", "translators", "languages", "content_formats"]
+
+DEFAULT_SCALE_SIZES = {
+    "books": 1_000,
+    "users": 200,
+    "authors": 300,
+    "translators": 100,
+    "publishers": 50,
+    "categories": 20,
+    "languages": 8,
+    "content_formats": 4,
+    "ratings": 10_000,
+    "favorites": 5_000,
+    "comments": 2_000,
+}
+
+
+# @ Zipf-like popularity: rank r is drawn with weight 1 / (r + 1) ** exponent, and ranks are
+# @ shuffled onto ids so popular rows are spread through the table instead of clustered at low ids.
+class ZipfSampler:
+    def __init__(self, ids, exponent, rng):
+        self.rng = rng
+        self.ids = list(ids)
+        rng.shuffle(self.ids)
+        self.weights = [1 / (rank + 1) ** exponent for rank in range(len(self.ids))]
+        self.cumulative = list(accumulate(self.weights))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def sample(self):
+        return self.ids[bisect(self.cumulative, self.rng.random() * self.cumulative[-1]) % len(self.ids)]
+
+    def sample_distinct(self, count):
+        if count > len(self.ids) // 4:
+            # @ Rejection sampling stalls near the population size; weighted sampling without
+            # @ replacement (Efraimidis-Spirakis keys) keeps the skew in one pass instead
+            keys = ((self.rng.random() ** (1 / weight), pk) for pk, weight in zip(self.ids, self.weights))
+            return [pk for _, pk in heapq.nlargest(count, keys)]
+        chosen = {}
+        while len(chosen) < count:
+            chosen.setdefault(self.sample(), None)
+        return list(chosen)
+
+    # @ Split total across ids in proportion to their weight, capped per id; the rounding remainder
+    # @ goes to the heaviest ids that still have room
+    def quotas(self, total, cap):
+        scale = total / self.cumulative[-1]
+        quotas = [min(int(weight * scale), cap) for weight in self.weights]
+        remainder = min(total, cap * len(quotas)) - sum(quotas)
+        while remainder > 0:
+            for position in range(len(quotas)):
+                if remainder and quotas[position] < cap:
+                    quotas[position] += 1
+                    remainder -= 1
+        return zip(self.ids, quotas)
+
+
+PASSTHROUGH_FIELD_TYPES = {
+    "AutoField",
+    "BigAutoField",
+    "ForeignKey",
+    "CharField",
+    "TextField",
+    "EmailField",
+    "IntegerField",
+    "PositiveIntegerField",
+    "PositiveSmallIntegerField",
+}
+
+
+def _copy_value(value):
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, timedelta):
+        return f"{value.total_seconds()} seconds"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    text = str(value)
+    return text.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+# @ COPY ... FROM STDIN on PostgreSQL, batched executemany elsewhere. Bypasses save(), signals and
+# @ auto_now, so every value (timestamps included) comes from the generator.
+def bulk_insert(model, field_names, rows, batch_size, using="default"):
+    connection = connections[using]
+    fields = [model._meta.get_field(name) for name in field_names]
+    table = connection.ops.quote_name(model._meta.db_table)
+    columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+    inserted = 0
+
+    # @ Generated ints and strings are already in database form; only adapt the other types
+    adapters = [
+        None if field.get_internal_type() in PASSTHROUGH_FIELD_TYPES else field.get_db_prep_save for field in fields
+    ]
+
+    rows = iter(rows)
+    while batch := list(islice(rows, batch_size)):
+        prepared = [
+            [value if adapt is None else adapt(value, connection) for adapt, value in zip(adapters, row)]
+            for row in batch
+        ]
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                buffer = io.StringIO("".join("\t".join(map(_copy_value, row)) + "\n" for row in prepared))
+                cursor.cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN", buffer)
+            else:
+                placeholders = ", ".join(["%s"] * len(fields))
+                cursor.executemany(f"INSERT INTO {table} ({columns}) VALUES ({placeholders})", prepared)
+        inserted += len(batch)
+    return inserted
+
+
+# @ Set-based deletes in dependency order: Model.delete() would load every row and fire the
+# @ rating/favorite signals once per row, which takes hours at seeding scale (image files stay on disk)
+def flush_seeded_data(using="default"):
+    through_models = [Book._meta.get_field(name).remote_field.through for name in SEED_BOOK_RELATIONS]
+    seeded_users = get_user_model().objects.using(using).filter(username__startswith=SEED_USERNAME_PREFIX)
+    with transaction.atomic(using=using):
+        for model in [*through_models, Rating, Favorite, Comment, BookImage, Book]:
+            model.objects.using(using).all()._raw_delete(using)
+        for model in (Author, Translator, Publisher, Category, Language, ContentFormat):
+            model.objects.using(using).all()._raw_delete(using)
+        seeded_users._raw_delete(using)
+    bump_version("books")
+
+
+class ScaleDataGenerator:
+    def __init__(self, sizes, seed=0, exponent=1.1, batch_size=10_000, using="default", log=print):
+        self.sizes = sizes
+        self.exponent = exponent
+        self.batch_size = batch_size
+        self.using = using
+        self.log = log
+        self.rng = random.Random(seed)
+
+    def run(self):
+        self.users = self.seed_users()
+        self.categories = self.seed_named(Category, "title", "Category", self.sizes["categories"])
+        self.publishers = self.seed_named(Publisher, "name", "Publisher", self.sizes["publishers"])
+        self.authors = self.seed_named(Author, "name", "Author", self.sizes["authors"])
+        self.translators = self.seed_named(Translator, "name", "Translator", self.sizes["translators"])
+        self.languages = self.seed_named(Language, "name", "Language", self.sizes["languages"])
+        self.content_formats = self.seed_named(ContentFormat, "name", "Format", self.sizes["content_formats"])
+        self.books = self.seed_books()
+        self.seed_book_relations()
+        self.seed_ratings()
+        self.seed_favorites()
+        self.seed_comments()
+        self.finish()
+
+    def step(self, label, model, field_names, rows):
+        started = time.perf_counter()
+        with transaction.atomic(using=self.using):
+            inserted = bulk_insert(model, field_names, rows, self.batch_size, self.using)
+        elapsed = time.perf_counter() - started
+        self.log(f"{label}: {inserted} rows in {elapsed:.2f}s ({inserted / max(elapsed, 1e-9):.0f} rows/sec)")
+        return inserted
+
+    def next_ids(self, model, count):
+        last = model.objects.using(self.using).order_by("-pk").values_list("pk", flat=True).first() or 0
+        return range(last + 1, last + 1 + count)
+
+    def sampler(self, ids):
+        return ZipfSampler(ids, self.exponent, self.rng)
+
+    def timestamp(self, days=365):
+        return SEED_EPOCH + timedelta(seconds=self.rng.randrange(days * 86_400))
+
+    def text(self, min_words, max_words):
+        return " ".join(self.rng.choices(SEED_WORDS, k=self.rng.randint(min_words, max_words)))
+
+    def seed_users(self):
+        ids = self.next_ids(get_user_model(), self.sizes["users"])
+        password = make_password("password", salt="seedscaledata")
+        rows = (
+            (
+                pk,
+                f"{SEED_USERNAME_PREFIX}{pk}",
+                f"{SEED_USERNAME_PREFIX}{pk}@example.com",
+                f"+9{pk:012d}",
+                password,
+                "",
+                "",
+                False,
+                False,
+                True,
+                self.timestamp(),
+            )
+            for pk in ids
+        )
+        fields = [
+            "id",
+            "username",
+            "email",
+            "phone_number",
+            "password",
+            "first_name",
+            "last_name",
+            "is_superuser",
+            "is_staff",
+            "is_active",
+            "date_joined",
+        ]
+        self.step("users", get_user_model(), fields, rows)
+        return self.sampler(ids)
+
+    def seed_named(self, model, column, label, count):
+        ids = self.next_ids(model, count)
+        fields = ["id", column]
+        extra = {field.name for field in model._meta.concrete_fields} - {"id", column}
+        # @ Free-text columns get short filler, timestamps come from the seed clock
+        extra_fields = sorted(extra)
+        rows = ((pk, f"{label} {pk}", *[self.seed_extra_value(model, name) for name in extra_fields]) for pk in ids)
+        self.step(model._meta.model_name, model, fields + extra_fields, rows)
+        return self.sampler(ids)
+
+    def seed_extra_value(self, model, name):
+        if name == "datetime_created":
+            return self.timestamp()
+        return self.text(5, 40)
+
+    def seed_books(self):
+        ids = self.next_ids(Book, self.sizes["books"])
+        fields = [
+            "id",
+            "name",
+            "description",
+            "publisher",
+            "category",
+            "price",
+            "active",
+            "volume",
+            "number_of_pages",
+            "approximate_study_time",
+            "publication_date",
+            "datetime_created",
+            "datetime_modified",
+            "rating_sum",
+            "rating_count",
+        ]
+
+        def rows():
+            for pk in ids:
+                created = self.timestamp()
+                yield (
+                    pk,
+                    f"Book {pk}",
+                    self.text(20, 120),
+                    self.publishers.sample(),
+                    self.categories.sample(),
+                    Decimal(self.rng.choice([0, self.rng.randrange(10, 2_000) * 1_000])),
+                    self.rng.random() < 0.9,
+                    self.rng.randint(1, 500),
+                    self.rng.randint(40, 1_200),
+                    timedelta(minutes=self.rng.randint(30, 3_000)),
+                    date(1950, 1, 1) + timedelta(days=self.rng.randrange(27_000)),
+                    created,
+                    created + timedelta(seconds=self.rng.randrange(90 * 86_400)),
+                    0,
+                    0,
+                )
+
+        self.step("books", Book, fields, rows())
+        return self.sampler(ids)
+
+    def seed_book_relations(self):
+        # @ (relation, related sampler, min, max) related rows per book
+        plan = [
+            ("authors", self.authors, 1, 3),
+            ("translators", self.translators, 0, 1),
+            ("languages", self.languages, 1, 2),
+            ("content_formats", self.content_formats, 1, 2),
+        ]
+        for relation, related, low, high in plan:
+            model_field = Book._meta.get_field(relation)
+            fields = [model_field.m2m_field_name(), model_field.m2m_reverse_field_name()]
+            upper = min(high, len(related))
+
+            def rows(related=related, low=low, upper=upper):
+                for book_id in sorted(self.books.ids):
+                    for related_id in related.sample_distinct(self.rng.randint(min(low, upper), upper)):
+                        yield book_id, related_id
+
+            self.step(f"book {relation}", model_field.remote_field.through, fields, rows())
+
+    def iter_user_books(self, total):
+        for user_id, quota in self.users.quotas(total, cap=len(self.books)):
+            for book_id in self.books.sample_distinct(quota):
+                yield user_id, book_id
+
+    def seed_ratings(self):
+        rows = (
+            (user_id, book_id, self.rng.choices((1, 2, 3, 4, 5), weights=(1, 1, 3, 5, 4))[0], self.timestamp())
+            for user_id, book_id in self.iter_user_books(self.sizes["ratings"])
+        )
+        self.step("ratings", Rating, ["user", "book", "score", "datetime_created"], rows)
+
+    def seed_favorites(self):
+        rows = (
+            (user_id, book_id, self.timestamp()) for user_id, book_id in self.iter_user_books(self.sizes["favorites"])
+        )
+        self.step("favorites", Favorite, ["user", "book", "datetime_created"], rows)
+
+    def seed_comments(self):
+        statuses = [
+            Comment.COMMENT_STATUS_APPROVED,
+            Comment.COMMENT_STATUS_WAITING,
+            Comment.COMMENT_STATUS_NOT_APPROVED,
+        ]
+        rows = (
+            (
+                self.users.sample(),
+                self.books.sample(),
+                self.text(5, 60),
+                self.timestamp(),
+                self.rng.choices(statuses, weights=(80, 15, 5))[0],
+            )
+            for _ in range(self.sizes["comments"])
+        )
+        self.step("comments", Comment, ["user", "book", "body", "datetime_created", "status"], rows)
+
+    # @ Work the skipped signals would have done: rating aggregates, search vectors, sequences, stats
+    def finish(self):
+        started = time.perf_counter()
+        # @ Seeded ids are contiguous; a range keeps 100k+ ids out of the SQL (SQLite caps bound parameters)
+        books = Book.objects.using(self.using).filter(pk__range=(min(self.books.ids), max(self.books.ids)))
+        stats = Rating.objects.using(self.using).filter(book=OuterRef("pk")).values("book")
+        with transaction.atomic(using=self.using):
+            books.update(
+                rating_sum=Coalesce(Subquery(stats.annotate(total=Sum("score")).values("total")), 0),
+                rating_count=Coalesce(Subquery(stats.annotate(count=Count("id")).values("count")), 0),
+            )
+            books.filter(rating_count__gt=0).update(
+                avg_rating=Cast(F("rating_sum"), FloatField()) / Cast(F("rating_count"), FloatField())
+            )
+            refresh_search_vectors(books)
+
+        connection = connections[self.using]
+        models = [get_user_model(), Author, Translator, Publisher, Category, Language, ContentFormat, Book]
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), models):
+                cursor.execute(sql)
+            if connection.vendor == "postgresql":
+                cursor.execute("ANALYZE")
+        bump_version("books")
+        self.log(f"aggregates, search vectors and statistics: {time.perf_counter() - started:.2f}s")
@@ -0,0 +1,85 @@
+from books.models import Author, Book, Publisher, Translator
+from core.cache.keys import digest
+from core.cache.versions import get_version
+from core.instrumentation.metrics import record_cache_lookup
+from django.conf import settings
+from django.contrib.postgres.search import TrigramSimilarity
+from django.core.cache import cache
+from django.db import OperationalError, connections, transaction
+from django.db.models import Case, CharField, F, FloatField, Value, When
+
+from .search import is_search_vector_supported
+
+# @ (kind, model, label column)
+SUGGESTION_SOURCES = [
+    ("book", Book, "name"),
+    ("author", Author, "name"),
+    ("translator", Translator, "name"),
+    ("publisher", Publisher, "name"),
+]
+
+# @ SQLSTATE query_canceled, which statement_timeout raises (psycopg2 pgcode / psycopg sqlstate)
+QUERY_CANCELED = "57014"
+
+
+def normalize_suggestion_query(value):
+    return " ".join(value.split()).lower()
+
+
+def _score(column, query, using):
+    prefix_bonus = Case(When(**{f"{column}__istartswith": query}, then=Value(1.0)), default=Value(0.0))
+    if is_search_vector_supported(using):
+        return TrigramSimilarity(column, query) + prefix_bonus
+    return prefix_bonus
+
+
+# @ One UNION ALL query; icontains is served by the pg_trgm GIN indexes on PostgreSQL
+def build_suggestion_queryset(query, limit, using="default"):
+    parts = [
+        model.objects.using(using)
+        .filter(**{f"{column}__icontains": query})
+        .exclude(**{column: ""})
+        .annotate(
+            label=F(column),
+            kind=Value(kind, output_field=CharField()),
+            score=_score(column, query, using),
+        )
+        .values("id", "label", "kind", "score")
+        for kind, model, column in SUGGESTION_SOURCES
+    ]
+    return parts[0].union(*parts[1:], all=True).order_by("-score", "label")[:limit]
+
+
+def _run_with_timeout(queryset, timeout_ms, using):
+    if not timeout_ms or connections[using].vendor != "postgresql":
+        return list(queryset)
+
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        cursor.execute("SET LOCAL statement_timeout = %s", [int(timeout_ms)])
+        return list(queryset)
+
+
+def is_statement_timeout(exc):
+    cause = exc.__cause__
+    return getattr(cause, "pgcode", None) == QUERY_CANCELED or getattr(cause, "sqlstate", None) == QUERY_CANCELED
+
+
+def get_suggestions(query, limit, using="default"):
+    query = normalize_suggestion_query(query)
+    cache_key = f"suggest:{get_version('books')}:{limit}:{digest(query)}"
+    cached = cache.get(cache_key)
+    record_cache_lookup(cached is not None, "suggestions")
+    if cached is not None:
+        return cached, False
+
+    try:
+        rows = _run_with_timeout(build_suggestion_queryset(query, limit, using), settings.SUGGEST_TIMEOUT_MS, using)
+    except OperationalError as exc:
+        # @ Over the latency budget: answer empty rather than hold the request open; any other failure surfaces
+        if not is_statement_timeout(exc):
+            raise
+        return [], True
+
+    suggestions = [{"id": row["id"], "label": row["label"], "kind": row["kind"]} for row in rows]
+    cache.set(cache_key, suggestions, settings.SUGGEST_CACHE_TIMEOUT)
+    return suggestions, False
@@ -0,0 +1,23 @@
+from books.models import Rating
+from books.utils.favorites import get_favorite_membership
+
+
+# @ Merge user-specific fields into shared (user-independent) book payloads, in place.
+# @ Only fields present in the payload are filled, so sparse fieldsets skip the lookups they don't need.
+def apply_user_overlay(books_data, user):
+    if not books_data or not user.is_authenticated:
+        return books_data
+
+    book_ids = [book["id"] for book in books_data]
+
+    if "my_rating" in books_data[0]:
+        my_ratings = dict(Rating.objects.filter(user=user, book_id__in=book_ids).values_list("book_id", "score"))
+        for book in books_data:
+            book["my_rating"] = my_ratings.get(book["id"])
+
+    if "is_favorited" in books_data[0]:
+        favorite_book_ids = get_favorite_membership(user).filter(book_ids)
+        for book in books_data:
+            book["is_favorited"] = book["id"] in favorite_book_ids
+
+    return books_data
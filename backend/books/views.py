@@ -1,86 +1,169 @@
+from functools import partial
+
 from books.filters.book_filters import BookFilter
 from books.serializers.book_image_serializers import BookImageSerializer
+from books.serializers.fast_book_serializers import build_book_representation
 from books.serializers.favorite_serializers import FavoriteSerializer
 from books.serializers.rating_serializers import RatingSerializer
+from books.utils.export import iter_catalog_ndjson, parse_since
+from books.utils.facets import get_facets
+from books.utils.fieldsets import build_book_list_queryset, get_selected_book_fields, prune_book_queryset
+from books.utils.suggestions import get_suggestions
+from books.utils.user_overlay import apply_user_overlay
+from core.cache.conditional import ConditionalResponseMixin
+from core.cache.responses import CachedResponseMixin
+from core.instrumentation.metrics import measure_serialization
 from core.pagination.books import BookPagination
 from core.pagination.favorites import FavoritePagination
-from django.db.models import Avg, Count, IntegerField, OuterRef, Subquery, Value
+from core.renderers import NDJSONRenderer
+from django.conf import settings
+from django.http import StreamingHttpResponse
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.filters import OrderingFilter
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet, ReadOnlyModelViewSet
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from .models import Book, BookImage, Comment, Favorite, Rating
-from .serializers.book_serializers import BookSerializer
+from .serializers.book_serializers import BookListSerializer, BookSerializer
 from .serializers.comment_serializers import CommentSerializer
 
 
 # Create your views here.
-class BookViewSet(ReadOnlyModelViewSet):
+class BookViewSet(ConditionalResponseMixin, CachedResponseMixin, ReadOnlyModelViewSet):
     serializer_class = BookSerializer
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_class = BookFilter
     ordering_fields = ["price", "datetime_created", "datetime_modified"]
     pagination_class = BookPagination
-
+    response_cache_namespace = "books"
+    response_cache_actions = ("list", "retrieve", "bulk")
+    conditional_actions = ("list", "retrieve", "bulk")
+    bulk_max_ids = 200
+    # @ Most queries per request on a cold cache, signed in, on PostgreSQL (whose paginated counts may add a
+    # @ planner estimate); the page size must never change them. export streams a fixed set per chunk instead.
+    query_budgets = {"list": 10, "retrieve": 8, "bulk": 8, "facets": 5}
+
+    # @ The queryset and serializer build the shared, user-independent payload
     def get_queryset(self):
-        user = self.request.user
-
-        queryset = (
-            Book.objects.select_related("publisher", "category")
-            .prefetch_related("images", "authors", "translators", "content_formats", "languages")
-            .annotate(
-                avg_rating=Avg("ratings__score"),
-                rating_count=Count("ratings__id"),
-            )
-            .order_by("-datetime_created")
-            .distinct()
-            .all()
-        )
+        queryset = Book.objects.defer("search_vector").order_by("-datetime_created").all()
+        if self.uses_list_representation():
+            return build_book_list_queryset(queryset, extra_columns=self.ordering_fields)
+        return prune_book_queryset(queryset, self.get_selected_fields(), extra_columns=self.ordering_fields)
 
-        if user.is_authenticated:
-            queryset = queryset.annotate(
-                my_rating=Subquery(
-                    Rating.objects.filter(
-                        book=OuterRef("pk"),
-                        user=user,
-                    ).values("score"),
-                    output_field=IntegerField(),
-                )
-            )
-        else:
-            queryset = queryset.annotate(my_rating=Value(None, output_field=IntegerField()))
-
-        return queryset
+    # @ Lists are compact unless the client asks for an explicit fieldset (?fields= / ?include=)
+    def uses_list_representation(self):
+        return self.action == "list" and self.get_selected_fields() is None
 
-    def get_serializer_context(self):
-        context = super().get_serializer_context()
-        user = self.request.user
+    def get_serializer_class(self):
+        if self.uses_list_representation():
+            return BookListSerializer
+        return BookSerializer
 
-        if user.is_authenticated:
-            favorite_book_ids = set(Favorite.objects.filter(user=user).values_list("book_id", flat=True))
-        else:
-            favorite_book_ids = set()
+    def get_selected_fields(self):
+        if not hasattr(self, "_selected_fields"):
+            self._selected_fields = get_selected_book_fields(self.request.query_params, BookSerializer.Meta.fields)
+        return self._selected_fields
 
-        context["favorite_book_ids"] = favorite_book_ids
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["selected_fields"] = self.get_selected_fields()
         return context
 
-
-class BookImageViewSet(ReadOnlyModelViewSet):
+    # @ Fast path: page over values() rows and bulk-load relations per page instead of a serializer per row
+    def render_list(self, request, *args, **kwargs):
+        representation = build_book_representation(self.get_serializer()) if settings.BOOK_LIST_FAST_PATH else None
+        if representation is None:
+            return super().render_list(request, *args, **kwargs)
+
+        columns = representation.columns + [name for name in self.ordering_fields if name not in representation.columns]
+        queryset = self.filter_queryset(Book.objects.order_by("-datetime_created").values(*columns))
+        rows = self.paginate_queryset(queryset)
+        with measure_serialization():
+            data = representation.represent(rows)
+        return self.get_paginated_response(data)
+
+    # @ The overlay depends on the user's favorites as well as the shared catalog
+    def get_conditional_scopes(self, request):
+        scopes = [("books",)]
+        if request.user.is_authenticated:
+            scopes.append(("favorites", request.user.pk))
+        return scopes
+
+    # @ my_rating / is_favorited are merged in from lookups limited to the books in the payload
+    def personalize_response_data(self, request, data):
+        books_data = data["results"] if self.action in ("list", "bulk") else [data]
+        apply_user_overlay(books_data, request.user)
+        return data
+
+    # @ Several books by id in one round trip, returned in request order (unknown ids are skipped)
+    @action(detail=False, methods=["get"])
+    def bulk(self, request, *args, **kwargs):
+        cached_bulk = partial(self.dispatch_cached, self.render_bulk)
+        return self.dispatch_conditional(cached_bulk, request, *args, **kwargs)
+
+    def render_bulk(self, request, *args, **kwargs):
+        book_ids = self.get_bulk_ids(request)
+        books = self.get_queryset().in_bulk(book_ids)
+        serializer = self.get_serializer([books[pk] for pk in book_ids if pk in books], many=True)
+        return Response({"results": serializer.data})
+
+    def get_bulk_ids(self, request):
+        try:
+            book_ids = [int(value) for value in request.query_params.get("ids", "").split(",") if value.strip()]
+        except ValueError:
+            raise ValidationError({"ids": "Expected a comma-separated list of book ids."})
+
+        book_ids = list(dict.fromkeys(book_ids))
+        if len(book_ids) > self.bulk_max_ids:
+            raise ValidationError({"ids": f"At most {self.bulk_max_ids} ids can be requested at once."})
+        return book_ids
+
+    # @ Whole catalog as newline-delimited JSON, streamed in chunks; ?since= limits it to recently saved books
+    # @ (see get_export_queryset for the changes it cannot see)
+    @action(detail=False, methods=["get"], renderer_classes=[NDJSONRenderer])
+    def export(self, request):
+        since = request.query_params.get("since")
+        if since is not None:
+            since = parse_since(since)
+            if since is None:
+                raise ValidationError({"since": "Expected an ISO 8601 date or datetime."})
+
+        return StreamingHttpResponse(iter_catalog_ndjson(request, since), content_type=NDJSONRenderer.media_type)
+
+    # @ Sidebar counts for the same filter params as the list endpoint
+    @action(detail=False, methods=["get"])
+    def facets(self, request):
+        filtered_queryset = self.filter_queryset(Book.objects.all())
+        return Response(get_facets(request, filtered_queryset))
+
+
+class BookImageViewSet(ConditionalResponseMixin, ReadOnlyModelViewSet):
     serializer_class = BookImageSerializer
+    query_budgets = {"list": 1, "retrieve": 1}
+
+    # @ Image saves and deletes bump the catalog version
+    def get_conditional_scopes(self, request):
+        return [("books",)]
 
     def get_queryset(self):
         book_pk = self.kwargs["book_pk"]
         return BookImage.objects.filter(book__id=book_pk).all()
 
 
-class CommentViewSet(ModelViewSet):
+class CommentViewSet(ConditionalResponseMixin, ModelViewSet):
     http_method_names = ["get", "post", "head", "options"]
     serializer_class = CommentSerializer
     authentication_classes = [JWTAuthentication]
+    query_budgets = {"list": 1, "retrieve": 1, "create": 1}
+
+    def get_conditional_scopes(self, request):
+        return [("comments", self.kwargs["book_pk"])]
 
     def get_permissions(self):
         if self.request.method == "POST":
@@ -107,6 +190,7 @@ class FavoriteViewSet(ModelViewSet):
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
     pagination_class = FavoritePagination
+    query_budgets = {"list": 3, "create": 3}
 
     def get_queryset(self):
         user_id = self.request.user.id
@@ -132,6 +216,7 @@ class RatingViewSet(ModelViewSet):
     serializer_class = RatingSerializer
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
+    query_budgets = {"list": 1, "retrieve": 1, "create": 3}
 
     # @ Return only current user's rating for the selected book
     def get_queryset(self):
@@ -142,3 +227,25 @@ class RatingViewSet(ModelViewSet):
     def perform_create(self, serializer):
         book_pk = self.kwargs["book_pk"]
         serializer.save(user=self.request.user, book_id=book_pk)
+
+
+class SuggestionView(APIView):
+    permission_classes = [AllowAny]
+    # @ PostgreSQL adds the SET LOCAL statement_timeout
+    query_budgets = {"get": 2}
+    min_query_length = 2
+    default_limit = 8
+    max_limit = 20
+
+    def get(self, request):
+        query = request.query_params.get("q", "").strip()
+        try:
+            limit = min(max(int(request.query_params.get("limit", self.default_limit)), 1), self.max_limit)
+        except ValueError:
+            limit = self.default_limit
+
+        if len(query) < self.min_query_length:
+            return Response({"results": [], "timed_out": False})
+
+        suggestions, timed_out = get_suggestions(query, limit)
+        return Response({"results": suggestions, "timed_out": timed_out})
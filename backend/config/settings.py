@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 from datetime import timedelta
+from importlib.util import find_spec
 from pathlib import Path
 import dj_database_url
 from environs import Env
@@ -53,12 +54,15 @@ INSTALLED_APPS = [
     'django_filters',
     'rest_framework',
     'djoser',
-    'debug_toolbar',
+    *(['debug_toolbar'] if DEBUG else []),
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
-    'debug_toolbar.middleware.DebugToolbarMiddleware',
+    'core.instrumentation.middleware.InstrumentationMiddleware',
+    'core.queries.middleware.QueryInspectionMiddleware',
+    'core.queries.middleware.SlowQueryLogMiddleware',
+    *(['debug_toolbar.middleware.DebugToolbarMiddleware'] if DEBUG else []),
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -105,6 +109,20 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Production must use a backend shared by every gunicorn worker and manage.py command (docker-compose.prod.yml
+# points CACHE_BACKEND at its Redis service); with the per-process LocMemCache, version bumps made by one
+# process are invisible to the others.
+
+CACHES = {
+    "default": {
+        "BACKEND": env.str("CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": env.str("CACHE_LOCATION", default="libra"),
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -161,8 +179,97 @@ REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     ),
+    # @ orjson first (default); MessagePack when installed and asked for via Accept; browsable API only in DEBUG
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.ORJSONRenderer',
+        *(['core.renderers.MessagePackRenderer'] if find_spec('msgpack') else []),
+        *(['rest_framework.renderers.BrowsableAPIRenderer'] if DEBUG else []),
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'core.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
+# @ PAGINATION SETTINGS
+# Seconds a page count stays cached for one filter set (writes invalidate it earlier)
+PAGINATION_COUNT_CACHE_TIMEOUT = env.int('PAGINATION_COUNT_CACHE_TIMEOUT', 60)
+# On PostgreSQL, planner estimates at or above this many rows replace the exact COUNT (0 disables)
+PAGINATION_COUNT_ESTIMATE_THRESHOLD = env.int('PAGINATION_COUNT_ESTIMATE_THRESHOLD', 100_000)
+
+# @ RESPONSE CACHE SETTINGS
+# Seconds a shared catalog response stays cached (writes invalidate it earlier)
+RESPONSE_CACHE_TIMEOUT = env.int('RESPONSE_CACHE_TIMEOUT', 300)
+# ETag / Last-Modified built from the cache version counters. They only agree across processes on a shared cache,
+# so outside DEBUG this is off by default with a per-process backend.
+CONDITIONAL_REQUESTS = env.bool(
+    'CONDITIONAL_REQUESTS',
+    DEBUG or CACHES['default']['BACKEND'].rsplit('.', 1)[-1] not in ('LocMemCache', 'DummyCache'),
+)
+
+# Build book list pages from values() rows instead of a serializer per row (same output)
+BOOK_LIST_FAST_PATH = env.bool('BOOK_LIST_FAST_PATH', True)
+
+# Seconds facet counts stay cached for one filter set (writes invalidate them earlier)
+FACETS_CACHE_TIMEOUT = env.int('FACETS_CACHE_TIMEOUT', 300)
+
+# Books per chunk for the streaming NDJSON catalog export (rows and their relations are loaded per chunk)
+CATALOG_EXPORT_CHUNK_SIZE = env.int('CATALOG_EXPORT_CHUNK_SIZE', 1000)
+
+# Favorite book ids are cached per user (write-through on toggle) up to this many favorites
+FAVORITES_MEMBERSHIP_MAX_SIZE = env.int('FAVORITES_MEMBERSHIP_MAX_SIZE', 10_000)
+FAVORITES_MEMBERSHIP_CACHE_TIMEOUT = env.int('FAVORITES_MEMBERSHIP_CACHE_TIMEOUT', 86_400)
+
+# @ INSTRUMENTATION SETTINGS
+# Server-Timing header and one JSON log line (core.instrumentation logger) per request; off removes the middleware
+REQUEST_INSTRUMENTATION = env.bool('REQUEST_INSTRUMENTATION', True)
+# Requests at or above this many milliseconds are logged at WARNING instead of INFO
+REQUEST_SLOW_MS = env.int('REQUEST_SLOW_MS', 1000)
+# /metrics requires "Authorization: Bearer <token>"; without a token it only answers when DEBUG is on
+PROMETHEUS_METRICS_TOKEN = env.str('PROMETHEUS_METRICS_TOKEN', '')
+# Prometheus series for /metrics, on by default once a token is set.
+# Under gunicorn, PROMETHEUS_MULTIPROC_DIR (set in gunicorn.conf.py) merges the workers.
+PROMETHEUS_METRICS = env.bool('PROMETHEUS_METRICS', bool(PROMETHEUS_METRICS_TOKEN))
+
+# @ QUERY INSPECTION SETTINGS
+# Log likely N+1 queries (same SQL shape repeated in one request) and views over their query budget
+QUERY_INSPECTION = env.bool('QUERY_INSPECTION', DEBUG)
+# Statements with one shape per request before it is reported as a likely N+1
+QUERY_INSPECTION_REPEAT_THRESHOLD = env.int('QUERY_INSPECTION_REPEAT_THRESHOLD', 3)
+
+# @ SLOW QUERY LOG SETTINGS
+# Statements at or above SLOW_QUERY_MS go to a ring buffer in the shared cache,
+# read by /api/slow-queries/ and manage.py slow_queries
+SLOW_QUERY_LOG = env.bool('SLOW_QUERY_LOG', True)
+SLOW_QUERY_MS = env.int('SLOW_QUERY_MS', 200)
+# Fraction of slow statements recorded, and of those (PostgreSQL SELECTs only) also given an EXPLAIN (FORMAT JSON) plan
+SLOW_QUERY_SAMPLE_RATE = env.float('SLOW_QUERY_SAMPLE_RATE', 1.0)
+SLOW_QUERY_EXPLAIN_RATE = env.float('SLOW_QUERY_EXPLAIN_RATE', 0.1)
+# Records kept; the newest overwrite the oldest
+SLOW_QUERY_BUFFER_SIZE = env.int('SLOW_QUERY_BUFFER_SIZE', 500)
+
+# @ LOGGING SETTINGS
+# core.* loggers (request metrics, query inspection) go to the console; INFO adds one line per request
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'core': {'handlers': ['console'], 'level': env.str('CORE_LOG_LEVEL', 'WARNING'), 'propagate': False},
+    },
+}
+
+# @ SEARCH SETTINGS
+# Text search configuration used for Book.search_vector on PostgreSQL ("simple" suits mixed-language titles)
+BOOK_SEARCH_CONFIG = env.str('BOOK_SEARCH_CONFIG', 'simple')
+
+# Autocomplete latency budget in milliseconds (PostgreSQL statement_timeout) and cache TTL in seconds
+SUGGEST_TIMEOUT_MS = env.int('SUGGEST_TIMEOUT_MS', 150)
+SUGGEST_CACHE_TIMEOUT = env.int('SUGGEST_CACHE_TIMEOUT', 30)
+
 # @ DJOSER SETTINGS
 DJOSER = {
     'SERIALIZERS': {
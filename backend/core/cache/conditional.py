@@ -0,0 +1,69 @@
+import math
+
+from core.cache.keys import digest
+from core.cache.versions import get_version, get_version_timestamp
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date, parse_etags, parse_http_date_safe, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+
+class ConditionalResponseMixin:
+    # @ Version scopes whose counters cover everything the response renders
+    conditional_actions = ("list", "retrieve")
+
+    def get_conditional_scopes(self, request):
+        return []
+
+    def should_handle_conditional(self, request):
+        return (
+            settings.CONDITIONAL_REQUESTS
+            and request.method in ("GET", "HEAD")
+            and self.action in self.conditional_actions
+        )
+
+    # @ Validators come from the cache version counters only, so a 304 never touches the database
+    def get_conditional_validators(self, request):
+        scopes = self.get_conditional_scopes(request)
+        versions = [get_version(*scope) for scope in scopes]
+        user_id = request.user.pk if request.user.is_authenticated else None
+        etag = quote_etag(digest(versions, request.get_full_path(), request.accepted_media_type, user_id, self.action))
+        last_modified = max((get_version_timestamp(*scope) for scope in scopes), default=None)
+        return etag, None if last_modified is None else math.floor(last_modified)
+
+    def is_not_modified(self, request, etag, last_modified):
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match is not None:
+            etags = parse_etags(if_none_match)
+            # @ Weak comparison, as RFC 9110 requires for If-None-Match
+            return "*" in etags or etag.removeprefix("W/") in [tag.removeprefix("W/") for tag in etags]
+
+        if_modified_since = parse_http_date_safe(request.headers.get("If-Modified-Since", ""))
+        return last_modified is not None and if_modified_since is not None and last_modified <= if_modified_since
+
+    def set_conditional_headers(self, response, etag, last_modified):
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        patch_vary_headers(response, ["Accept", "Authorization"])
+        return response
+
+    def dispatch_conditional(self, handler, request, *args, **kwargs):
+        if not self.should_handle_conditional(request):
+            return handler(request, *args, **kwargs)
+
+        etag, last_modified = self.get_conditional_validators(request)
+        if self.is_not_modified(request, etag, last_modified):
+            return self.set_conditional_headers(Response(status=status.HTTP_304_NOT_MODIFIED), etag, last_modified)
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            self.set_conditional_headers(response, etag, last_modified)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.dispatch_conditional(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.dispatch_conditional(super().retrieve, request, *args, **kwargs)
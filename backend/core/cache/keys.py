@@ -0,0 +1,13 @@
+import hashlib
+import json
+
+# @ Query params that never change which rows match a filter set
+NON_FILTER_QUERY_PARAMS = {"page", "page_size", "cursor", "ordering", "format"}
+
+
+def normalize_query_params(query_params, exclude=()):
+    return sorted((name, sorted(query_params.getlist(name))) for name in query_params if name not in exclude)
+
+
+def digest(*parts):
+    return hashlib.md5(json.dumps(parts, default=str).encode()).hexdigest()
@@ -0,0 +1,63 @@
+from core.cache.keys import digest, normalize_query_params
+from core.cache.versions import get_version
+from core.instrumentation.metrics import record_cache_lookup
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+
+
+class CachedResponseMixin:
+    # @ Version namespace bumped by signals whenever the cached data changes
+    response_cache_namespace = None
+    response_cache_actions = ("list", "retrieve")
+
+    def get_response_cache_timeout(self):
+        return settings.RESPONSE_CACHE_TIMEOUT
+
+    def should_cache_response(self, request):
+        return self.response_cache_namespace is not None and self.action in self.response_cache_actions
+
+    def get_response_cache_key(self, request):
+        # @ Host is part of the key because payloads contain absolute URLs
+        key_digest = digest(request.build_absolute_uri(request.path), normalize_query_params(request.query_params))
+        version = get_version(self.response_cache_namespace)
+        return f"response:{self.response_cache_namespace}:{version}:{self.action}:{key_digest}"
+
+    # @ Cached payloads are shared by every user; per-user fields are merged in here
+    def personalize_response_data(self, request, data):
+        return data
+
+    def dispatch_cached(self, handler, request, *args, **kwargs):
+        if not self.should_cache_response(request):
+            return handler(request, *args, **kwargs)
+
+        cache_key = self.get_response_cache_key(request)
+        data = cache.get(cache_key)
+        record_cache_lookup(data is not None, "responses")
+        if data is None:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            cache.set(cache_key, response.data, self.get_response_cache_timeout())
+            response["X-Cache"] = "MISS"
+        else:
+            response = Response(data)
+            response["X-Cache"] = "HIT"
+
+        # @ Cache backends serialize on set, so the stored payload is unaffected
+        response.data = self.personalize_response_data(request, response.data)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.dispatch_cached(self.render_list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.dispatch_cached(self.render_retrieve, request, *args, **kwargs)
+
+    # @ Uncached renderers; views override these instead of list/retrieve to keep the cache in front
+    def render_list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    def render_retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
@@ -0,0 +1,43 @@
+import time
+
+from django.core.cache import cache
+
+
+# @ Version counters let cache entries go stale by bumping one key instead of scanning keys
+def get_version_key(*scope):
+    return "version:" + ":".join(str(part) for part in scope)
+
+
+def get_version_timestamp_key(*scope):
+    return get_version_key(*scope) + ":at"
+
+
+def get_version(*scope):
+    key = get_version_key(*scope)
+    version = cache.get(key)
+    if version is None:
+        # @ Seed from the clock so an evicted counter never restarts at an old value
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+# @ When the scope last changed (epoch seconds); an unknown time is treated as "now"
+def get_version_timestamp(*scope):
+    key = get_version_timestamp_key(*scope)
+    timestamp = cache.get(key)
+    if timestamp is None:
+        cache.add(key, time.time(), None)
+        timestamp = cache.get(key)
+    return timestamp
+
+
+def bump_version(*scope):
+    key = get_version_key(*scope)
+    cache.set(get_version_timestamp_key(*scope), time.time(), None)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        version = time.time_ns()
+        cache.set(key, version, None)
+        return version
@@ -0,0 +1,117 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from core.instrumentation.prometheus import observe_cache_lookup, observe_query
+
+# @ The metrics of the request being served, or None when instrumentation is off (every hook is then a no-op)
+_request_metrics = ContextVar("request_metrics", default=None)
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.duration = None
+        self.db_queries = 0
+        self.db_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.serialize_time = 0.0
+        self.render_time = 0.0
+        self.serializing = False
+        self.render_started = None
+
+    # @ Installed with connection.execute_wrapper for the duration of the request
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started
+            self.db_queries += 1
+            self.db_time += duration
+            observe_query(context["connection"], duration)
+
+    def start_render(self):
+        self.render_started = time.perf_counter()
+
+    def finish_render(self, response=None):
+        if self.render_started is not None:
+            self.render_time += time.perf_counter() - self.render_started
+            self.render_started = None
+
+    def finish(self):
+        self.duration = time.perf_counter() - self.started
+
+    # @ Overlapping phases: queries run inside serialization when querysets are evaluated lazily
+    def server_timing(self):
+        return ", ".join(
+            [
+                f'db;dur={self.db_time * 1000:.1f};desc="{self.db_queries} queries"',
+                f'cache;desc="hits={self.cache_hits} misses={self.cache_misses}"',
+                f"serialize;dur={self.serialize_time * 1000:.1f}",
+                f"render;dur={self.render_time * 1000:.1f}",
+                f"total;dur={self.duration * 1000:.1f}",
+            ]
+        )
+
+    def as_dict(self):
+        return {
+            "duration_ms": round(self.duration * 1000, 2),
+            "db_queries": self.db_queries,
+            "db_ms": round(self.db_time * 1000, 2),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "serialize_ms": round(self.serialize_time * 1000, 2),
+            "render_ms": round(self.render_time * 1000, 2),
+        }
+
+
+def get_request_metrics():
+    return _request_metrics.get()
+
+
+@contextmanager
+def collect_request_metrics():
+    metrics = RequestMetrics()
+    token = _request_metrics.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _request_metrics.reset(token)
+        metrics.finish()
+
+
+# @ Counted per request for Server-Timing, and per cache name for the Prometheus hit ratio
+def record_cache_lookup(hit, name="default"):
+    observe_cache_lookup(name, hit)
+    metrics = _request_metrics.get()
+    if metrics is not None:
+        if hit:
+            metrics.cache_hits += 1
+        else:
+            metrics.cache_misses += 1
+
+
+# @ Only the outermost serialization is timed; nested serializers and per-row calls run inside it
+@contextmanager
+def measure_serialization():
+    metrics = _request_metrics.get()
+    if metrics is None or metrics.serializing:
+        yield
+        return
+    metrics.serializing = True
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.serializing = False
+        metrics.serialize_time += time.perf_counter() - started
+
+
+class TimedRepresentationMixin:
+    def to_representation(self, instance):
+        if _request_metrics.get() is None:
+            return super().to_representation(instance)
+        with measure_serialization():
+            return super().to_representation(instance)
@@ -0,0 +1,65 @@
+import json
+import logging
+from contextlib import ExitStack
+
+from core.instrumentation import prometheus
+from core.instrumentation.metrics import collect_request_metrics
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+# @ Per-request DB / cache / serialize / render timings as a Server-Timing header and one JSON log line
+# @ (INFO, or WARNING past REQUEST_SLOW_MS), and the same numbers as Prometheus series (PROMETHEUS_METRICS).
+# @ Removed from the stack entirely when both are off.
+class InstrumentationMiddleware:
+    def __init__(self, get_response):
+        self.server_timing = settings.REQUEST_INSTRUMENTATION
+        self.prometheus = settings.PROMETHEUS_METRICS
+        if not (self.server_timing or self.prometheus):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if self.prometheus:
+            prometheus.REQUESTS_IN_FLIGHT.inc()
+        try:
+            with collect_request_metrics() as metrics, ExitStack() as stack:
+                request.metrics = metrics
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(metrics))
+                response = self.get_response(request)
+        finally:
+            if self.prometheus:
+                prometheus.REQUESTS_IN_FLIGHT.dec()
+
+        # @ Streaming bodies are produced after this returns, so their work is not included
+        if self.prometheus:
+            prometheus.observe_request(request, response, metrics)
+        if self.server_timing:
+            response["Server-Timing"] = metrics.server_timing()
+            self.log(request, response, metrics)
+        return response
+
+    # @ Runs just before the response is rendered; the post-render callback closes the render span
+    def process_template_response(self, request, response):
+        request.metrics.start_render()
+        response.add_post_render_callback(request.metrics.finish_render)
+        return response
+
+    def log(self, request, response, metrics):
+        level = logging.WARNING if metrics.duration * 1000 >= settings.REQUEST_SLOW_MS else logging.INFO
+        if not logger.isEnabledFor(level):
+            return
+        match = getattr(request, "resolver_match", None)
+        record = {
+            "method": request.method,
+            "path": request.path,
+            "route": match.route if match else None,
+            "view": match.view_name if match else None,
+            "status": response.status_code,
+            **metrics.as_dict(),
+        }
+        logger.log(level, json.dumps(record), extra={"request_metrics": record})
@@ -0,0 +1,99 @@
+import os
+import time
+from functools import wraps
+
+from django.conf import settings
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+
+# @ Under gunicorn every worker writes its samples to mmapped files in PROMETHEUS_MULTIPROC_DIR (see gunicorn.conf.py)
+# @ and a scrape merges them, so any worker can answer /metrics for all of them. prometheus_client picks that storage
+# @ when it is imported, so the variable has to be set before the app loads.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+SIGNAL_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+UNMATCHED_ROUTE = "unmatched"
+
+REQUESTS = Counter("http_requests", "Requests served.", ["route", "method", "status"])
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "Request latency.", ["route", "method"], buckets=LATENCY_BUCKETS
+)
+REQUESTS_IN_FLIGHT = Gauge("http_requests_in_flight", "Requests being served.", multiprocess_mode="livesum")
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries", "Database queries per request.", ["route"], buckets=QUERY_COUNT_BUCKETS
+)
+REQUEST_DB_DURATION = Histogram(
+    "http_request_db_duration_seconds", "Database time per request.", ["route"], buckets=LATENCY_BUCKETS
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds", "Database statement latency.", ["database"], buckets=QUERY_BUCKETS
+)
+CACHE_LOOKUPS = Counter("cache_lookups", "Cache lookups by cache and result.", ["cache", "result"])
+PAGINATION_COUNTS = Counter("pagination_counts", "Page counts by how they were resolved.", ["namespace", "strategy"])
+SIGNAL_HANDLER_DURATION = Histogram(
+    "signal_handler_duration_seconds", "Signal receiver latency.", ["handler"], buckets=SIGNAL_BUCKETS
+)
+
+
+def is_enabled():
+    return settings.PROMETHEUS_METRICS
+
+
+# @ The URL pattern's name ("book-list", "book-comments-detail"), which keeps label cardinality to the route table
+def get_route(request):
+    match = getattr(request, "resolver_match", None)
+    if match is None or not match.view_name:
+        return UNMATCHED_ROUTE
+    return match.view_name
+
+
+def observe_request(request, response, metrics):
+    route = get_route(request)
+    REQUESTS.labels(route, request.method, response.status_code).inc()
+    REQUEST_DURATION.labels(route, request.method).observe(metrics.duration)
+    REQUEST_DB_QUERIES.labels(route).observe(metrics.db_queries)
+    REQUEST_DB_DURATION.labels(route).observe(metrics.db_time)
+
+
+def observe_query(connection, duration):
+    if is_enabled():
+        DB_QUERY_DURATION.labels(connection.alias).observe(duration)
+
+
+def observe_cache_lookup(name, hit):
+    if is_enabled():
+        CACHE_LOOKUPS.labels(name, "hit" if hit else "miss").inc()
+
+
+def observe_pagination_count(namespace, strategy):
+    if is_enabled():
+        PAGINATION_COUNTS.labels(namespace, strategy).inc()
+
+
+def timed_signal_handler(handler):
+    label = f"{handler.__module__.rsplit('.', 1)[-1]}.{handler.__name__}"
+
+    @wraps(handler)
+    def wrapper(*args, **kwargs):
+        if not is_enabled():
+            return handler(*args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return handler(*args, **kwargs)
+        finally:
+            SIGNAL_HANDLER_DURATION.labels(label).observe(time.perf_counter() - started)
+
+    return wrapper
+
+
+def get_registry():
+    if not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def render_metrics():
+    return generate_latest(get_registry())
@@ -0,0 +1,21 @@
+from hmac import compare_digest
+
+from core.instrumentation.prometheus import render_metrics
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.views.decorators.http import require_GET
+from prometheus_client import CONTENT_TYPE_LATEST
+
+
+# @ Plain Django view: a scrape should not go through DRF authentication, negotiation or the response cache.
+# @ Scrapers send PROMETHEUS_METRICS_TOKEN as a bearer token; without one configured, only DEBUG serves it.
+@require_GET
+def metrics_view(request):
+    if not settings.PROMETHEUS_METRICS:
+        raise Http404
+    token = settings.PROMETHEUS_METRICS_TOKEN
+    if not token and not settings.DEBUG:
+        return HttpResponse(status=403)
+    if token and not compare_digest(request.headers.get("Authorization", ""), f"Bearer {token}"):
+        return HttpResponse(status=401, headers={"WWW-Authenticate": "Bearer"})
+    return HttpResponse(render_metrics(), content_type=CONTENT_TYPE_LATEST)
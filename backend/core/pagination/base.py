@@ -1,12 +1,104 @@
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .counts import CountStrategy, StrategyPaginator
+from .cursor import (
+    decode_cursor,
+    encode_cursor,
+    get_keyset_ordering,
+    get_position,
+    order_queryset,
+    seek_filter,
+)
 
 
 class BasePagination(PageNumberPagination):
     page_size_query_param = "page_size"
     max_page_size = 50
 
+    # @ Opt-in keyset mode: "?cursor=" starts at the first row, later cursors come from next/previous
+    cursor_query_param = "cursor"
+
+    # @ Counts are cached per filter set under this version namespace (None disables the strategy)
+    count_cache_namespace = None
+    count_cache_per_user = False
+
+    def django_paginator_class(self, queryset, page_size):
+        return StrategyPaginator(queryset, page_size, count_strategy=self.get_count_strategy())
+
+    def get_count_strategy(self):
+        if self.count_cache_namespace is None:
+            return None
+        return CountStrategy(self.request, self.count_cache_namespace, per_user=self.count_cache_per_user)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_mode = self.cursor_query_param in request.query_params
+        if not self.cursor_mode:
+            return super().paginate_queryset(queryset, request, view)
+        return self.paginate_queryset_by_cursor(queryset, request)
+
+    # @ -------- cursor (keyset) mode --------
+    def paginate_queryset_by_cursor(self, queryset, request):
+        self.request = request
+        page_size = self.get_page_size(request)
+        ordering = get_keyset_ordering(queryset)
+
+        token = request.query_params.get(self.cursor_query_param)
+        position, reverse = decode_cursor(token, queryset, ordering) if token else (None, False)
+
+        queryset = order_queryset(queryset, ordering, reverse=reverse)
+        if position is not None:
+            queryset = queryset.filter(seek_filter(ordering, position, reverse=reverse))
+
+        rows = list(queryset[: page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            rows.reverse()
+
+        self.next_cursor = None
+        self.previous_cursor = None
+        if rows:
+            first, last = get_position(rows[0], ordering), get_position(rows[-1], ordering)
+            # @ Walking backwards always has a next page (the one we came from)
+            if reverse or has_more:
+                self.next_cursor = encode_cursor(last)
+            if (reverse and has_more) or (not reverse and position is not None):
+                self.previous_cursor = encode_cursor(first, reverse=True)
+        elif position is not None:
+            # @ Walked past either end; offer the way back
+            if reverse:
+                self.next_cursor = encode_cursor(position)
+            else:
+                self.previous_cursor = encode_cursor(position, reverse=True)
+
+        return rows
+
+    def get_cursor_link(self, cursor):
+        if cursor is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_cursor_paginated_response(self, data):
+        return Response(
+            {
+                "count": None,
+                "count_is_approximate": False,
+                "pages": None,
+                "page": None,
+                "page_size": self.get_page_size(self.request),
+                "next": self.get_cursor_link(self.next_cursor),
+                "previous": self.get_cursor_link(self.previous_cursor),
+                "results": data,
+            }
+        )
+
     def get_paginated_response(self, data):
+        if self.cursor_mode:
+            return self.get_cursor_paginated_response(data)
+
         previous_link = None
 
         if self.page.has_previous():
@@ -22,6 +114,7 @@ class BasePagination(PageNumberPagination):
         return Response(
             {
                 "count": self.page.paginator.count,
+                "count_is_approximate": self.page.paginator.is_approximate,
                 "pages": self.page.paginator.num_pages,
                 "page": self.page.number,
                 "page_size": self.get_page_size(self.request),
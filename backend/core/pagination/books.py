@@ -3,3 +3,4 @@ from .base import BasePagination
 
 class BookPagination(BasePagination):
     page_size = 10
+    count_cache_namespace = "books"
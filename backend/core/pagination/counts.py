@@ -0,0 +1,143 @@
+import json
+
+from core.cache.keys import NON_FILTER_QUERY_PARAMS, digest, normalize_query_params
+from core.cache.versions import get_version
+from core.instrumentation.metrics import record_cache_lookup
+from core.instrumentation.prometheus import observe_pagination_count
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class CountStrategy:
+    def __init__(self, request, namespace, per_user=False):
+        self.request = request
+        self.namespace = namespace
+        self.per_user = per_user
+        self.is_approximate = False
+
+    def get_scope(self):
+        if self.per_user:
+            return (self.namespace, self.request.user.pk)
+        return (self.namespace,)
+
+    def get_cache_key(self):
+        params = normalize_query_params(self.request.query_params, exclude=NON_FILTER_QUERY_PARAMS)
+        key_digest = digest(self.request.path, params)
+        scope = self.get_scope()
+        return f"pagination-count:{':'.join(map(str, scope))}:{get_version(*scope)}:{key_digest}"
+
+    def count(self, queryset):
+        key = self.get_cache_key()
+        cached = cache.get(key)
+        record_cache_lookup(cached is not None, "pagination-counts")
+        if cached is not None:
+            observe_pagination_count(self.namespace, "cached")
+            self.is_approximate = cached["approximate"]
+            return cached["count"]
+
+        count = self.estimate(queryset)
+        if count is None:
+            count = queryset.count()
+            observe_pagination_count(self.namespace, "exact")
+        else:
+            observe_pagination_count(self.namespace, "estimated")
+            self.is_approximate = True
+
+        cache.set(
+            key,
+            {"count": count, "approximate": self.is_approximate},
+            settings.PAGINATION_COUNT_CACHE_TIMEOUT,
+        )
+        return count
+
+    # @ Planner estimate on PostgreSQL; only trusted above the configured threshold
+    def estimate(self, queryset):
+        threshold = settings.PAGINATION_COUNT_ESTIMATE_THRESHOLD
+        connection = connections[queryset.db]
+        if not threshold or connection.vendor != "postgresql":
+            return None
+
+        if not queryset.query.where:
+            estimate = table_row_estimate(connection, queryset.model._meta.db_table)
+        else:
+            estimate = plan_row_estimate(connection, queryset)
+
+        if estimate is None or estimate < threshold:
+            return None
+        return estimate
+
+
+def table_row_estimate(connection, table):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [table])
+        row = cursor.fetchone()
+    if not row or row[0] < 0:
+        return None
+    return row[0]
+
+
+def plan_row_estimate(connection, queryset):
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class StrategyPage(Page):
+    def __init__(self, object_list, number, paginator, has_next=None):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        if self._has_next is not None:
+            return self._has_next
+        return super().has_next()
+
+
+class StrategyPaginator(Paginator):
+    def __init__(self, object_list, per_page, count_strategy=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_strategy = count_strategy
+
+    @cached_property
+    def count(self):
+        if self.count_strategy is None:
+            return super().count
+        return self.count_strategy.count(self.object_list)
+
+    @property
+    def is_approximate(self):
+        return self.count_strategy is not None and self.count_strategy.is_approximate
+
+    def validate_number(self, number):
+        self.count  # @ resolves whether the count is approximate
+        if not self.is_approximate:
+            return super().validate_number(number)
+
+        # @ An estimate may undercount, so the upper bound is decided by the rows in page()
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.is_approximate:
+            return super().page(number)
+
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages["no_results"])
+        return StrategyPage(rows[: self.per_page], number, self, has_next=len(rows) > self.per_page)
@@ -0,0 +1,97 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import date, datetime
+from decimal import Decimal
+from operator import attrgetter
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+
+INVALID_CURSOR_MESSAGE = "Invalid cursor"
+
+
+# @ Model fields and annotations (e.g. search_rank) both work as keys; their value decides the cursor's type
+def get_ordering_field(queryset, name):
+    annotation = queryset.query.annotations.get(name)
+    if annotation is not None:
+        return annotation.output_field
+    return queryset.model._meta.get_field(name)
+
+
+# @ ordering is a list of (field_name, descending) pairs, always ending with the primary key
+def get_keyset_ordering(queryset):
+    model = queryset.model
+    order_by = list(queryset.query.order_by) or list(model._meta.ordering)
+
+    ordering = []
+    for item in order_by:
+        if not isinstance(item, str):
+            raise NotFound("Cursor pagination does not support this ordering.")
+        descending = item.startswith("-")
+        name = item.lstrip("-")
+        if name == "pk":
+            name = model._meta.pk.name
+        try:
+            get_ordering_field(queryset, name)
+        except FieldDoesNotExist:
+            raise NotFound("Cursor pagination does not support this ordering.")
+        ordering.append((name, descending))
+
+    pk_name = model._meta.pk.name
+    if not any(name == pk_name for name, _ in ordering):
+        descending = ordering[-1][1] if ordering else True
+        ordering.append((pk_name, descending))
+    return ordering
+
+
+def order_queryset(queryset, ordering, reverse=False):
+    return queryset.order_by(*[f"{'-' if descending != reverse else ''}{name}" for name, descending in ordering])
+
+
+def seek_filter(ordering, position, reverse=False):
+    # @ Lexicographic "row comes after position": (a > x) OR (a = x AND b > y) OR ...
+    condition = Q()
+    equal_prefix = Q()
+    for (name, descending), value in zip(ordering, position):
+        lookup = "lt" if descending != reverse else "gt"
+        condition |= equal_prefix & Q(**{f"{name}__{lookup}": value})
+        equal_prefix &= Q(**{name: value})
+    return condition
+
+
+def get_position(instance, ordering):
+    if isinstance(instance, dict):
+        return [instance[name] for name, _ in ordering]
+    return [attrgetter(name)(instance) for name, _ in ordering]
+
+
+def encode_cursor(position, reverse=False):
+    payload = {"p": [_encode_value(value) for value in position]}
+    if reverse:
+        payload["r"] = 1
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token, queryset, ordering):
+    try:
+        raw = urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+        values = payload["p"]
+        reverse = bool(payload.get("r"))
+        if not isinstance(values, list) or len(values) != len(ordering):
+            raise ValueError
+        fields = [get_ordering_field(queryset, name) for name, _ in ordering]
+        position = [field.to_python(value) for field, value in zip(fields, values)]
+    except (TypeError, ValueError, KeyError, ValidationError):
+        raise NotFound(INVALID_CURSOR_MESSAGE)
+    return position, reverse
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
@@ -3,3 +3,5 @@ from .base import BasePagination
 
 class FavoritePagination(BasePagination):
     page_size = 5
+    count_cache_namespace = "favorites"
+    count_cache_per_user = True
@@ -0,0 +1,68 @@
+from contextlib import ContextDecorator
+
+from core.queries.shapes import count_shapes
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryCounter:
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries.append(sql)
+        return execute(sql, params, many, context)
+
+    def __len__(self):
+        return len(self.queries)
+
+
+def describe_queries(queries):
+    lines = []
+    for shape, count in count_shapes(queries).most_common():
+        lines.append(f"  {count}x {shape}")
+    return "\n".join(lines)
+
+
+# @ Fails a block (or a decorated function) that runs more than max_queries statements.
+# @ Counts through execute_wrapper, so it works with DEBUG off and outside the test runner.
+class query_budget(ContextDecorator):
+    def __init__(self, max_queries, using=DEFAULT_DB_ALIAS, label=None):
+        self.max_queries = max_queries
+        self.using = using
+        self.label = label
+
+    # @ A fresh counter per decorated call, so recursion and threads do not share one
+    def _recreate_cm(self):
+        return self.__class__(self.max_queries, using=self.using, label=self.label)
+
+    def __enter__(self):
+        self.counter = QueryCounter()
+        self.wrapper = connections[self.using].execute_wrapper(self.counter)
+        self.wrapper.__enter__()
+        return self.counter
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.wrapper.__exit__(exc_type, exc_value, traceback)
+        if exc_type is None and len(self.counter) > self.max_queries:
+            raise QueryBudgetExceeded(
+                f"{self.label or 'Block'} ran {len(self.counter)} queries, budget is {self.max_queries}:\n"
+                + describe_queries(self.counter.queries)
+            )
+        return False
+
+
+# @ Views declare budgets per action: query_budgets = {"list": 3, "retrieve": 6}
+def get_query_budget(view_class, action):
+    return getattr(view_class, "query_budgets", {}).get(action)
+
+
+# @ The action a resolved view function will run: the viewset action, or the method for plain views
+def get_view_action(view_func, method):
+    actions = getattr(view_func, "actions", None)
+    if actions:
+        return actions.get(method.lower())
+    return method.lower()
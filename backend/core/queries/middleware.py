@@ -0,0 +1,69 @@
+import logging
+from contextlib import ExitStack
+
+from core.queries.budgets import get_query_budget, get_view_action
+from core.queries.shapes import QueryShapeRecorder
+from core.queries.slow import SlowQueryRecorder
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+# @ Development aid: logs statements repeated with the same shape within one request (likely N+1),
+# @ with the project line that issued them, and requests that overrun their view's declared budget
+class QueryInspectionMiddleware:
+    def __init__(self, get_response):
+        if not settings.QUERY_INSPECTION:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        recorder = QueryShapeRecorder()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            response = self.get_response(request)
+
+        for shape, count, call_site in recorder.repeated(settings.QUERY_INSPECTION_REPEAT_THRESHOLD):
+            logger.warning(
+                "Possible N+1 on %s %s: %d queries with the same shape from %s\n  %s",
+                request.method,
+                request.path,
+                count,
+                call_site or "an unknown call site",
+                shape,
+            )
+
+        budget = getattr(request, "query_budget", None)
+        if budget is not None and recorder.count > budget:
+            logger.warning(
+                "%s %s ran %d queries, over its budget of %d", request.method, request.path, recorder.count, budget
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, "cls", None) or getattr(view_func, "view_class", None)
+        if view_class is not None:
+            request.query_budget = get_query_budget(view_class, get_view_action(view_func, request.method))
+
+
+# @ Samples slow statements into the shared ring buffer (core.queries.slow), tagged with the view that ran them
+class SlowQueryLogMiddleware:
+    def __init__(self, get_response):
+        if not settings.SLOW_QUERY_LOG:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.slow_query_recorder = recorder = SlowQueryRecorder(view=f"{request.method} {request.path}")
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            return self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        match = request.resolver_match
+        if match is not None:
+            request.slow_query_recorder.view = f"{request.method} {match.view_name or match.route}"
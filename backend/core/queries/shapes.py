@@ -0,0 +1,60 @@
+import re
+import traceback
+from collections import Counter
+from pathlib import Path
+
+from django.conf import settings
+
+STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+NUMBER_LITERAL = re.compile(r"(?<![\w\"])-?\d+(?:\.\d+)?\b")
+# @ IN lists differ in length per page; "IN (%s, %s, %s)" and "IN (%s)" are the same query
+IN_LIST = re.compile(r"\bIN\s*\((?:\s*\?\s*,)*\s*\?\s*\)", re.IGNORECASE)
+WHITESPACE = re.compile(r"\s+")
+
+QUERIES_PACKAGE = Path(__file__).resolve().parent
+
+
+# @ Two statements share a shape when they differ only in their parameters and literals
+def normalize_sql(sql):
+    shape = sql.replace("%s", "?")
+    shape = STRING_LITERAL.sub("?", shape)
+    shape = NUMBER_LITERAL.sub("?", shape)
+    shape = IN_LIST.sub("IN (...)", shape)
+    return WHITESPACE.sub(" ", shape).strip()
+
+
+def count_shapes(queries):
+    return Counter(normalize_sql(sql) for sql in queries)
+
+
+# @ The innermost project frame that led to the query (skips Django, DRF, installed packages and this package)
+def find_call_site(stack=None):
+    base_dir = Path(settings.BASE_DIR).resolve()
+    for frame in reversed(stack if stack is not None else traceback.extract_stack()):
+        path = Path(frame.filename).resolve()
+        if not path.is_relative_to(base_dir) or path.is_relative_to(QUERIES_PACKAGE):
+            continue
+        if "site-packages" in path.parts or any(part.startswith(".") for part in path.relative_to(base_dir).parts):
+            continue
+        return f"{path.relative_to(base_dir)}:{frame.lineno} in {frame.name}"
+    return None
+
+
+# @ execute_wrapper that groups statements by shape and keeps the first call site of each
+class QueryShapeRecorder:
+    def __init__(self):
+        self.count = 0
+        self.shapes = Counter()
+        self.call_sites = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        if sql.lstrip()[:6].upper() == "SELECT":
+            shape = normalize_sql(sql)
+            self.shapes[shape] += 1
+            if shape not in self.call_sites:
+                self.call_sites[shape] = find_call_site()
+        return execute(sql, params, many, context)
+
+    def repeated(self, threshold):
+        return [(shape, count, self.call_sites[shape]) for shape, count in self.shapes.items() if count >= threshold]
@@ -0,0 +1,129 @@
+import json
+import random
+import threading
+import time
+
+from core.cache.keys import digest
+from core.queries.shapes import find_call_site, normalize_sql
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, transaction
+
+SLOW_QUERY_CURSOR_KEY = "slow-queries:cursor"
+
+# @ Writing a record (or running EXPLAIN) may itself hit the database, e.g. with the database cache backend
+_recording = threading.local()
+
+
+def get_slow_query_key(slot):
+    return f"slow-queries:{slot}"
+
+
+def fingerprint_sql(sql):
+    shape = normalize_sql(sql)
+    return digest(shape)[:16], shape
+
+
+# @ Fixed-size ring in the shared cache: a counter picks the slot, so the newest records overwrite the oldest
+# @ and every process (and manage.py slow_queries) sees the same buffer when the cache is shared
+def push_slow_query(record):
+    size = settings.SLOW_QUERY_BUFFER_SIZE
+    cache.add(SLOW_QUERY_CURSOR_KEY, 0, None)
+    try:
+        position = cache.incr(SLOW_QUERY_CURSOR_KEY)
+    except ValueError:
+        # @ Evicted between add and incr; restart the ring
+        cache.set(SLOW_QUERY_CURSOR_KEY, 1, None)
+        position = 1
+    cache.set(get_slow_query_key(position % size), record, None)
+
+
+def get_slow_queries():
+    keys = [get_slow_query_key(slot) for slot in range(settings.SLOW_QUERY_BUFFER_SIZE)]
+    return sorted(cache.get_many(keys).values(), key=lambda record: record["at"], reverse=True)
+
+
+def clear_slow_queries():
+    cache.delete_many(
+        [SLOW_QUERY_CURSOR_KEY] + [get_slow_query_key(slot) for slot in range(settings.SLOW_QUERY_BUFFER_SIZE)]
+    )
+
+
+# @ One row per fingerprint, worst total time first; the newest captured plan stands in for the group
+def summarize_slow_queries(records, sort="total_ms"):
+    groups = {}
+    for record in sorted(records, key=lambda record: record["at"]):
+        group = groups.setdefault(
+            record["fingerprint"],
+            {"fingerprint": record["fingerprint"], "sql": record["sql"], "count": 0, "total_ms": 0.0, "max_ms": 0.0},
+        )
+        group["count"] += 1
+        group["total_ms"] += record["duration_ms"]
+        group["max_ms"] = max(group["max_ms"], record["duration_ms"])
+        group.setdefault("views", set()).add(record["view"])
+        group["last_seen"] = record["at"]
+        if record.get("plan") is not None:
+            group["plan"] = record["plan"]
+
+    summary = []
+    for group in groups.values():
+        group["mean_ms"] = round(group["total_ms"] / group["count"], 2)
+        group["total_ms"] = round(group["total_ms"], 2)
+        group["views"] = sorted(view for view in group["views"] if view)
+        group.setdefault("plan", None)
+        summary.append(group)
+    return sorted(summary, key=lambda group: group[sort], reverse=True)
+
+
+# @ execute_wrapper: statements at or over SLOW_QUERY_MS are sampled (SLOW_QUERY_SAMPLE_RATE) into the ring,
+# @ and on PostgreSQL a further SLOW_QUERY_EXPLAIN_RATE of those get their EXPLAIN (FORMAT JSON) plan
+class SlowQueryRecorder:
+    def __init__(self, view=None):
+        self.view = view
+        self.threshold = settings.SLOW_QUERY_MS / 1000
+        self.sample_rate = settings.SLOW_QUERY_SAMPLE_RATE
+        self.explain_rate = settings.SLOW_QUERY_EXPLAIN_RATE
+
+    def __call__(self, execute, sql, params, many, context):
+        if getattr(_recording, "active", False):
+            return execute(sql, params, many, context)
+
+        started = time.perf_counter()
+        result = execute(sql, params, many, context)
+        duration = time.perf_counter() - started
+        if duration >= self.threshold and random.random() < self.sample_rate:
+            _recording.active = True
+            try:
+                self.record(sql, params, many, context["connection"], duration)
+            finally:
+                _recording.active = False
+        return result
+
+    def record(self, sql, params, many, connection, duration):
+        fingerprint, shape = fingerprint_sql(sql)
+        push_slow_query(
+            {
+                "fingerprint": fingerprint,
+                "sql": shape,
+                "duration_ms": round(duration * 1000, 2),
+                "view": self.view,
+                "call_site": find_call_site(),
+                "database": connection.alias,
+                "at": time.time(),
+                "plan": self.explain(sql, params, many, connection),
+            }
+        )
+
+    def explain(self, sql, params, many, connection):
+        if connection.vendor != "postgresql" or many or not sql.lstrip()[:6].upper() == "SELECT":
+            return None
+        if random.random() >= self.explain_rate:
+            return None
+        try:
+            # @ A savepoint, so a failed EXPLAIN cannot abort the request's transaction
+            with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                plan = cursor.fetchone()[0]
+        except DatabaseError:
+            return None
+        return json.loads(plan) if isinstance(plan, str) else plan
@@ -0,0 +1,35 @@
+from core.queries.budgets import get_query_budget, query_budget
+from django.core.cache import cache
+from django.utils.http import urlencode
+from rest_framework.test import APIClient
+
+
+# @ For TestCase subclasses: requests an endpoint with a cold cache at several page sizes and fails
+# @ when any run overshoots the view's declared budget or the count changes with the page size
+class QueryBudgetTestMixin:
+    def assertWithinQueryBudget(
+        self, view_class, action, path, params=None, page_sizes=(), user=None, method="get", data=None
+    ):
+        budget = get_query_budget(view_class, action)
+        self.assertIsNotNone(budget, f"{view_class.__name__} declares no query budget for {action!r}")
+
+        client = APIClient()
+        if user is not None:
+            client.force_authenticate(user)
+
+        counts = {}
+        for page_size in page_sizes or [None]:
+            query = dict(params or {})
+            if page_size is not None:
+                query["page_size"] = page_size
+            cache.clear()
+            with query_budget(budget, label=f"{view_class.__name__}.{action} {path} {query}") as counter:
+                if method == "get":
+                    response = client.get(path, query)
+                else:
+                    response = getattr(client, method)(path, data, format="json", QUERY_STRING=urlencode(query))
+            self.assertLess(response.status_code, 400, response.content)
+            counts[page_size] = len(counter)
+
+        self.assertEqual(len(set(counts.values())), 1, f"Query count grows with the page size: {counts}")
+        return counts.popitem()[1]
@@ -0,0 +1,35 @@
+from core.queries.slow import clear_slow_queries, get_slow_queries, summarize_slow_queries
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+SLOW_QUERY_SORT_FIELDS = ("total_ms", "max_ms", "mean_ms", "count")
+
+
+# @ Staff-only view of the slow-query ring buffer: fingerprints aggregated, plus the most recent records
+class SlowQueryView(APIView):
+    permission_classes = [IsAdminUser]
+    default_limit = 50
+
+    def get(self, request):
+        sort = request.query_params.get("sort", "total_ms")
+        if sort not in SLOW_QUERY_SORT_FIELDS:
+            sort = "total_ms"
+        try:
+            limit = max(int(request.query_params.get("limit", self.default_limit)), 1)
+        except ValueError:
+            limit = self.default_limit
+
+        records = get_slow_queries()
+        return Response(
+            {
+                "count": len(records),
+                "fingerprints": summarize_slow_queries(records, sort)[:limit],
+                "recent": records[:limit],
+            }
+        )
+
+    def delete(self, request):
+        clear_slow_queries()
+        return Response(status=status.HTTP_204_NO_CONTENT)
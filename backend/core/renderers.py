@@ -0,0 +1,90 @@
+import datetime
+import decimal
+import uuid
+
+import orjson
+from django.db.models.query import QuerySet
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+try:
+    import msgpack
+except ImportError:  # @ MessagePack is optional (pip install msgpack)
+    msgpack = None
+
+
+# @ Same conversions as rest_framework.utils.encoders.JSONEncoder for types orjson doesn't handle natively,
+# @ so switching renderers never changes a payload.
+def encode_default(obj):
+    if isinstance(obj, Promise):
+        return force_str(obj)
+    if isinstance(obj, decimal.Decimal):
+        # @ Serializers coerce decimals to strings by default; bare Decimals render as numbers
+        return float(obj)
+    if isinstance(obj, datetime.timedelta):
+        return str(obj.total_seconds())
+    if isinstance(obj, QuerySet):
+        return list(obj)
+    if isinstance(obj, bytes):
+        return obj.decode()
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    if hasattr(obj, "__getitem__"):
+        return list(obj) if isinstance(obj, (list, tuple)) else dict(obj)
+    if hasattr(obj, "__iter__"):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# @ msgpack has no datetime/UUID strings of its own; mirror the JSON representation
+def encode_msgpack_default(obj):
+    if isinstance(obj, datetime.datetime):
+        representation = obj.isoformat()
+        return representation[:-6] + "Z" if representation.endswith("+00:00") else representation
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    return encode_default(obj)
+
+
+def dumps(data, options=0):
+    ret = orjson.dumps(data, default=encode_default, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS | options)
+    # @ Like JSONRenderer: keep U+2028/U+2029 escaped so the output is also valid JavaScript
+    return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+
+class ORJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        # @ orjson only indents by two spaces; any requested indent gets that
+        if self.get_indent(accepted_media_type or "", renderer_context or {}):
+            return dumps(data, orjson.OPT_INDENT_2)
+        return dumps(data)
+
+
+# @ One JSON document per line; streaming endpoints write their own lines, errors render as a single line
+class NDJSONRenderer(BaseRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return dumps(data) + b"\n"
+
+
+class MessagePackRenderer(BaseRenderer):
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=encode_msgpack_default, use_bin_type=True, datetime=False)
@@ -0,0 +1,20 @@
+import os
+import shutil
+
+# @ prometheus_client chooses its multiprocess (mmapped file) storage at import time, so the directory is exported
+# @ here, in the master, before any worker imports the app
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus-multiproc")
+
+from prometheus_client import multiprocess  # noqa: E402
+
+
+# @ Files left by a previous run would be merged into this one's counters
+def on_starting(server):
+    directory = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory)
+
+
+# @ Drops the dead worker's in-flight gauge; its counters and histograms keep counting towards the totals
+def child_exit(server, worker):
+    multiprocess.mark_process_dead(worker.pid)